@@ -19,6 +19,7 @@ This software is licensed under the MIT License.
 See LICENSE file for details.
 """
 
+import multiprocessing
 import os
 import sys
 from pathlib import Path
@@ -27,13 +28,15 @@ from pathlib import Path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.gui import ControlPanel  # type: ignore  # noqa: E402
-
 DB_PATH = os.environ.get("TICK_DB_PATH", "data/tick_data.db")
 
 
 def main():
     try:
+        # GUIはここで読み込む（スクリーニングのワーカープロセスがこのモジュールを
+        # __mp_main__として読み込む際に、tkinterやmatplotlibを読み込まないようにするため）
+        from src.gui import ControlPanel  # type: ignore
+        
         # データディレクトリを作成（データベースファイルの自動作成を確実にするため）
         # exist_ok=Trueにより、既に存在する場合は何もしない（既存データを保護）
         Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
@@ -56,4 +59,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstallerでビルドした実行ファイルで、spawnしたワーカープロセスがアプリを再起動しないようにする
+    multiprocessing.freeze_support()
     main()
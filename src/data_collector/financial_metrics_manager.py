@@ -17,6 +17,8 @@ import time
 import random
 import yfinance as yf
 
+from src.utils.db import iter_symbol_chunks
+
 
 class FinancialMetricsManager:
     """財務指標管理クラス"""
@@ -380,24 +382,24 @@ class FinancialMetricsManager:
         
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            placeholders = ','.join(['?'] * len(symbols))
-            cursor.execute(f'''
-                SELECT symbol, per, pbr, dividend_yield, roe, roa, profit_margin
-                FROM symbols
-                WHERE symbol IN ({placeholders})
-            ''', symbols)
-            
-            rows = cursor.fetchall()
             result = {}
-            for row in rows:
-                result[row[0]] = {
-                    'per': row[1],
-                    'pbr': row[2],
-                    'dividend_yield': row[3],
-                    'roe': row[4],
-                    'roa': row[5],
-                    'profit_margin': row[6]
-                }
+            for chunk in iter_symbol_chunks(symbols):
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor.execute(f'''
+                    SELECT symbol, per, pbr, dividend_yield, roe, roa, profit_margin
+                    FROM symbols
+                    WHERE symbol IN ({placeholders})
+                ''', chunk)
+                
+                for row in cursor.fetchall():
+                    result[row[0]] = {
+                        'per': row[1],
+                        'pbr': row[2],
+                        'dividend_yield': row[3],
+                        'roe': row[4],
+                        'roa': row[5],
+                        'profit_margin': row[6]
+                    }
             
             return result
     
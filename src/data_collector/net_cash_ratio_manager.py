@@ -22,6 +22,8 @@ import json
 import yfinance as yf
 import pandas as pd
 
+from src.utils.db import iter_symbol_chunks
+
 
 class NetCashRatioManager:
     """ネットキャッシュ比率管理クラス"""
@@ -808,17 +810,17 @@ class NetCashRatioManager:
         
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            placeholders = ','.join(['?'] * len(symbols))
-            cursor.execute(f'''
-                SELECT symbol, net_cash_ratio
-                FROM symbols
-                WHERE symbol IN ({placeholders})
-            ''', symbols)
-            
-            rows = cursor.fetchall()
             result = {}
-            for row in rows:
-                result[row[0]] = float(row[1]) if row[1] is not None else None
+            for chunk in iter_symbol_chunks(symbols):
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor.execute(f'''
+                    SELECT symbol, net_cash_ratio
+                    FROM symbols
+                    WHERE symbol IN ({placeholders})
+                ''', chunk)
+                
+                for row in cursor.fetchall():
+                    result[row[0]] = float(row[1]) if row[1] is not None else None
             
             return result
 
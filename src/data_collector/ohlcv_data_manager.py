@@ -15,6 +15,8 @@ from datetime import datetime
 from typing import Optional, List, Dict, Callable
 import os
 
+from src.utils.db import iter_symbol_chunks
+
 
 class OHLCVDataManager:
     """OHLCVデータ管理クラス（共通機能）"""
@@ -1001,6 +1003,144 @@ class OHLCVDataManager:
                 'last_updated_at': row[3] if row and len(row) > 3 else None
             }
     
+    def get_data_stats_batch(
+        self,
+        symbols: List[str],
+        timeframe: str = "1s",
+        source: Optional[str] = None
+    ) -> Dict[str, dict]:
+        """
+        複数銘柄のデータ統計を一括取得（get_data_statsを1回のクエリで実行）
+        
+        Args:
+            symbols: 銘柄コードのリスト
+            timeframe: 時間足
+            source: データソース（Noneの場合は全ソース）
+        
+        Returns:
+            Dict[str, dict]: 銘柄コードをキー、統計情報（get_data_statsと同じ形式）を値とする辞書
+                データがない銘柄は件数0・日付None
+        """
+        if not symbols:
+            return {}
+        
+        result = {
+            symbol: {
+                'total_count': 0,
+                'start_date': None,
+                'end_date': None,
+                'last_updated_at': None
+            }
+            for symbol in symbols
+        }
+        
+        # 最新データの更新日時はサブクエリで取得（get_data_statsと同じ条件）
+        subquery_source = ' AND o2.source = ?' if source else ''
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            # 銘柄を分割して集計する（集計は銘柄ごとなので、分割しても結果は変わらない）
+            for chunk in iter_symbol_chunks(symbols):
+                placeholders = ','.join(['?'] * len(chunk))
+                query = f'''
+                    SELECT 
+                        symbol,
+                        COUNT(*) as total_count,
+                        MIN(datetime) as start_date,
+                        MAX(datetime) as end_date,
+                        (SELECT updated_at FROM ohlcv_data o2
+                         WHERE o2.symbol = ohlcv_data.symbol AND o2.timeframe = ?{subquery_source}
+                         ORDER BY o2.datetime DESC, o2.updated_at DESC LIMIT 1) as last_updated_at
+                    FROM ohlcv_data
+                    WHERE symbol IN ({placeholders}) AND timeframe = ?
+                '''
+                params = [timeframe] + ([source] if source else []) + chunk + [timeframe]
+                
+                if source:
+                    query += ' AND source = ?'
+                    params.append(source)
+                
+                query += ' GROUP BY symbol'
+                
+                cursor.execute(query, params)
+                for row in cursor.fetchall():
+                    result[row[0]] = {
+                        'total_count': row[1],
+                        'start_date': row[2],
+                        'end_date': row[3],
+                        'last_updated_at': row[4]
+                    }
+        
+        return result
+    
+    def get_latest_ohlcv_batch(
+        self,
+        symbols: List[str],
+        timeframe: str = "1d",
+        source: Optional[str] = None,
+        window: int = 20
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        複数銘柄の直近window件のOHLCVデータを一括取得（仮終値データを含む）
+        
+        Args:
+            symbols: 銘柄コードのリスト
+            timeframe: 時間足
+            source: データソース（Noneの場合は全ソース）
+            window: 銘柄ごとに取得する件数（新しい順）
+        
+        Returns:
+            Dict[str, pd.DataFrame]: 銘柄コードをキー、OHLCVデータ（インデックスがdatetime、
+                古い順、is_temporary_close列を含む）を値とする辞書。データがない銘柄は含まない
+        """
+        if not symbols:
+            return {}
+        
+        # 銘柄を分割して取得する（連番は銘柄ごとに振るため、分割しても結果は変わらない）
+        frames = []
+        with sqlite3.connect(self.db_path) as conn:
+            for chunk in iter_symbol_chunks(symbols):
+                placeholders = ','.join(['?'] * len(chunk))
+                where = f'symbol IN ({placeholders}) AND timeframe = ?'
+                params = chunk + [timeframe]
+                
+                if source:
+                    where += ' AND source = ?'
+                    params.append(source)
+                
+                # 銘柄ごとに新しい順の連番を振り、直近window件だけを取得
+                query = f'''
+                    SELECT symbol, datetime, open, high, low, close, volume, is_temporary_close
+                    FROM (
+                        SELECT symbol, datetime, open, high, low, close, volume, is_temporary_close,
+                               ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY datetime DESC) as rn
+                        FROM ohlcv_data
+                        WHERE {where}
+                    )
+                    WHERE rn <= ?
+                '''
+                params.append(window)
+                
+                frames.append(pd.read_sql_query(query, conn, params=params))
+        
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        if df.empty:
+            return {}
+        
+        # datetimeをインデックスに設定（get_ohlcv_data_with_temporary_flagと同じ正規化）
+        df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce', utc=True)
+        df = df.dropna(subset=['datetime', 'open', 'high', 'low', 'close', 'volume'])
+        if df.empty:
+            return {}
+        df['datetime'] = df['datetime'].dt.tz_localize(None)
+        df['is_temporary_close'] = df['is_temporary_close'].fillna(0).astype(int)
+        
+        result = {}
+        for symbol, symbol_df in df.groupby('symbol', sort=False):
+            symbol_df = symbol_df.drop(columns='symbol').set_index('datetime').sort_index()
+            result[symbol] = symbol_df[~symbol_df.index.duplicated(keep='first')]
+        
+        return result
+    
     def get_all_symbols(
         self,
         timeframe: Optional[str] = None,
@@ -1126,6 +1266,14 @@ class OHLCVDataManager:
         """複数のセクター情報を一括取得（SymbolNameManagerに委譲）"""
         return self._symbol_name_manager.get_symbol_sectors(symbols)
     
+    def get_symbol_metadata_batch(self, symbols: List[str]) -> Dict[str, dict]:
+        """複数銘柄の銘柄名・セクター・業種・財務指標を一括取得（SymbolNameManagerに委譲）"""
+        return self._symbol_name_manager.get_symbol_metadata_batch(symbols)
+    
+    def get_symbols_by_sector(self, sector: str, symbols: Optional[List[str]] = None) -> List[str]:
+        """指定したセクターに属する銘柄を取得（SymbolNameManagerに委譲）"""
+        return self._symbol_name_manager.get_symbols_by_sector(sector, symbols)
+    
     def get_symbol_industry(self, symbol: str) -> Optional[str]:
         """業種情報を取得（SymbolNameManagerに委譲）"""
         return self._symbol_name_manager.get_symbol_industry(symbol)
@@ -14,6 +14,8 @@ from typing import Optional, List, Dict, Callable
 import os
 import re
 
+from src.utils.db import iter_symbol_chunks
+
 
 # セクター名の英語→日本語変換辞書
 SECTOR_NAME_JP = {
@@ -354,6 +356,80 @@ class SymbolNameManager:
             rows = cursor.fetchall()
             return {row[0]: row[1] for row in rows if row[1]}
     
+    def get_symbol_metadata_batch(self, symbols: List[str]) -> Dict[str, dict]:
+        """
+        複数銘柄の銘柄名・セクター・業種・財務指標を1回のクエリで一括取得
+        
+        get_symbol_names・get_symbol_sectors・get_symbol_industriesと
+        FinancialMetricsManager.get_financial_metrics_batchをまとめたもの（いずれもsymbolsテーブルの列）。
+        財務指標の列がまだない（財務指標を取得したことがない）DBでは財務指標をNoneとして返します。
+        
+        Args:
+            symbols: 銘柄コードのリスト
+            
+        Returns:
+            Dict[str, dict]: 銘柄コードをキー、以下のキーを持つ辞書を値とする辞書（symbolsテーブルにない銘柄は含まない）
+                - name, sector, industry: 銘柄名・セクター・業種（未取得の場合はNone）
+                - per, pbr, dividend_yield, roe, roa: 財務指標（未取得の場合はNone）
+        """
+        if not symbols:
+            return {}
+        
+        metadata_columns = ['name', 'sector', 'industry', 'per', 'pbr', 'dividend_yield', 'roe', 'roa']
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('PRAGMA table_info(symbols)')
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            select_columns = ', '.join(
+                column if column in existing_columns else f'NULL AS {column}'
+                for column in metadata_columns
+            )
+            
+            result = {}
+            for chunk in iter_symbol_chunks(symbols):
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor.execute(
+                    f'SELECT symbol, {select_columns} FROM symbols WHERE symbol IN ({placeholders})',
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    result[row[0]] = {
+                        column: value if value != '' else None
+                        for column, value in zip(metadata_columns, row[1:])
+                    }
+            return result
+    
+    def get_symbols_by_sector(self, sector: str, symbols: Optional[List[str]] = None) -> List[str]:
+        """
+        指定したセクターに属する銘柄を取得（絞り込みはSQL側で実行）
+        
+        Args:
+            sector: セクター
+            symbols: 対象とする銘柄コードのリスト（Noneの場合は全銘柄、指定した場合はこの順序で返す）
+            
+        Returns:
+            List[str]: セクターに属する銘柄コードのリスト
+        """
+        if symbols is not None and not symbols:
+            return []
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if symbols is None:
+                cursor.execute('SELECT symbol FROM symbols WHERE sector = ? ORDER BY symbol', (sector,))
+                return [row[0] for row in cursor.fetchall()]
+            
+            # 銘柄を分割して取得し、返す順序は最後にsymbolsの順に揃える
+            matched = set()
+            for chunk in iter_symbol_chunks(symbols):
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor.execute(
+                    f'SELECT symbol FROM symbols WHERE sector = ? AND symbol IN ({placeholders})',
+                    [sector] + chunk
+                )
+                matched.update(row[0] for row in cursor.fetchall())
+            return [symbol for symbol in symbols if symbol in matched]
+    
     def get_symbol_industry(self, symbol: str) -> Optional[str]:
         """
         業種情報を取得
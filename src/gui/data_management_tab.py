@@ -15,6 +15,7 @@ from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 from typing import List, Dict, Optional, Callable
 import sqlite3
+import numpy as np
 import pandas as pd
 import webbrowser
 
@@ -470,6 +471,7 @@ class DataManagementTab:
             try:
                 from src.data_collector.ohlcv_data_manager import OHLCVDataManager
                 from collections import defaultdict
+                from src.utils.indicators import latest_volume_sigmas
                 
                 print("[DB銘柄一覧] 銘柄一覧の取得を開始します...")
                 self.status_var.set("状態: 銘柄一覧取得中...")
@@ -520,16 +522,15 @@ class DataManagementTab:
                 print(f"[DB銘柄一覧] 集計完了: {len(symbol_stats)}銘柄")
                 
                 print("[DB銘柄一覧] 最新出来高と現在株価、σ値を取得中...")
+                # σ値の計算に使う直近20日分だけを全銘柄まとめて取得
+                latest_ohlcv_dict = ohlcv_manager.get_latest_ohlcv_batch(
+                    list(symbol_stats.keys()), timeframe='1d', source='yahoo', window=20
+                )
                 # 最新データを取得して更新
                 for symbol in symbol_stats.keys():
                     try:
-                        df_latest = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                            symbol=symbol,
-                            timeframe='1d',
-                            source='yahoo',
-                            include_temporary=True
-                        )
-                        if not df_latest.empty:
+                        df_latest = latest_ohlcv_dict.get(symbol)
+                        if df_latest is not None:
                             latest_row = df_latest.iloc[-1]
                             symbol_stats[symbol]['latest_price'] = float(latest_row['close'])
                             symbol_stats[symbol]['latest_volume'] = int(latest_row['volume']) if pd.notna(latest_row['volume']) else None
@@ -539,19 +540,23 @@ class DataManagementTab:
                                 symbol_stats[symbol]['latest_is_temporary_close'] = bool(int(is_temp_flag))
                             except (TypeError, ValueError):
                                 symbol_stats[symbol]['latest_is_temporary_close'] = None
-                            
-                            # σ値計算（過去20日の出来高から）
-                            if len(df_latest) >= 5 and symbol_stats[symbol]['latest_volume'] is not None:
-                                volumes = df_latest['volume'].tail(20)
-                                if len(volumes) >= 5:
-                                    mean_volume = volumes.mean()
-                                    std_volume = volumes.std()
-                                    if std_volume > 0:
-                                        sigma_value = (symbol_stats[symbol]['latest_volume'] - mean_volume) / std_volume
-                                        symbol_stats[symbol]['sigma_value'] = float(sigma_value)
                     except Exception as e:
                         print(f"[DB銘柄一覧] {symbol}の最新データ取得エラー: {e}")
                 
+                # σ値計算（過去20日の出来高から全銘柄まとめて計算）
+                stats_symbols = list(symbol_stats.keys())
+                sigma_values = latest_volume_sigmas(
+                    [
+                        latest_ohlcv_dict[symbol]['volume'].to_numpy(dtype=float)
+                        if symbol in latest_ohlcv_dict else np.empty(0)
+                        for symbol in stats_symbols
+                    ],
+                    [symbol_stats[symbol]['latest_volume'] for symbol in stats_symbols]
+                )
+                for symbol, sigma_value in zip(stats_symbols, sigma_values.tolist()):
+                    if not np.isnan(sigma_value):
+                        symbol_stats[symbol]['sigma_value'] = sigma_value
+                
                 print("[DB銘柄一覧] 銘柄名を取得中...")
                 symbol_names = ohlcv_manager.get_symbol_names(list(symbol_stats.keys()))
                 print(f"[DB銘柄一覧] 銘柄名取得完了: {len(symbol_names)}件")
@@ -9,25 +9,378 @@ This software is licensed under the MIT License.
 See LICENSE file for details.
 """
 
+import os
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Tuple
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
 import numpy as np
+import pandas as pd
 import warnings
 import webbrowser
 
-# 日本語フォント設定（モジュール読み込み時に設定）
-plt.rcParams['font.sans-serif'] = ['MS Gothic', 'Yu Gothic', 'Meiryo', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
-# フォント警告を抑制
-warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
+from src.data_collector.ohlcv_data_manager import OHLCVDataManager
+from src.utils.indicators import latest_volume_sigmas, latest_rsis
+
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.figure import Figure
+
+# matplotlib・チャートウィンドウはタブ起動時には読み込まず、初回のグラフ表示時に読み込む
+plt = None
+mdates = None
+Figure = None
+FigureCanvasTkAgg = None
+NavigationToolbar2Tk = None
+LineCollection = None
+PolyCollection = None
+Line2D = None
+ChartWindow = None
+
+# 日付軸の目盛り（毎月1日・"YYYY-MM"表示）と系列の色（tab10の11色）
+# グラフは同時に1つのAxesにしか表示しないため、再描画ごとに作り直さず共有する
+_MONTH_LOCATOR = None
+_MONTH_FORMATTER = None
+_TAB10_COLORS = None
+
+# DB問い合わせを並行実行するスレッドプール（初回使用時に作成し、分析・銘柄一覧の読み込みで共有）
+# 各マネージャーは呼び出しごとにDB接続を開くため、スレッド間で接続を共有しない
+_QUERY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _load_matplotlib():
+    """matplotlib関連モジュールを読み込み、日本語フォント・警告抑制を設定（初回のみ）"""
+    global plt, mdates, Figure, FigureCanvasTkAgg, NavigationToolbar2Tk, LineCollection, PolyCollection, Line2D
+    global _MONTH_LOCATOR, _MONTH_FORMATTER, _TAB10_COLORS
+    if plt is not None:
+        return
+    import matplotlib.pyplot as _plt
+    import matplotlib.dates as _mdates
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib.collections import LineCollection as _LineCollection, PolyCollection as _PolyCollection
+    from matplotlib.lines import Line2D as _Line2D
+    from matplotlib.backends.backend_tkagg import (
+        FigureCanvasTkAgg as _FigureCanvasTkAgg,
+        NavigationToolbar2Tk as _NavigationToolbar2Tk,
+    )
+    
+    # 日本語フォント設定
+    _plt.rcParams['font.sans-serif'] = ['MS Gothic', 'Yu Gothic', 'Meiryo', 'DejaVu Sans']
+    _plt.rcParams['axes.unicode_minus'] = False
+    # フォント警告を抑制
+    warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
+    
+    mdates = _mdates
+    Figure = _Figure
+    FigureCanvasTkAgg = _FigureCanvasTkAgg
+    NavigationToolbar2Tk = _NavigationToolbar2Tk
+    LineCollection = _LineCollection
+    PolyCollection = _PolyCollection
+    Line2D = _Line2D
+    _MONTH_LOCATOR = _mdates.MonthLocator(bymonthday=1)
+    _MONTH_FORMATTER = _mdates.DateFormatter('%Y-%m')
+    _TAB10_COLORS = _plt.cm.tab10(range(11))
+    plt = _plt
+
+
+# セクター資金流動グラフを画像として保存するときの解像度
+_CHART_SAVE_DPI = 200
+
+
+def _get_query_executor() -> ThreadPoolExecutor:
+    """DB問い合わせ用の共有スレッドプールを取得（初回のみ作成）"""
+    global _QUERY_EXECUTOR
+    if _QUERY_EXECUTOR is None:
+        _QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix="market_conditions_query")
+    return _QUERY_EXECUTOR
+
+
+def _get_chart_window_class():
+    """ChartWindowクラスを取得（初回のみインポート）"""
+    global ChartWindow
+    if ChartWindow is None:
+        from src.gui.chart_window import ChartWindow as _ChartWindow
+        ChartWindow = _ChartWindow
+    return ChartWindow
+
+# 日時文字列の "T" 区切りを空白に置き換える変換テーブル
+_T_TO_SPACE = str.maketrans('T', ' ')
+
+# セクター・業種別の平均財務指標の列
+_AVG_METRIC_COLUMNS = (
+    'avg_per', 'avg_pbr', 'avg_dividend_yield', 'avg_roa', 'avg_roe', 'avg_net_cash_ratio'
+)
+
+# 平均財務指標の表示フォーマット（Treeviewの列順、np.char.mod用の%書式）
+_AVG_METRIC_FORMATS = (
+    ('avg_per', '%.1f'),
+    ('avg_pbr', '%.2f'),
+    ('avg_dividend_yield', '%.2f%%'),
+    ('avg_roa', '%.2f%%'),
+    ('avg_roe', '%.2f%%'),
+    ('avg_net_cash_ratio', '%.4f'),
+)
+
+# セクター別銘柄一覧ウィンドウで使用する統計DataFrameの列・財務指標のキー
+_SYMBOL_STATS_COLUMNS = (
+    'data_count', 'first_date', 'last_date', 'last_updated_at',
+    'latest_price', 'latest_volume', 'sigma_value', 'rsi'
+)
+_SYMBOL_METRICS_COLUMNS = ('per', 'pbr', 'dividend_yield', 'roa', 'roe')
+
+# セクター別銘柄一覧ウィンドウの列
+_SECTOR_SYMBOL_COLUMNS = (
+    "銘柄コード", "銘柄名", "セクター", "業種", "PER", "PBR", "利回り", "ROA", "ROE", "NC比率", "RSI",
+    "データ件数", "最初の日付", "最後の日付", "現在株価", "最新出来高", "σ値"
+)
+
+
+def _top_n_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    値の大きい順に上位n件の位置を取得
+    
+    全体を並べ替えずにnp.argpartitionで上位n件を選び、その中だけを降順に並べます（欠損値は最後）。
+    """
+    values = np.where(np.isnan(values), -np.inf, values)
+    if len(values) > n:
+        positions = np.argpartition(-values, n)[:n]
+    else:
+        positions = np.arange(len(values))
+    return positions[np.argsort(-values[positions], kind='stable')]
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets法で間引き後に残す点の位置を取得
+    
+    先頭・末尾の点を残し、間をthreshold-2個の区間に分けて、前に選んだ点と次の区間の平均点との
+    三角形の面積が最大になる点を各区間から1点ずつ選びます（等間隔の間引きと違い山・谷が残る）。
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+    return indices
+
+
+def _rolling_mean(df: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    列ごとの移動平均（df.rolling(window, min_periods=1).mean()と同じ結果）
+    
+    全列をまとめた1つの配列の累積和の差から区間の合計と件数を求めます（欠損値は除外）。
+    """
+    values = df.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    zero_row = np.zeros((1, values.shape[1]))
+    sums = np.concatenate([zero_row, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.concatenate([zero_row, np.cumsum(valid, axis=0)])
+    
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    window_counts = counts[ends] - counts[starts]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(window_counts > 0, (sums[ends] - sums[starts]) / window_counts, np.nan)
+    return pd.DataFrame(means, index=df.index, columns=df.columns)
+
+
+def _moving_average_title(ma_period: int, is_per_stock: bool) -> str:
+    """移動平均グラフのタイトル"""
+    if is_per_stock:
+        return f"セクター別1銘柄あたり売買代金推移（{ma_period}日移動平均）"
+    return f"セクター別売買代金推移（{ma_period}日移動平均）"
+
+
+def _sector_line_segments(df_plot: pd.DataFrame) -> np.ndarray:
+    """各セクターの線の頂点配列を作成（形状: (セクター数, 日数, 2)、xはmatplotlibの日付数値）"""
+    xs = mdates.date2num(df_plot.index.to_numpy())
+    ys = df_plot.to_numpy(dtype=np.float64).T
+    return np.stack([np.broadcast_to(xs, ys.shape), ys], axis=-1)
+
+
+def _add_sector_lines(
+    ax,
+    df_plot: pd.DataFrame,
+    linewidth: float,
+    markersize: float = 0,
+    color=None,
+    alpha: Optional[float] = None
+) -> Dict[str, object]:
+    """
+    セクターごとの線をLineCollection 1つ（マーカーはscatter 1つ）にまとめて描画
+    
+    Args:
+        ax: 描画先のAxes
+        df_plot: 日付をインデックス、セクターを列とするデータ
+        linewidth: 線の太さ
+        markersize: マーカーの直径（0の場合はマーカーなし）
+        color: 全セクター共通の色（Noneの場合はセクターごとにtab10の色）
+        alpha: 透明度
+    
+    Returns:
+        Dict[str, object]: 'columns'（セクター名）, 'lines'（LineCollection）,
+            'markers'（PathCollection、マーカーなしの場合None）, 'handles'（凡例用の線）
+    """
+    segments = _sector_line_segments(df_plot)
+    colors = _TAB10_COLORS[:len(df_plot.columns)] if color is None else [color] * len(df_plot.columns)
+    
+    lines = LineCollection(segments, colors=colors, linewidths=linewidth, alpha=alpha)
+    ax.add_collection(lines)
+    
+    markers = None
+    if markersize:
+        markers = ax.scatter(
+            segments[..., 0].ravel(), segments[..., 1].ravel(),
+            s=markersize ** 2,
+            c=color if color is not None else np.repeat(colors, segments.shape[1], axis=0),
+            marker='o', alpha=alpha, zorder=lines.get_zorder()
+        )
+    
+    ax.xaxis_date()
+    ax.autoscale_view()
+    
+    handles = [
+        Line2D([], [], color=c, linewidth=linewidth, marker='o' if markersize else None,
+               markersize=markersize, label=sector)
+        for c, sector in zip(colors, df_plot.columns)
+    ]
+    return {'columns': list(df_plot.columns), 'lines': lines, 'markers': markers, 'handles': handles}
+
+
+def _update_sector_lines(sector_lines: Dict[str, object], df_plot: pd.DataFrame) -> np.ndarray:
+    """
+    _add_sector_linesで描画した線・マーカーのデータを差し替え（セクター数は描画時と同じであること）
+    
+    Returns:
+        np.ndarray: 差し替えた線の座標（(セクター数, 日数, 2) の配列）
+    """
+    segments = _sector_line_segments(df_plot)
+    sector_lines['lines'].set_segments(segments)
+    if sector_lines['markers'] is not None:
+        sector_lines['markers'].set_offsets(segments.reshape(-1, 2))
+    
+    columns = list(df_plot.columns)
+    if columns != sector_lines['columns']:
+        for handle, sector in zip(sector_lines['handles'], columns):
+            handle.set_label(sector)
+        sector_lines['columns'] = columns
+    return segments
+
+
+def _build_symbol_stats_frame(
+    stats_dict: Dict[str, dict], symbols: List[str], latest_ohlcv_dict: Dict[str, pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    データ統計と直近のOHLCVから銘柄一覧用の統計DataFrameを作成
+    
+    銘柄コードをインデックスとし、列ごとに型を揃えて保持します（銘柄ごとの辞書は作らない）。
+    現在株価・最新出来高・σ値・RSIは銘柄ごとの終値・出来高を配列として取り出し、全銘柄まとめて計算します。
+    直近のOHLCVがない銘柄は欠損値になります。
+    """
+    index = pd.Index([symbol for symbol in symbols if symbol in stats_dict], name='symbol')
+    stats_list = [stats_dict[symbol] for symbol in index]
+    frame = pd.DataFrame({
+        'data_count': pd.Series([stats.get('total_count', 0) for stats in stats_list], index=index, dtype='int64'),
+        'first_date': pd.Series([stats.get('start_date') for stats in stats_list], index=index, dtype=object),
+        'last_date': pd.Series([stats.get('end_date') for stats in stats_list], index=index, dtype=object),
+        'last_updated_at': pd.Series([stats.get('last_updated_at') for stats in stats_list], index=index, dtype=object),
+        'latest_price': pd.Series(np.nan, index=index, dtype='float64'),
+        'latest_volume': pd.Series(pd.NA, index=index, dtype='Int64'),
+        'sigma_value': pd.Series(np.nan, index=index, dtype='float64'),
+        'rsi': pd.Series(np.nan, index=index, dtype='float64'),
+    }, columns=_SYMBOL_STATS_COLUMNS)
+    
+    latest_symbols = [symbol for symbol in index if symbol in latest_ohlcv_dict]
+    if not latest_symbols:
+        return frame
+    
+    volume_windows = [
+        latest_ohlcv_dict[symbol]['volume'].to_numpy(dtype=np.float64) for symbol in latest_symbols
+    ]
+    close_windows = [
+        latest_ohlcv_dict[symbol]['close'].to_numpy(dtype=np.float64) for symbol in latest_symbols
+    ]
+    frame.loc[latest_symbols, 'latest_price'] = np.array([closes[-1] for closes in close_windows])
+    frame.loc[latest_symbols, 'latest_volume'] = np.array(
+        [volumes[-1] for volumes in volume_windows]
+    ).astype(np.int64)
+    frame.loc[latest_symbols, 'sigma_value'] = latest_volume_sigmas(volume_windows)
+    frame.loc[latest_symbols, 'rsi'] = latest_rsis(close_windows)
+    return frame
+
+
+def _merge_metrics(count_df: pd.DataFrame, metrics_df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """銘柄数のDataFrameに平均財務指標を左結合（指標がない場合も全列を揃える）"""
+    if metrics_df.empty:
+        return count_df.reindex(columns=[*count_df.columns, *_AVG_METRIC_COLUMNS])
+    metrics_df = metrics_df.reindex(columns=[*keys, *_AVG_METRIC_COLUMNS])
+    return count_df.merge(metrics_df, on=keys, how='left')
+
+
+def _format_avg_metrics(metrics_df: pd.DataFrame) -> pd.DataFrame:
+    """平均財務指標の各列を表示用の文字列に一括変換（欠損値は"-"）"""
+    formatted = {}
+    for col, fmt in _AVG_METRIC_FORMATS:
+        # 値ごとのpd.isna・str.formatを避け、NumPyの配列演算でまとめて変換
+        arr = pd.to_numeric(metrics_df[col], errors='coerce').to_numpy(dtype=np.float64)
+        formatted[col] = np.where(np.isnan(arr), "-", np.char.mod(fmt, arr)).tolist()
+    return pd.DataFrame(formatted, index=metrics_df.index)
+
+
+def _blank_to_na(values: pd.Series) -> pd.Series:
+    """空文字を欠損値として扱う"""
+    return values.mask(values == '')
+
+
+def _format_number_column(values: pd.Series, fmt: str, missing: str) -> pd.Series:
+    """数値の列を%形式のfmtで一括フォーマット（欠損値はmissingで表示）"""
+    # 値ごとのstr.formatを避け、NumPyの配列演算でまとめて変換
+    arr = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+    return pd.Series(np.where(np.isnan(arr), missing, np.char.mod(fmt, arr)).tolist(), index=values.index)
+
+
+def _format_thousands_column(values: pd.Series, missing: str) -> pd.Series:
+    """数値の列を3桁区切りの整数で一括フォーマット（%形式では区切れないため、欠損値以外を変換）"""
+    values = pd.to_numeric(values, errors='coerce')
+    return values.map('{:,.0f}'.format, na_action='ignore').fillna(missing)
+
+
+def _format_datetime_column(values: pd.Series, fmt: str, width: int) -> pd.Series:
+    """
+    日時の列を一括でフォーマット
+    
+    解析できない値は文字列の先頭width文字（"T"は空白に置換）を、欠損値は"N/A"を表示します。
+    """
+    try:
+        formatted = pd.to_datetime(values, errors='coerce', format='mixed').dt.strftime(fmt)
+    except (ValueError, TypeError, AttributeError):
+        # タイムゾーンの混在などで一括変換できない場合は文字列で表示
+        formatted = pd.Series(None, index=values.index, dtype=object)
+    fallback = values.map(
+        lambda v: (v if isinstance(v, str) else str(v)).translate(_T_TO_SPACE)[:width],
+        na_action='ignore'
+    )
+    return formatted.fillna(fallback).fillna("N/A")
 
 
 class MarketConditionsTab:
@@ -60,8 +413,61 @@ class MarketConditionsTab:
         self.current_change_df: Optional[pd.DataFrame] = None
         self.current_flow_per_stock_df: Optional[pd.DataFrame] = None
         
-        # グラフウィンドウの参照
+        # セクター資金流動分析（初回使用時に作成して共有）
+        self._analyzer = None
+        self._analyzer_lock = threading.Lock()
+        # 銘柄一覧・財務指標取得で使うマネージャー（初回使用時に作成して共有）
+        # 各マネージャーは呼び出しごとにDB接続を開くため、ワーカースレッドから共有して使える
+        self._ohlcv_manager: Optional[OHLCVDataManager] = None
+        self._financial_metrics_manager = None
+        self._net_cash_ratio_manager = None
+        self._jpx400_manager = None
+        self._managers_lock = threading.Lock()
+        
+        # 分析結果のキャッシュ（DBの更新日時が変わったら破棄）
+        # キー: 表示期間, 値: {"flow", "change", "share", "flow_per_stock"} -> DataFrame
+        # シェア・1銘柄あたり売買代金は該当するグラフタイプの初回表示時に売買代金から作成して追加する
+        self._analysis_cache: Dict[str, Dict[str, pd.DataFrame]] = {}
+        self._analysis_cache_mtime: Optional[float] = None
+        # 表示中の分析結果（_analysis_cacheの要素）
+        self._current_analysis: Optional[Dict[str, pd.DataFrame]] = None
+        # 上位セクターの選択結果（グラフの再描画ごとに並べ替えないため）
+        # キー: (id(df), 最終日, 列数, 上位件数), 値: (上位セクター名, 上位セクターの列のDataFrame)
+        self._top_sectors_cache: Dict[tuple, Tuple[List[str], pd.DataFrame]] = {}
+        # セクター別・セクター業種別銘柄数のキャッシュ: (DB更新日時, sector_count_df, sector_industry_count_df)
+        self._sector_counts_cache: Optional[Tuple[Optional[float], pd.DataFrame, pd.DataFrame]] = None
+        # 1銘柄あたり売買代金をワーカースレッドで作成中か（キャッシュがない場合のみ）
+        self._flow_per_stock_pending = False
+        # 銘柄一覧ウィンドウの表示データのキャッシュ（DBが更新されたら破棄、新しい順に最大8件）
+        # キー: (セクター, 業種 or None), 値: (DB更新日時, _show_sector_symbols_windowの引数)
+        self._symbol_list_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Optional[float], tuple]]" = OrderedDict()
+        
+        # グラフウィンドウの参照（Figure・Canvas・ツールバーは再描画時に再利用）
         self.chart_window = None
+        self._chart_fig: Optional["Figure"] = None
+        self._chart_canvas: Optional["FigureCanvasTkAgg"] = None
+        self._chart_toolbar: Optional["NavigationToolbar2Tk"] = None
+        # 表示中の線グラフの状態（同じグラフの再表示時は線のデータだけ差し替える）
+        # キー: chart_type, columns, lines, raw_lines
+        self._line_chart_state: Optional[Dict[str, object]] = None
+        # 移動平均グラフに元データの薄い線（3日おきに間引き）を背景として表示するか
+        self._show_ma_raw_background: bool = False
+        # 表示中の前日比グラフの状態（日付と表示セクターが同じなら棒の長さだけ差し替える）
+        # キー: date, sectors, bars
+        self._change_chart_state: Optional[Dict[str, object]] = None
+        
+        # セクター名 -> 業種行のvalues（展開時に挿入）
+        self._sector_industry_rows: Dict[str, List[tuple]] = {}
+        
+        # セクター別銘柄数の表示世代（分割挿入中の再表示を検知するため）
+        self._sector_count_generation = 0
+        
+        # 再描画の遅延実行ID（連続したラジオボタン操作をまとめるため）
+        self._redraw_after_id: Optional[str] = None
+        # グラフウィンドウの最小化中に保留した再描画があるか（ウィンドウの再表示時に描画する）
+        self._chart_redraw_pending = False
+        # 表示中のグラフの指紋（グラフタイプ・元データ・移動平均期間が同じなら再描画しない）
+        self._chart_fingerprint: Optional[tuple] = None
         
         # UI構築
         self._build_ui()
@@ -81,21 +487,19 @@ class MarketConditionsTab:
         ttk.Label(period_frame, text="表示期間:").pack(side="left", padx=pad)
         
         self.days_var = tk.StringVar(value="all")  # "all"で全期間を表す
-        ttk.Radiobutton(
-            period_frame,
-            text="全期間",
-            variable=self.days_var,
-            value="all",
-            command=self._on_period_changed
-        ).pack(side="left", padx=2)
-        for days in [7, 30, 60, 90, 180]:
-            ttk.Radiobutton(
+        # 後から状態を変更できるよう、ラジオボタンは値をキーに保持する
+        self._period_radiobuttons: Dict[str, ttk.Radiobutton] = {}
+        period_options = [("全期間", "all")] + [(f"{days}日", str(days)) for days in [7, 30, 60, 90, 180]]
+        for text, value in period_options:
+            rb = ttk.Radiobutton(
                 period_frame,
-                text=f"{days}日",
+                text=text,
                 variable=self.days_var,
-                value=str(days),
+                value=value,
                 command=self._on_period_changed
-            ).pack(side="left", padx=2)
+            )
+            rb.pack(side="left", padx=2)
+            self._period_radiobuttons[value] = rb
         
         # グラフタイプ選択（新しい行に配置）
         chart_type_frame = ttk.Frame(control_frame)
@@ -104,61 +508,26 @@ class MarketConditionsTab:
         ttk.Label(chart_type_frame, text="グラフタイプ:").pack(side="left", padx=pad)
         
         self.chart_type_var = tk.StringVar(value="flow")
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="売買代金",
-            variable=self.chart_type_var,
-            value="flow",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
-        
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="前日比",
-            variable=self.chart_type_var,
-            value="change",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
-        
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="移動平均",
-            variable=self.chart_type_var,
-            value="moving_average",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
-        
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="積み上げ棒グラフ",
-            variable=self.chart_type_var,
-            value="stacked_bar",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
-        
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="シェア（積み上げ）",
-            variable=self.chart_type_var,
-            value="share",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
-        
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="1銘柄あたり売買代金",
-            variable=self.chart_type_var,
-            value="flow_per_stock",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
-        
-        ttk.Radiobutton(
-            chart_type_frame,
-            text="1銘柄あたり売買代金（移動平均）",
-            variable=self.chart_type_var,
-            value="flow_per_stock_ma",
-            command=self._on_chart_type_changed
-        ).pack(side="left", padx=2)
+        self._chart_type_radiobuttons: Dict[str, ttk.Radiobutton] = {}
+        chart_type_options = [
+            ("売買代金", "flow"),
+            ("前日比", "change"),
+            ("移動平均", "moving_average"),
+            ("積み上げ棒グラフ", "stacked_bar"),
+            ("シェア（積み上げ）", "share"),
+            ("1銘柄あたり売買代金", "flow_per_stock"),
+            ("1銘柄あたり売買代金（移動平均）", "flow_per_stock_ma"),
+        ]
+        for text, value in chart_type_options:
+            rb = ttk.Radiobutton(
+                chart_type_frame,
+                text=text,
+                variable=self.chart_type_var,
+                value=value,
+                command=self._on_chart_type_changed
+            )
+            rb.pack(side="left", padx=2)
+            self._chart_type_radiobuttons[value] = rb
         
         # 移動平均期間選択（新しい行に配置）
         ma_frame = ttk.Frame(control_frame)
@@ -166,14 +535,18 @@ class MarketConditionsTab:
         
         ttk.Label(ma_frame, text="移動平均期間:").pack(side="left", padx=pad)
         self.ma_period_var = tk.IntVar(value=20)
+        self._ma_radiobuttons: List[ttk.Radiobutton] = []
         for period in [5, 10, 20, 30, 60]:
-            ttk.Radiobutton(
+            rb = ttk.Radiobutton(
                 ma_frame,
                 text=f"{period}日",
                 variable=self.ma_period_var,
                 value=period,
                 command=self._on_period_changed
-            ).pack(side="left", padx=2)
+            )
+            rb.pack(side="left", padx=2)
+            self._ma_radiobuttons.append(rb)
+        self._update_ma_radiobutton_state()
         
         # ボタンフレーム
         button_frame = ttk.Frame(control_frame)
@@ -203,12 +576,12 @@ class MarketConditionsTab:
         info_frame.pack(fill="x", pady=(0, pad))
         
         # 財務指標取得ボタン
-        fetch_metrics_button = ttk.Button(
+        self.fetch_metrics_button = ttk.Button(
             info_frame,
             text="財務指標を取得",
             command=self._on_fetch_financial_metrics
         )
-        fetch_metrics_button.pack(side="left", padx=(0, pad))
+        self.fetch_metrics_button.pack(side="left", padx=(0, pad))
         
         # 最新実施日時を表示するラベル
         self.last_fetch_time_label = ttk.Label(
@@ -237,6 +610,7 @@ class MarketConditionsTab:
         
         count_v_scrollbar = ttk.Scrollbar(count_tree_frame, orient="vertical")
         count_v_scrollbar.pack(side="right", fill="y")
+        self._count_v_scrollbar = count_v_scrollbar
         
         count_columns = ("セクター", "業種", "銘柄数", "平均PER", "平均PBR", "平均利回り", "平均ROA", "平均ROE", "平均NC比率")
         self.sector_count_tree = ttk.Treeview(
@@ -254,6 +628,7 @@ class MarketConditionsTab:
         # 水平スクロールバーを追加
         count_h_scrollbar = ttk.Scrollbar(count_tree_frame, orient="horizontal")
         count_h_scrollbar.pack(side="bottom", fill="x")
+        self._count_h_scrollbar = count_h_scrollbar
         self.sector_count_tree.config(xscrollcommand=count_h_scrollbar.set)
         count_h_scrollbar.config(command=self.sector_count_tree.xview)
         
@@ -285,6 +660,15 @@ class MarketConditionsTab:
         self.chart_frame = ttk.Frame(self.parent)
         self.chart_frame.pack(fill="both", expand=True, padx=pad, pady=pad)
         
+        # プレースホルダー（グラフは別ウィンドウで表示するため、このフレームには常に案内文のみ）
+        self._placeholder_label = ttk.Label(
+            self.chart_frame,
+            text="「分析実行」ボタンをクリックしてセクター資金流動を分析してください\n（グラフは別ウィンドウで表示されます）",
+            font=("", 12),
+            foreground="gray",
+            justify="center"
+        )
+        
         # 初期状態ではグラフを表示しない
         self._show_placeholder()
         
@@ -295,21 +679,10 @@ class MarketConditionsTab:
         """タブ初期化時にセクター別銘柄数を読み込む"""
         def load_in_thread():
             try:
-                from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
-                
-                analyzer = SectorFlowAnalyzer(self.db_path)
-                sector_count_df = analyzer.get_sector_stock_counts()
+                analyzer = self._get_analyzer()
                 
-                # セクター・業種別銘柄数も読み込む
-                sector_industry_count_df = analyzer.get_sector_industry_stock_counts()
-                
-                # セクター別銘柄数をアコーディオン表示
-                if not sector_count_df.empty and not sector_industry_count_df.empty:
-                    self.parent.after(0, lambda: self._display_sector_counts_with_industries(
-                        sector_count_df, sector_industry_count_df
-                    ))
-                elif not sector_count_df.empty:
-                    self.parent.after(0, lambda: self._display_sector_counts(sector_count_df))
+                # セクター別・セクター業種別銘柄数を読み込んで表示
+                self._load_and_display_sector_counts(analyzer)
             except Exception as e:
                 print(f"[ERROR] セクター別銘柄数読み込みエラー: {e}")
                 import traceback
@@ -320,48 +693,135 @@ class MarketConditionsTab:
     
     def _show_placeholder(self):
         """プレースホルダーを表示"""
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-        
-        placeholder = ttk.Label(
-            self.chart_frame,
-            text="「分析実行」ボタンをクリックしてセクター資金流動を分析してください\n（グラフは別ウィンドウで表示されます）",
-            font=("", 12),
-            foreground="gray",
-            justify="center"
-        )
-        placeholder.pack(expand=True)
+        self._placeholder_label.pack(expand=True)
+    
+    def _hide_placeholder(self):
+        """プレースホルダーを非表示"""
+        self._placeholder_label.pack_forget()
+    
+    def _schedule_redraw(self, delay_ms: int = 150):
+        """グラフの再表示を予約（delay_ms以内の連続した変更は最後の1回だけ描画）"""
+        if self._redraw_after_id is not None:
+            self.parent.after_cancel(self._redraw_after_id)
+        self._redraw_after_id = self.parent.after(delay_ms, self._run_scheduled_redraw)
+    
+    def _run_scheduled_redraw(self):
+        """予約されたグラフの再表示を実行（グラフウィンドウが最小化中の場合は再表示時まで保留）"""
+        self._redraw_after_id = None
+        if self._chart_window_exists() and self.chart_window.state() == "iconic":
+            self._chart_redraw_pending = True
+            return
+        self._display_chart()
     
     def _on_period_changed(self):
         """期間が変更されたときの処理"""
         if self.current_flow_df is not None:
             # 既にデータがある場合は再表示
-            self._display_chart()
+            self._schedule_redraw()
     
     def _on_chart_type_changed(self):
         """グラフタイプが変更されたときの処理"""
         if self.current_flow_df is not None:
             # 既にデータがある場合は再表示
-            self._display_chart()
+            self._schedule_redraw()
         
-        # 移動平均選択時のみ移動平均期間選択を有効化
+        self._update_ma_radiobutton_state()
+    
+    def _update_ma_radiobutton_state(self):
+        """移動平均選択時のみ移動平均期間選択を有効化"""
         chart_type = self.chart_type_var.get()
-        if chart_type == "moving_average" or chart_type == "flow_per_stock_ma":
-            for widget in self.parent.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.LabelFrame):
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, ttk.Frame):
-                                    # 移動平均期間選択のラジオボタンを有効化
-                                    for rb in grandchild.winfo_children():
-                                        if isinstance(rb, ttk.Radiobutton):
-                                            rb.config(state="normal")
+        state = "normal" if chart_type in ("moving_average", "flow_per_stock_ma") else "disabled"
+        for rb in self._ma_radiobuttons:
+            rb.config(state=state)
     
     def is_running(self) -> bool:
         """分析処理が実行中かどうかを返す"""
         return self._analyzing
     
+    def _get_analyzer(self):
+        """SectorFlowAnalyzerを取得（初回のみ作成し、以降は同じインスタンスを共有）"""
+        with self._analyzer_lock:
+            if self._analyzer is None:
+                from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
+                self._analyzer = SectorFlowAnalyzer(self.db_path)
+            return self._analyzer
+    
+    def _get_ohlcv_manager(self) -> OHLCVDataManager:
+        """OHLCVDataManagerを取得（初回のみ作成）"""
+        with self._managers_lock:
+            if self._ohlcv_manager is None:
+                self._ohlcv_manager = OHLCVDataManager(self.db_path)
+            return self._ohlcv_manager
+    
+    def _get_financial_metrics_manager(self):
+        """FinancialMetricsManagerを取得（初回のみ作成）"""
+        with self._managers_lock:
+            if self._financial_metrics_manager is None:
+                from src.data_collector.financial_metrics_manager import FinancialMetricsManager
+                self._financial_metrics_manager = FinancialMetricsManager(self.db_path)
+            return self._financial_metrics_manager
+    
+    def _get_net_cash_ratio_manager(self):
+        """NetCashRatioManagerを取得（初回のみ作成）"""
+        with self._managers_lock:
+            if self._net_cash_ratio_manager is None:
+                from src.data_collector.net_cash_ratio_manager import NetCashRatioManager
+                self._net_cash_ratio_manager = NetCashRatioManager(self.db_path)
+            return self._net_cash_ratio_manager
+    
+    def _get_jpx400_manager(self):
+        """JPX400Managerを取得（初回のみ作成、銘柄リストは呼び出しごとにファイルから読み込む）"""
+        with self._managers_lock:
+            if self._jpx400_manager is None:
+                from src.screening.jpx400_manager import JPX400Manager
+                self._jpx400_manager = JPX400Manager()
+            return self._jpx400_manager
+    
+    def _get_db_mtime(self) -> Optional[float]:
+        """データベースファイルの更新日時を取得（キャッシュの有効性判定用）"""
+        try:
+            return os.path.getmtime(self.db_path)
+        except OSError:
+            return None
+    
+    def _get_sector_counts(self, analyzer) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        セクター別・セクター業種別銘柄数を取得（DBが更新されていなければキャッシュを使用）
+        
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: (sector_count_df, sector_industry_count_df)
+        """
+        mtime = self._get_db_mtime()
+        cached = self._sector_counts_cache
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+        
+        sector_count_df = analyzer.get_sector_stock_counts()
+        sector_industry_count_df = analyzer.get_sector_industry_stock_counts()
+        self._sector_counts_cache = (mtime, sector_count_df, sector_industry_count_df)
+        return sector_count_df, sector_industry_count_df
+    
+    def _get_cached_symbol_list(self, key: Tuple[str, Optional[str]]) -> Optional[tuple]:
+        """銘柄一覧の表示データをキャッシュから取得（DBが更新されていればNone）"""
+        cached = self._symbol_list_cache.get(key)
+        if cached is None:
+            return None
+        mtime = self._get_db_mtime()
+        if mtime is None or cached[0] != mtime:
+            self._symbol_list_cache.pop(key, None)
+            return None
+        self._symbol_list_cache.move_to_end(key)
+        return cached[1]
+    
+    def _store_symbol_list(self, key: Tuple[str, Optional[str]], mtime: Optional[float], payload: tuple):
+        """銘柄一覧の表示データをキャッシュに保存（古いものから破棄して最大8件）"""
+        if mtime is None:
+            return
+        self._symbol_list_cache[key] = (mtime, payload)
+        self._symbol_list_cache.move_to_end(key)
+        while len(self._symbol_list_cache) > 8:
+            self._symbol_list_cache.popitem(last=False)
+    
     def on_analyze(self):
         """分析実行ボタンのハンドラ"""
         if self._analyzing:
@@ -374,38 +834,17 @@ class MarketConditionsTab:
                 self.analyze_button.config(state="disabled")
                 self.status_var.set("状態: セクター資金流動分析中...")
                 
-                from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
-                
-                analyzer = SectorFlowAnalyzer(self.db_path)
+                analyzer = self._get_analyzer()
                 days_value = self.days_var.get()
                 
-                # セクター別銘柄数を取得
-                self.status_var.set("状態: セクター別銘柄数を取得中...")
-                sector_count_df = analyzer.get_sector_stock_counts()
-                
-                # セクター・業種別銘柄数も取得
-                sector_industry_count_df = analyzer.get_sector_industry_stock_counts()
-                
-                # セクター別銘柄数をアコーディオン表示
-                if not sector_count_df.empty and not sector_industry_count_df.empty:
-                    self.parent.after(0, lambda: self._display_sector_counts_with_industries(
-                        sector_count_df, sector_industry_count_df
-                    ))
-                elif not sector_count_df.empty:
-                    self.parent.after(0, lambda: self._display_sector_counts(sector_count_df))
-                
-                # データを取得
-                if days_value == "all":
-                    self.status_var.set("状態: データ取得中...（全期間）")
-                    flow_df, change_df = analyzer.calculate_sector_flow_with_change(days=None)
-                    share_df = analyzer.calculate_sector_share(days=None)
-                    flow_per_stock_df = analyzer.calculate_sector_flow_per_stock(days=None)
-                else:
-                    days = int(days_value)
-                    self.status_var.set(f"状態: データ取得中...（{days}日分）")
-                    flow_df, change_df = analyzer.calculate_sector_flow_with_change(days=days)
-                    share_df = analyzer.calculate_sector_share(days=days)
-                    flow_per_stock_df = analyzer.calculate_sector_flow_per_stock(days=days)
+                # セクター別銘柄数（財務指標付き）の取得・表示は売買代金の集計と並行して実行
+                # （各マネージャーは呼び出しごとにDB接続を開くため、スレッド間で共有しても安全）
+                self.status_var.set("状態: セクター別銘柄数・売買代金を取得中...")
+                executor = _get_query_executor()
+                sector_counts_future = executor.submit(self._load_and_display_sector_counts, analyzer)
+                analysis = self._get_analysis(analyzer, days_value)
+                sector_counts_future.result()
+                flow_df = analysis["flow"]
                 
                 if flow_df.empty:
                     self.parent.after(0, lambda: messagebox.showwarning(
@@ -415,11 +854,14 @@ class MarketConditionsTab:
                     ))
                     return
                 
-                # データを保持
+                # データを保持（未作成のデータはNone）
+                if analysis is not self._current_analysis:
+                    self._top_sectors_cache = {}
+                self._current_analysis = analysis
                 self.current_flow_df = flow_df
-                self.current_share_df = share_df
-                self.current_change_df = change_df
-                self.current_flow_per_stock_df = flow_per_stock_df
+                self.current_change_df = analysis["change"]
+                self.current_share_df = analysis.get("share")
+                self.current_flow_per_stock_df = analysis.get("flow_per_stock")
                 
                 # グラフを表示
                 self.parent.after(0, self._display_chart)
@@ -444,16 +886,51 @@ class MarketConditionsTab:
         thread = threading.Thread(target=task, daemon=True)
         thread.start()
     
+    def _get_analysis(self, analyzer, days_value: str) -> Dict[str, pd.DataFrame]:
+        """
+        売買代金・前日比を取得（同じ期間・DB未更新なら前回の結果を再利用）
+        
+        シェア・1銘柄あたり売買代金はグラフタイプの選択時に売買代金から作成します。
+        """
+        mtime = self._get_db_mtime()
+        if mtime is None or mtime != self._analysis_cache_mtime:
+            self._analysis_cache = {}
+            self._analysis_cache_mtime = mtime
+        
+        analysis = self._analysis_cache.get(days_value)
+        if analysis is None:
+            if days_value == "all":
+                self.status_var.set("状態: データ取得中...（全期間）")
+                flow_df, change_df = analyzer.calculate_sector_flow_with_change(days=None)
+            else:
+                days = int(days_value)
+                self.status_var.set(f"状態: データ取得中...（{days}日分）")
+                flow_df, change_df = analyzer.calculate_sector_flow_with_change(days=days)
+            analysis = {"flow": flow_df, "change": change_df}
+            if mtime is not None:
+                self._analysis_cache[days_value] = analysis
+        return analysis
+    
+    def _load_and_display_sector_counts(self, analyzer):
+        """セクター別・セクター業種別銘柄数を取得してアコーディオン表示（ワーカースレッドで実行）"""
+        sector_count_df, sector_industry_count_df = self._get_sector_counts(analyzer)
+        
+        if not sector_count_df.empty and not sector_industry_count_df.empty:
+            self._display_sector_counts_with_industries(
+                sector_count_df, sector_industry_count_df
+            )
+        elif not sector_count_df.empty:
+            self._display_sector_counts(sector_count_df)
+    
     def _display_sector_counts(self, sector_count_df: pd.DataFrame):
-        """セクター別銘柄数をTreeviewに表示（業種情報なしの場合、財務指標付き）"""
-        # 既存のデータをクリア
-        for item in self.sector_count_tree.get_children():
-            self.sector_count_tree.delete(item)
+        """
+        セクター別銘柄数をTreeviewに表示（業種情報なしの場合、財務指標付き）
         
+        財務指標の取得と行データの作成は呼び出し元スレッドで行い、Treeviewへの挿入はUIスレッドで分割実行します。
+        """
         # 財務指標を取得
         try:
-            from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
-            analyzer = SectorFlowAnalyzer(self.db_path)
+            analyzer = self._get_analyzer()
             sector_metrics_df = analyzer.get_sector_financial_metrics()
             
             # デバッグ情報
@@ -462,217 +939,453 @@ class MarketConditionsTab:
                 print(f"[DEBUG] セクター別財務指標の列: {sector_metrics_df.columns.tolist()}")
                 print(f"[DEBUG] サンプルデータ（最初の3行）:")
                 print(sector_metrics_df.head(3))
-            
-            # セクター別財務指標を辞書に変換
-            sector_metrics_dict = {}
-            if not sector_metrics_df.empty:
-                for _, row in sector_metrics_df.iterrows():
-                    sector_metrics_dict[row['sector']] = {
-                        'avg_per': row.get('avg_per'),
-                        'avg_pbr': row.get('avg_pbr'),
-                        'avg_dividend_yield': row.get('avg_dividend_yield'),
-                        'avg_roa': row.get('avg_roa'),
-                        'avg_roe': row.get('avg_roe'),
-                        'avg_net_cash_ratio': row.get('avg_net_cash_ratio')
-                    }
-                    # NC比率のデバッグ情報
-                    if row.get('avg_net_cash_ratio') is not None:
-                        print(f"[DEBUG] {row['sector']}の平均NC比率: {row.get('avg_net_cash_ratio')}")
-                print(f"[DEBUG] セクター別財務指標辞書: {len(sector_metrics_dict)}件")
             else:
                 print("[DEBUG] セクター別財務指標データが空です")
         except Exception as e:
             print(f"[ERROR] 財務指標取得エラー: {e}")
             import traceback
             traceback.print_exc()
-            sector_metrics_dict = {}
-        
-        # 財務指標をフォーマットする関数
-        def format_metric(value, is_percent=False, decimals=2):
-            if value is None or pd.isna(value):
-                return "-"
-            if is_percent:
-                return f"{value:.{decimals}f}%"
-            else:
-                return f"{value:.{decimals}f}"
+            sector_metrics_df = pd.DataFrame()
         
-        # データを挿入
-        for _, row in sector_count_df.iterrows():
-            sector = row['sector']
-            count = int(row['count'])
-            
-            # セクターの財務指標を取得
-            sector_metrics = sector_metrics_dict.get(sector, {})
-            
-            self.sector_count_tree.insert(
-                "",
-                "end",
-                values=(
-                    sector,
-                    "",
-                    f"{count:,}",
-                    format_metric(sector_metrics.get('avg_per'), decimals=1),
-                    format_metric(sector_metrics.get('avg_pbr'), decimals=2),
-                    format_metric(sector_metrics.get('avg_dividend_yield'), is_percent=True, decimals=2),
-                    format_metric(sector_metrics.get('avg_roa'), is_percent=True, decimals=2),
-                    format_metric(sector_metrics.get('avg_roe'), is_percent=True, decimals=2),
-                    format_metric(sector_metrics.get('avg_net_cash_ratio'), decimals=4)
-                ),
-                tags=("sector",)
-            )
-        
-        # セクター行のスタイル設定
-        self.sector_count_tree.tag_configure("sector", font=("", 9, "bold"))
+        rows = self._build_sector_count_rows(sector_count_df, sector_metrics_df)
+        self._sector_industry_rows = {}
+        self.parent.after(0, lambda: self._insert_sector_count_rows(rows, set()))
     
     def _display_sector_counts_with_industries(
         self, 
         sector_count_df: pd.DataFrame, 
         sector_industry_count_df: pd.DataFrame
     ):
-        """セクター別銘柄数をアコーディオン表示（業種を含む、財務指標付き）"""
-        # 既存のデータをクリア
-        for item in self.sector_count_tree.get_children():
-            self.sector_count_tree.delete(item)
+        """
+        セクター別銘柄数をアコーディオン表示（業種を含む、財務指標付き）
         
+        財務指標の取得と行データの作成は呼び出し元スレッドで行い、Treeviewへの挿入はUIスレッドで分割実行します。
+        """
         # 財務指標を取得
         try:
-            from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
-            analyzer = SectorFlowAnalyzer(self.db_path)
-            sector_metrics_df = analyzer.get_sector_financial_metrics()
-            sector_industry_metrics_df = analyzer.get_sector_industry_financial_metrics()
+            analyzer = self._get_analyzer()
+            sector_metrics_df, sector_industry_metrics_df = analyzer.get_sector_and_industry_financial_metrics()
             
             # デバッグ情報
             print(f"[DEBUG] セクター別財務指標: {len(sector_metrics_df)}件")
             print(f"[DEBUG] セクター・業種別財務指標: {len(sector_industry_metrics_df)}件")
-            
-            # セクター別財務指標を辞書に変換
-            sector_metrics_dict = {}
-            if not sector_metrics_df.empty:
-                for _, row in sector_metrics_df.iterrows():
-                    sector_metrics_dict[row['sector']] = {
-                        'avg_per': row.get('avg_per'),
-                        'avg_pbr': row.get('avg_pbr'),
-                        'avg_dividend_yield': row.get('avg_dividend_yield'),
-                        'avg_roa': row.get('avg_roa'),
-                        'avg_roe': row.get('avg_roe'),
-                        'avg_net_cash_ratio': row.get('avg_net_cash_ratio')
-                    }
-                print(f"[DEBUG] セクター別財務指標辞書: {len(sector_metrics_dict)}件")
-            else:
+            if sector_metrics_df.empty:
                 print("[DEBUG] セクター別財務指標データが空です")
-            
-            # セクター・業種別財務指標を辞書に変換
-            sector_industry_metrics_dict = {}
-            if not sector_industry_metrics_df.empty:
-                for _, row in sector_industry_metrics_df.iterrows():
-                    key = (row['sector'], row['industry'])
-                    sector_industry_metrics_dict[key] = {
-                        'avg_per': row.get('avg_per'),
-                        'avg_pbr': row.get('avg_pbr'),
-                        'avg_dividend_yield': row.get('avg_dividend_yield'),
-                        'avg_roe': row.get('avg_roe'),
-                        'avg_net_cash_ratio': row.get('avg_net_cash_ratio')
-                    }
-                print(f"[DEBUG] セクター・業種別財務指標辞書: {len(sector_industry_metrics_dict)}件")
-            else:
+            if sector_industry_metrics_df.empty:
                 print("[DEBUG] セクター・業種別財務指標データが空です")
         except Exception as e:
             print(f"[ERROR] 財務指標取得エラー: {e}")
             import traceback
             traceback.print_exc()
-            sector_metrics_dict = {}
-            sector_industry_metrics_dict = {}
-        
-        # 財務指標をフォーマットする関数
-        def format_metric(value, is_percent=False, decimals=2):
-            if value is None or pd.isna(value):
-                return "-"
-            if is_percent:
-                return f"{value:.{decimals}f}%"
-            else:
-                return f"{value:.{decimals}f}"
-        
-        # セクター・業種別データをセクターごとにグループ化
-        sector_industry_dict: Dict[str, List[Tuple[str, int]]] = {}
-        for _, row in sector_industry_count_df.iterrows():
-            sector = row['sector']
-            industry = row['industry']
-            count = int(row['count'])
-            if sector not in sector_industry_dict:
-                sector_industry_dict[sector] = []
-            sector_industry_dict[sector].append((industry, count))
-        
-        # セクターごとにソート（銘柄数の降順）
-        for sector in sector_industry_dict:
-            sector_industry_dict[sector].sort(key=lambda x: x[1], reverse=True)
-        
-        # セクター別データを挿入（親アイテム）
-        sector_items = {}  # セクター名 -> アイテムIDのマッピング
-        for _, row in sector_count_df.iterrows():
-            sector = row['sector']
-            count = int(row['count'])
-            
-            # セクターの財務指標を取得
-            sector_metrics = sector_metrics_dict.get(sector, {})
-            
-            # セクター行を親アイテムとして挿入
-            sector_item = self.sector_count_tree.insert(
-                "", "end", 
-                text="",  # ツリーアイコン用
-                values=(
-                    sector,
-                    "",
-                    f"{count:,}",
-                    format_metric(sector_metrics.get('avg_per'), decimals=1),
-                    format_metric(sector_metrics.get('avg_pbr'), decimals=2),
-                    format_metric(sector_metrics.get('avg_dividend_yield'), is_percent=True, decimals=2),
-                    format_metric(sector_metrics.get('avg_roa'), is_percent=True, decimals=2),
-                    format_metric(sector_metrics.get('avg_roe'), is_percent=True, decimals=2),
-                    format_metric(sector_metrics.get('avg_net_cash_ratio'), decimals=4)
-                ),
-                tags=("sector",)
-            )
-            sector_items[sector] = sector_item
-            
-            # 業種は+アイコンをクリックしたときに表示されるため、初期表示では追加しない
-            # ただし、+アイコンを表示するためにダミー子アイテムを追加
-            if sector in sector_industry_dict:
-                # ダミー子アイテムを追加して+アイコンを表示
-                self.sector_count_tree.insert(
-                    sector_item, "end",
-                    text="",
-                    values=("", "", "", "", "", "", "", "", ""),
-                    tags=("dummy",)
-                )
+            sector_metrics_df = pd.DataFrame()
+            sector_industry_metrics_df = pd.DataFrame()
+        
+        rows = self._build_sector_count_rows(sector_count_df, sector_metrics_df)
+        
+        # 業種行は展開時にDBへアクセスしないよう、ここで作成しておく
+        self._sector_industry_rows = self._build_sector_industry_rows(
+            sector_industry_count_df, sector_industry_metrics_df
+        )
+        
+        # 業種情報があるセクター（+アイコン表示の判定用）
+        sectors_with_industries = set(self._sector_industry_rows)
+        
+        self.parent.after(0, lambda: self._insert_sector_count_rows(rows, sectors_with_industries))
+    
+    def _build_sector_count_rows(
+        self,
+        sector_count_df: pd.DataFrame,
+        sector_metrics_df: pd.DataFrame
+    ) -> List[tuple]:
+        """セクター行のTreeview用valuesを作成"""
+        # 銘柄数と財務指標を結合し、表示用の文字列に列単位で変換
+        sector_rows = _merge_metrics(sector_count_df, sector_metrics_df, ['sector'])
+        display_df = _format_avg_metrics(sector_rows)
+        display_df.insert(0, 'sector', sector_rows['sector'])
+        display_df.insert(1, 'industry', "")
+        display_df.insert(2, 'count', sector_rows['count'].astype(int).map('{:,}'.format))
+        return list(display_df.itertuples(index=False, name=None))
+    
+    def _insert_sector_count_rows(
+        self,
+        rows: List[tuple],
+        sectors_with_industries: set,
+        chunk_size: int = 50
+    ):
+        """
+        セクター行をTreeviewに挿入（UIスレッドで実行）
+        
+        chunk_size行ごとにイベントループへ制御を戻しながら挿入します。
+        
+        Args:
+            rows: セクター行のvalues
+            sectors_with_industries: 業種を持つセクター（+アイコン表示用のダミー子アイテムを追加）
+            chunk_size: 1回に挿入する行数
+        """
+        tree = self.sector_count_tree
+        
+        # 挿入中に再表示が要求された場合は古い挿入を打ち切る
+        self._sector_count_generation += 1
+        generation = self._sector_count_generation
+        
+        # 既存のデータをクリア
+        tree.delete(*tree.get_children())
         
         # セクター行のスタイル設定
-        self.sector_count_tree.tag_configure("sector", font=("", 9, "bold"))
-        self.sector_count_tree.tag_configure("industry", font=("", 9))
-        self.sector_count_tree.tag_configure("stock", font=("", 8))  # 銘柄行は少し小さめのフォント
+        tree.tag_configure("sector", font=("", 9, "bold"))
+        tree.tag_configure("industry", font=("", 9))
+        tree.tag_configure("stock", font=("", 8))  # 銘柄行は少し小さめのフォント
         
         # セクター数に応じてTreeviewの高さを動的に調整（セクター全体が表示できるように）
-        sector_count = len(sector_count_df)
-        # セクター数 + ヘッダー行 + 余裕を持たせる
-        optimal_height = min(max(sector_count + 2, 10), 20)  # 最小10行、最大20行
-        self.sector_count_tree.config(height=optimal_height)
+        if sectors_with_industries:
+            # セクター数 + ヘッダー行 + 余裕を持たせる
+            optimal_height = min(max(len(rows) + 2, 10), 20)  # 最小10行、最大20行
+            tree.config(height=optimal_height)
+        
+        # 挿入中はスクロールバーへの通知を止め、行ごとの再描画を抑える
+        self._suspend_count_tree_scroll()
+        
+        # 行数が多いため、Treeview.insertの引数変換を通さずTclのinsertコマンドを直接呼び出す
+        # （iidは行番号から割り当て、Tk側での一意なID生成を省く）
+        tk_call = tree.tk.call
+        widget = tree._w
+        dummy_values = ("", "", "", "", "", "", "", "", "")
+        
+        def insert_chunk(start: int):
+            if generation != self._sector_count_generation:
+                # 新しい挿入側でスクロールバーを戻すため、ここでは何もしない
+                return
+            for i, values in enumerate(rows[start:start + chunk_size], start):
+                # セクター行を親アイテムとして挿入
+                sector_item = f"s{i}"
+                tk_call(widget, "insert", "", "end", "-id", sector_item, "-values", values, "-tags", "sector")
+                
+                # 業種は+アイコンをクリックしたときに表示されるため、初期表示では追加しない
+                # ただし、+アイコンを表示するためにダミー子アイテムを追加
+                if values[0] in sectors_with_industries:
+                    tk_call(
+                        widget, "insert", sector_item, "end",
+                        "-id", f"{sector_item}_dummy", "-values", dummy_values, "-tags", "dummy"
+                    )
+            if start + chunk_size < len(rows):
+                self.parent.after_idle(insert_chunk, start + chunk_size)
+            else:
+                self._resume_count_tree_scroll()
+        
+        insert_chunk(0)
+    
+    def _suspend_count_tree_scroll(self):
+        """セクター別銘柄数Treeviewのスクロールバー連動を一時停止（一括挿入用）"""
+        self.sector_count_tree.configure(yscrollcommand="", xscrollcommand="")
+    
+    def _resume_count_tree_scroll(self):
+        """スクロールバー連動を再開し、まとめて1回だけ再描画する"""
+        self.sector_count_tree.configure(
+            yscrollcommand=self._count_v_scrollbar.set,
+            xscrollcommand=self._count_h_scrollbar.set
+        )
+        self.sector_count_tree.update_idletasks()
     
     def _display_chart(self):
         """グラフを別ウィンドウで表示"""
         if self.current_flow_df is None or self.current_flow_df.empty:
             return
         
-        # 既存のグラフウィンドウがあれば閉じる
-        if self.chart_window is not None:
+        _load_matplotlib()
+        self._chart_redraw_pending = False
+        
+        # グラフウィンドウ・Figure・Canvasは初回のみ作成し、以降は再利用する
+        if not self._chart_window_exists():
+            self._create_chart_window()
+        else:
+            self.chart_window.lift()
+        
+        chart_type = self.chart_type_var.get()
+        ma_period = self.ma_period_var.get()
+        if not self._ensure_chart_data(chart_type):
+            # ワーカースレッドでデータを作成中（完了後に再表示される）
+            return
+        
+        # 表示中のグラフと条件が同じなら何もしない
+        fingerprint = self._get_chart_fingerprint(chart_type, ma_period)
+        if fingerprint == self._chart_fingerprint:
+            return
+        self._chart_fingerprint = fingerprint
+        
+        # 同じグラフの再表示（移動平均期間の変更など）は線・棒のデータだけ差し替える
+        if self._update_line_chart_in_place(chart_type, ma_period):
+            return
+        if chart_type == "change" and self._update_change_chart_in_place():
+            return
+        
+        # 前回のグラフをクリアして描き直す
+        fig = self._chart_fig
+        fig.clear()
+        self._line_chart_state = None
+        self._change_chart_state = None
+        ax = fig.add_subplot(111)
+        
+        if chart_type == "flow":
+            lines = self._plot_flow_chart(ax, self.current_flow_df)
+            self._set_line_chart_state(chart_type, lines)
+        elif chart_type == "share":
+            self._plot_share_chart(ax, self.current_share_df)
+        elif chart_type == "change":
+            self._change_chart_state = self._plot_change_chart(ax, self.current_change_df)
+        elif chart_type == "moving_average":
+            raw_lines, ma_lines = self._plot_moving_average_chart(ax, self.current_flow_df, ma_period)
+            self._set_line_chart_state(chart_type, ma_lines, raw_lines)
+        elif chart_type == "stacked_bar":
+            self._plot_stacked_bar_chart(ax, self.current_flow_df)
+        elif chart_type == "flow_per_stock":
+            if self.current_flow_per_stock_df is not None and not self.current_flow_per_stock_df.empty:
+                lines = self._plot_flow_per_stock_chart(ax, self.current_flow_per_stock_df)
+                self._set_line_chart_state(chart_type, lines)
+            else:
+                ax.text(0.5, 0.5, "データが取得できませんでした", 
+                       ha='center', va='center', transform=ax.transAxes, fontsize=14)
+        elif chart_type == "flow_per_stock_ma":
+            if self.current_flow_per_stock_df is not None and not self.current_flow_per_stock_df.empty:
+                raw_lines, ma_lines = self._plot_moving_average_chart(
+                    ax, self.current_flow_per_stock_df, ma_period, is_per_stock=True
+                )
+                self._set_line_chart_state(chart_type, ma_lines, raw_lines)
+            else:
+                ax.text(0.5, 0.5, "データが取得できませんでした", 
+                       ha='center', va='center', transform=ax.transAxes, fontsize=14)
+        
+        # レイアウト調整と再描画（ズーム・パンの履歴は新しいグラフ用にリセット）
+        self._finalize_figure(fig)
+        self._chart_canvas.draw_idle()
+        self._chart_toolbar.update()
+    
+    def _finalize_figure(self, fig):
+        """グラフ描画後のレイアウト調整（各_plot_*では行わず、描画の最後に1回だけ実行）"""
+        fig.tight_layout()
+    
+    def _ensure_chart_data(self, chart_type: str) -> bool:
+        """
+        グラフタイプに必要なデータが未作成なら売買代金データから作成（結果はキャッシュに保持）
+        
+        UIスレッドから呼ばれるため、DBにはアクセスしません。1銘柄あたり売買代金はキャッシュ済みの
+        セクター別銘柄数から作成し、キャッシュがない場合はワーカースレッドで作成してからグラフを再表示します。
+        
+        Returns:
+            bool: グラフを描画できる場合はTrue（ワーカースレッドで作成中の場合はFalse）
+        """
+        analysis = self._current_analysis
+        if analysis is None:
+            return True
+        if chart_type == "share" and self.current_share_df is None:
+            self.current_share_df = self._get_analyzer().calculate_sector_share(flow_df=self.current_flow_df)
+            analysis["share"] = self.current_share_df
+        elif chart_type in ("flow_per_stock", "flow_per_stock_ma") and self.current_flow_per_stock_df is None:
+            cached_counts = self._sector_counts_cache
+            if cached_counts is not None:
+                self.current_flow_per_stock_df = self._get_analyzer().calculate_sector_flow_per_stock(
+                    flow_df=self.current_flow_df, sector_counts_df=cached_counts[1]
+                )
+                analysis["flow_per_stock"] = self.current_flow_per_stock_df
+            else:
+                self._build_flow_per_stock_in_background(analysis)
+                return False
+        return True
+    
+    def _build_flow_per_stock_in_background(self, analysis: Dict[str, pd.DataFrame]):
+        """1銘柄あたり売買代金をワーカースレッドで作成し、完了後にグラフを再表示"""
+        if self._flow_per_stock_pending:
+            return
+        self._flow_per_stock_pending = True
+        flow_df = self.current_flow_df
+        
+        def build():
             try:
-                if self.chart_window.winfo_exists():
-                    self.chart_window.destroy()
-            except:
-                pass
-            self.chart_window = None
+                analyzer = self._get_analyzer()
+                sector_count_df, _ = self._get_sector_counts(analyzer)
+                analysis["flow_per_stock"] = analyzer.calculate_sector_flow_per_stock(
+                    flow_df=flow_df, sector_counts_df=sector_count_df
+                )
+            except Exception as e:
+                print(f"[ERROR] 1銘柄あたり売買代金の作成エラー: {e}")
+                analysis["flow_per_stock"] = pd.DataFrame()
+            self.parent.after(0, apply)
+        
+        def apply():
+            self._flow_per_stock_pending = False
+            # 作成中に別の分析結果へ切り替わっていなければ反映して再表示
+            if analysis is self._current_analysis:
+                self.current_flow_per_stock_df = analysis["flow_per_stock"]
+                if self._chart_window_exists():
+                    self._display_chart()
+        
+        _get_query_executor().submit(build)
+    
+    def _get_top_sectors(self, df: pd.DataFrame, n: int = 10) -> Tuple[List[str], pd.DataFrame]:
+        """
+        最新日の値が大きい上位nセクターを取得（結果はデータごとにキャッシュ）
+        
+        Returns:
+            Tuple[List[str], pd.DataFrame]: (上位セクター名, 上位セクターの列に絞り込んだDataFrame)
+                n列以下の場合は全列とdfそのもの
+        """
+        if len(df.columns) <= n:
+            return list(df.columns), df
+        key = (id(df), df.index[-1], len(df.columns), n)
+        cached = self._top_sectors_cache.get(key)
+        if cached is None:
+            positions = _top_n_positions(df.iloc[-1].to_numpy(dtype=np.float64), n)
+            top_sectors = df.columns[positions].tolist()
+            cached = (top_sectors, df[top_sectors])
+            self._top_sectors_cache[key] = cached
+        return cached
+    
+    def _get_chart_fingerprint(self, chart_type: str, ma_period: int) -> tuple:
+        """
+        グラフの表示条件の指紋を作成
         
-        # 新しいグラフウィンドウを作成
+        グラフタイプ、元データ（オブジェクト・形状・最終日とその値）、移動平均期間（移動平均グラフのみ）
+        の組を返します。
+        """
+        if chart_type == "share":
+            df = self.current_share_df
+        elif chart_type == "change":
+            df = self.current_change_df
+        elif chart_type in ("flow_per_stock", "flow_per_stock_ma"):
+            df = self.current_flow_per_stock_df
+        else:
+            df = self.current_flow_df
+        
+        data_key = None
+        if df is not None and not df.empty:
+            data_key = (id(df), df.shape, df.index[-1], df.iloc[-1].to_numpy().tobytes())
+        is_ma = chart_type in ("moving_average", "flow_per_stock_ma")
+        return (
+            chart_type,
+            data_key,
+            ma_period if is_ma else None,
+            self._show_ma_raw_background if is_ma else None,
+        )
+    
+    def _get_line_chart_source(self, chart_type: str) -> Optional[pd.DataFrame]:
+        """線グラフの元データを取得（線グラフ以外のグラフタイプはNone）"""
+        if chart_type in ("flow", "moving_average"):
+            return self.current_flow_df
+        if chart_type in ("flow_per_stock", "flow_per_stock_ma"):
+            return self.current_flow_per_stock_df
+        return None
+    
+    def _set_line_chart_state(
+        self, chart_type: str, lines: Dict[str, object], raw_lines: Optional[Dict[str, object]] = None
+    ):
+        """描画した線グラフの線を保持（次回の再表示でデータを差し替えるため）"""
+        self._line_chart_state = {
+            'chart_type': chart_type,
+            'columns': lines['columns'],
+            'lines': lines,
+            'raw_lines': raw_lines,
+        }
+    
+    def _update_line_chart_in_place(self, chart_type: str, ma_period: int) -> bool:
+        """
+        表示中の線グラフの線データを差し替えて再描画
+        
+        グラフタイプと表示セクター数が前回と同じ場合のみ、Figureをクリアせずに線のデータと
+        軸範囲だけを更新します。表示セクターが入れ替わった場合は凡例の文字とレイアウトも更新します。
+        
+        Returns:
+            bool: 差し替えで再描画した場合True（全体を描き直す必要がある場合False）
+        """
+        state = self._line_chart_state
+        if state is None or state['chart_type'] != chart_type or not self._chart_window_exists():
+            return False
+        
+        df = self._get_line_chart_source(chart_type)
+        if df is None or df.empty:
+            return False
+        
+        _, df_plot = self._get_top_sectors(df)
+        columns = list(df_plot.columns)
+        if len(columns) != len(state['columns']):
+            return False
+        
+        ax = state['lines']['lines'].axes
+        segments = []
+        if chart_type in ("moving_average", "flow_per_stock_ma"):
+            if state['raw_lines'] is not None:
+                segments.append(_update_sector_lines(state['raw_lines'], df_plot.iloc[::3]))
+            df_plot = _rolling_mean(df_plot, ma_period)
+            ax.set_title(
+                _moving_average_title(ma_period, chart_type == "flow_per_stock_ma"),
+                fontsize=12, fontweight="bold"
+            )
+        segments.append(_update_sector_lines(state['lines'], df_plot))
+        
+        if columns != state['columns']:
+            legend = ax.get_legend()
+            if legend is not None:
+                for text, sector in zip(legend.get_texts(), columns):
+                    text.set_text(sector)
+            self._finalize_figure(ax.get_figure())
+            state['columns'] = columns
+        
+        # 古いmatplotlibのrelimはLineCollection・散布図をデータ範囲に含めないため、線の座標から範囲を加え直す
+        ax.relim()
+        for segment in segments:
+            ax.update_datalim(segment.reshape(-1, 2))
+        ax.autoscale_view()
+        self.chart_window.lift()
+        self._chart_canvas.draw_idle()
+        self._chart_toolbar.update()
+        return True
+    
+    def _update_change_chart_in_place(self) -> bool:
+        """
+        表示中の前日比グラフの棒の長さと色を差し替えて再描画
+        
+        最新日と表示セクター（並び順を含む）が前回と同じ場合のみ、タイトル・軸・グリッドは
+        そのままにして棒だけを更新します。
+        
+        Returns:
+            bool: 差し替えで再描画した場合True（全体を描き直す必要がある場合False）
+        """
+        state = self._change_chart_state
+        df = self.current_change_df
+        if state is None or df is None or df.empty or not self._chart_window_exists():
+            return False
+        if df.index[-1] != state['date']:
+            return False
+        
+        latest_data = df.iloc[-1]
+        latest_data = latest_data.iloc[_top_n_positions(latest_data.to_numpy(dtype=np.float64), 10)]
+        if latest_data.index.tolist() != state['sectors']:
+            return False
+        
+        values = latest_data.to_numpy()
+        colors = np.where(values >= 0, 'green', 'red')
+        for bar, value, color in zip(state['bars'], values, colors):
+            bar.set_width(value)
+            bar.set_facecolor(color)
+        
+        ax = state['bars'][0].axes
+        ax.relim()
+        ax.autoscale_view()
+        self.chart_window.lift()
+        self._chart_canvas.draw_idle()
+        self._chart_toolbar.update()
+        return True
+    
+    def _chart_window_exists(self) -> bool:
+        """グラフウィンドウが表示中かどうか"""
+        try:
+            return self.chart_window is not None and bool(self.chart_window.winfo_exists())
+        except tk.TclError:
+            return False
+    
+    def _create_chart_window(self):
+        """グラフウィンドウとFigure・Canvas・ツールバーを作成"""
         self.chart_window = tk.Toplevel(self.parent)
         self.chart_window.title("セクター資金流動分析 - グラフ")
+        self._chart_fingerprint = None
         self.chart_window.geometry("1400x800")
         
         # ウィンドウが閉じられたときの処理
@@ -684,99 +1397,78 @@ class MarketConditionsTab:
                 pass
             finally:
                 self.chart_window = None
+                self._chart_fig = None
+                self._chart_canvas = None
+                self._chart_toolbar = None
+                self._line_chart_state = None
+                self._change_chart_state = None
+                self._chart_redraw_pending = False
+                self._chart_fingerprint = None
         
         self.chart_window.protocol("WM_DELETE_WINDOW", on_window_close)
         
+        # 最小化中に保留した再描画は、ウィンドウが再表示されたときに1回だけ実行
+        def on_window_map(event):
+            if event.widget is self.chart_window and self._chart_redraw_pending:
+                self._display_chart()
+        
+        self.chart_window.bind("<Map>", on_window_map)
+        
         # グラフフレーム
         chart_frame = ttk.Frame(self.chart_window)
         chart_frame.pack(fill="both", expand=True, padx=8, pady=8)
         
-        # 日本語フォント設定
-        plt.rcParams['font.sans-serif'] = ['MS Gothic', 'Yu Gothic', 'Meiryo', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
+        # グラフを作成（大きめのサイズ）
+        self._chart_fig = Figure(figsize=(16, 10), dpi=100)
         
-        chart_type = self.chart_type_var.get()
+        # ツールバーからの画像保存のみ高解像度で出力（rcParamsは変更せず、他のグラフの保存には影響させない）
+        fig_savefig = self._chart_fig.savefig
         
-        # グラフを作成（大きめのサイズ）
-        fig = Figure(figsize=(16, 10), dpi=100)
-        ax = fig.add_subplot(111)
+        def savefig_high_dpi(*args, **kwargs):
+            kwargs.setdefault('dpi', _CHART_SAVE_DPI)
+            return fig_savefig(*args, **kwargs)
         
-        if chart_type == "flow":
-            self._plot_flow_chart(ax, self.current_flow_df)
-        elif chart_type == "share":
-            self._plot_share_chart(ax, self.current_share_df)
-        elif chart_type == "change":
-            self._plot_change_chart(ax, self.current_change_df)
-        elif chart_type == "moving_average":
-            ma_period = self.ma_period_var.get()
-            self._plot_moving_average_chart(ax, self.current_flow_df, ma_period)
-        elif chart_type == "stacked_bar":
-            self._plot_stacked_bar_chart(ax, self.current_flow_df)
-        elif chart_type == "flow_per_stock":
-            if self.current_flow_per_stock_df is not None and not self.current_flow_per_stock_df.empty:
-                self._plot_flow_per_stock_chart(ax, self.current_flow_per_stock_df)
-            else:
-                ax.text(0.5, 0.5, "データが取得できませんでした", 
-                       ha='center', va='center', transform=ax.transAxes, fontsize=14)
-        elif chart_type == "flow_per_stock_ma":
-            if self.current_flow_per_stock_df is not None and not self.current_flow_per_stock_df.empty:
-                ma_period = self.ma_period_var.get()
-                self._plot_moving_average_chart(ax, self.current_flow_per_stock_df, ma_period, is_per_stock=True)
-            else:
-                ax.text(0.5, 0.5, "データが取得できませんでした", 
-                       ha='center', va='center', transform=ax.transAxes, fontsize=14)
+        self._chart_fig.savefig = savefig_high_dpi
         
         # Canvasに配置
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._chart_canvas = FigureCanvasTkAgg(self._chart_fig, chart_frame)
+        self._chart_canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # ツールバーを追加
-        toolbar = NavigationToolbar2Tk(canvas, chart_frame)
-        toolbar.update()
+        self._chart_toolbar = NavigationToolbar2Tk(self._chart_canvas, chart_frame)
     
-    def _plot_flow_chart(self, ax, df: pd.DataFrame):
-        """売買代金の線グラフを描画"""
-        # 主要セクターのみを表示（上位10セクター）
-        if len(df.columns) > 10:
-            # 最新日の売買代金でソート
-            latest_values = df.iloc[-1].sort_values(ascending=False)
-            top_sectors = latest_values.head(10).index.tolist()
-            df_plot = df[top_sectors]
-        else:
-            df_plot = df
+    def _plot_flow_chart(self, ax, df: pd.DataFrame) -> Dict[str, object]:
+        """売買代金の線グラフを描画（戻り値: _add_sector_linesの描画結果）"""
+        # 主要セクターのみを表示（最新日の売買代金の上位10セクター）
+        _, df_plot = self._get_top_sectors(df)
         
-        # 線グラフを描画
-        for sector in df_plot.columns:
-            ax.plot(df_plot.index, df_plot[sector], label=sector, linewidth=2, marker='o', markersize=3)
+        # 線グラフを描画（全セクターを1つのLineCollectionで描画）
+        lines = _add_sector_lines(ax, df_plot, linewidth=2, markersize=3)
         
         ax.set_xlabel("日付", fontsize=10)
         ax.set_ylabel("売買代金（億円）", fontsize=10)
         ax.set_title("セクター別売買代金推移", fontsize=12, fontweight="bold")
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
+        ax.legend(handles=lines['handles'], bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3)
         
         # 日付フォーマット（毎月1日）
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(bymonthday=1))
+        ax.xaxis.set_major_formatter(_MONTH_FORMATTER)
+        ax.xaxis.set_major_locator(_MONTH_LOCATOR)
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
-        fig = ax.get_figure()
-        if fig:
-            fig.tight_layout()
+        return lines
     
     def _plot_share_chart(self, ax, df: pd.DataFrame):
         """シェアの積み上げエリアチャートを描画"""
-        # 主要セクターのみを表示（上位10セクター）
+        # 主要セクターのみを表示（最新日のシェアの上位10セクター）
+        top_sectors, df_plot = self._get_top_sectors(df)
         if len(df.columns) > 10:
-            # 最新日のシェアでソート
-            latest_values = df.iloc[-1].sort_values(ascending=False)
-            top_sectors = latest_values.head(10).index.tolist()
-            df_plot = df[top_sectors]
-            # その他を追加
-            df_plot['その他'] = df.drop(columns=top_sectors).sum(axis=1)
-        else:
-            df_plot = df
+            # その他を追加（全セクター合計 - 上位セクター合計、キャッシュしたDataFrameは変更しない）
+            other = (
+                np.nansum(df.to_numpy(dtype=np.float64), axis=1)
+                - np.nansum(df_plot.to_numpy(dtype=np.float64), axis=1)
+            )
+            df_plot = df_plot.assign(**{'その他': other})
         
         # 積み上げエリアチャートを描画
         ax.stackplot(df_plot.index, *[df_plot[col] for col in df_plot.columns], labels=df_plot.columns, alpha=0.7)
@@ -789,78 +1481,71 @@ class MarketConditionsTab:
         ax.set_ylim(0, 100)
         
         # 日付フォーマット（毎月1日）
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(bymonthday=1))
+        ax.xaxis.set_major_formatter(_MONTH_FORMATTER)
+        ax.xaxis.set_major_locator(_MONTH_LOCATOR)
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-        
-        fig = ax.get_figure()
-        if fig:
-            fig.tight_layout()
     
-    def _plot_moving_average_chart(self, ax, df: pd.DataFrame, ma_period: int, is_per_stock: bool = False):
-        """移動平均の線グラフを描画"""
-        # 主要セクターのみを表示（上位10セクター）
-        if len(df.columns) > 10:
-            # 最新日の値でソート
-            latest_values = df.iloc[-1].sort_values(ascending=False)
-            top_sectors = latest_values.head(10).index.tolist()
-            df_plot = df[top_sectors]
-        else:
-            df_plot = df
+    def _plot_moving_average_chart(
+        self, ax, df: pd.DataFrame, ma_period: int, is_per_stock: bool = False
+    ) -> Tuple[Optional[Dict[str, object]], Dict[str, object]]:
+        """
+        移動平均の線グラフを描画
+        
+        Returns:
+            Tuple: (元データの線, 移動平均の線) それぞれ_add_sector_linesの描画結果
+                元データの線は_show_ma_raw_backgroundがFalseの場合None
+        """
+        # 主要セクターのみを表示（最新日の値の上位10セクター）
+        _, df_plot = self._get_top_sectors(df)
         
         # 移動平均を計算
-        df_ma = df_plot.rolling(window=ma_period, min_periods=1).mean()
+        df_ma = _rolling_mean(df_plot, ma_period)
         
-        # 元のデータを薄い線で表示（背景として）
-        for sector in df_plot.columns:
-            ax.plot(df_plot.index, df_plot[sector], label=None, linewidth=0.5, 
-                   alpha=0.2, color='gray')
+        # 元のデータを薄い線で表示（背景として、ほぼ見えないため3日おきに間引く）
+        raw_lines = None
+        if self._show_ma_raw_background:
+            raw_lines = _add_sector_lines(ax, df_plot.iloc[::3], linewidth=0.5, color='gray', alpha=0.2)
         
         # 移動平均を太い線で表示
-        for sector in df_ma.columns:
-            ax.plot(df_ma.index, df_ma[sector], label=sector, linewidth=2.5, 
-                   marker='o', markersize=2)
+        ma_lines = _add_sector_lines(ax, df_ma, linewidth=2.5, markersize=2)
         
         ax.set_xlabel("日付", fontsize=10)
         
         # Y軸ラベルとタイトルを設定
         if is_per_stock:
             ax.set_ylabel("1銘柄あたり売買代金（億円）", fontsize=10)
-            ax.set_title(f"セクター別1銘柄あたり売買代金推移（{ma_period}日移動平均）", fontsize=12, fontweight="bold")
         else:
             ax.set_ylabel("売買代金（億円）", fontsize=10)
-            ax.set_title(f"セクター別売買代金推移（{ma_period}日移動平均）", fontsize=12, fontweight="bold")
+        ax.set_title(_moving_average_title(ma_period, is_per_stock), fontsize=12, fontweight="bold")
         
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
+        ax.legend(handles=ma_lines['handles'], bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3)
         
         # 日付フォーマット（毎月1日）
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(bymonthday=1))
+        ax.xaxis.set_major_formatter(_MONTH_FORMATTER)
+        ax.xaxis.set_major_locator(_MONTH_LOCATOR)
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
-        fig = ax.get_figure()
-        if fig:
-            fig.tight_layout()
+        return raw_lines, ma_lines
     
-    def _plot_change_chart(self, ax, df: pd.DataFrame):
-        """前日比の棒グラフを描画"""
+    def _plot_change_chart(self, ax, df: pd.DataFrame) -> Optional[Dict[str, object]]:
+        """前日比の棒グラフを描画（戻り値: 最新日・表示セクター・棒の辞書、データなしはNone）"""
         # 最新日のデータのみを表示
         if df.empty:
-            return
+            return None
         
         latest_date = df.index[-1]
-        latest_data = df.loc[latest_date].sort_values(ascending=False)
+        latest_data = df.iloc[-1]
         
-        # 上位10セクターのみ表示
-        if len(latest_data) > 10:
-            latest_data = latest_data.head(10)
+        # 上位10セクターのみ表示（前日比の降順）
+        latest_data = latest_data.iloc[_top_n_positions(latest_data.to_numpy(dtype=np.float64), 10)]
         
         # 色を設定（プラスは緑、マイナスは赤）
-        colors = ['green' if x >= 0 else 'red' for x in latest_data.values]
+        values = latest_data.to_numpy()
+        colors = np.where(values >= 0, 'green', 'red')
         
         # 棒グラフを描画
-        ax.barh(latest_data.index, latest_data.values, color=colors, alpha=0.7)
+        bars = ax.barh(latest_data.index, values, color=colors, alpha=0.7)
         
         ax.set_xlabel("前日比（%）", fontsize=10)
         ax.set_ylabel("セクター", fontsize=10)
@@ -868,90 +1553,94 @@ class MarketConditionsTab:
         ax.grid(True, alpha=0.3, axis='x')
         ax.axvline(x=0, color='black', linewidth=0.8, linestyle='--')
         
-        fig = ax.get_figure()
-        fig.tight_layout()
+        return {'date': latest_date, 'sectors': latest_data.index.tolist(), 'bars': bars}
     
     def _plot_stacked_bar_chart(self, ax, df: pd.DataFrame):
         """積み上げ棒グラフを描画"""
-        # 主要セクターのみを表示（上位10セクター）
-        if len(df.columns) > 10:
-            # 最新日の売買代金でソート
-            latest_values = df.iloc[-1].sort_values(ascending=False)
-            top_sectors = latest_values.head(10).index.tolist()
-            df_plot = df[top_sectors].copy()
-            # その他を追加
-            other_sectors = [col for col in df.columns if col not in top_sectors]
-            if other_sectors:
-                df_plot['その他'] = df[other_sectors].sum(axis=1)
-        else:
-            df_plot = df.copy()
-        
-        # データをサンプリング（日数が多い場合は間引く）
-        # 最大100日分に制限
-        if len(df_plot) > 100:
-            step = len(df_plot) // 100
-            df_plot = df_plot.iloc[::step]
+        # 主要セクターのみを表示（最新日の売買代金の上位10セクター）
+        # 絞り込んだDataFrameは作らず、全セクターの配列から列を選んで (セクター数, 日数) の配列として扱う
+        top_sectors, _ = self._get_top_sectors(df)
+        columns = list(top_sectors)
+        values = df.to_numpy(dtype=np.float64)
+        Y = values[:, df.columns.get_indexer(top_sectors)].T
+        # その他を追加（全セクター合計 - 上位セクター合計）
+        if len(df.columns) > len(top_sectors):
+            other = np.nansum(values, axis=1) - np.nansum(Y, axis=0)
+            Y = np.vstack([Y, other])
+            columns.append('その他')
         
         # 日付を数値に変換（matplotlibの日付処理用）
-        dates = mdates.date2num(df_plot.index.to_pydatetime())
+        dates = mdates.date2num(df.index.to_numpy())
+        
+        # データを間引く（日数が多い場合は最大100日分に制限）
+        # 合計売買代金の山・谷が残るよう、LTTB法で残す日を選ぶ
+        if len(dates) > 100:
+            keep = _lttb_indices(dates, Y.sum(axis=0), 100)
+            dates = dates[keep]
+            Y = Y[:, keep]
         
         # 各セクターの色を設定
-        colors = plt.cm.tab10(range(len(df_plot.columns)))
+        colors = _TAB10_COLORS[:len(columns)]
         
         # 積み上げ棒グラフを描画
-        bottom = None
-        for i, sector in enumerate(df_plot.columns):
-            values = df_plot[sector].values
-            ax.bar(dates, values, bottom=bottom, label=sector, color=colors[i], alpha=0.8, width=1.0)
-            if bottom is None:
-                bottom = values.copy()
-            else:
-                bottom += values
+        # 各棒の下端は前のセクターまでの累積和とし、全セクター・全日付の棒を1つのPolyCollectionで描画
+        n_sectors, n_days = Y.shape
+        bottoms = np.zeros_like(Y)
+        np.cumsum(Y[:-1], axis=0, out=bottoms[1:])
+        tops = bottoms + Y
+        
+        left = np.tile(dates - 0.5, n_sectors)  # 幅1日・中央揃え（ax.bar(width=1.0)と同じ位置）
+        right = left + 1.0
+        bottom_flat = bottoms.ravel()
+        top_flat = tops.ravel()
+        verts = np.stack([
+            np.column_stack([left, bottom_flat]),
+            np.column_stack([left, top_flat]),
+            np.column_stack([right, top_flat]),
+            np.column_stack([right, bottom_flat]),
+        ], axis=1)
+        bars = PolyCollection(
+            verts, facecolors=np.repeat(colors, n_days, axis=0), edgecolors='none', alpha=0.8
+        )
+        bars.sticky_edges.y.append(0)  # ax.barと同様に0の下に余白を付けない
+        ax.add_collection(bars)
+        ax.autoscale_view()
         
         ax.set_xlabel("日付", fontsize=10)
         ax.set_ylabel("売買代金（億円）", fontsize=10)
         ax.set_title("セクター別売買代金推移（積み上げ棒グラフ）", fontsize=12, fontweight="bold")
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
+        legend_handles = [
+            plt.Rectangle((0, 0), 1, 1, facecolor=color, alpha=0.8, label=sector)
+            for color, sector in zip(colors, columns)
+        ]
+        ax.legend(handles=legend_handles, bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3, axis='y')
         
         # 日付フォーマット（毎月1日）
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(bymonthday=1))
+        ax.xaxis.set_major_formatter(_MONTH_FORMATTER)
+        ax.xaxis.set_major_locator(_MONTH_LOCATOR)
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-        
-        fig = ax.get_figure()
-        if fig:
-            fig.tight_layout()
     
-    def _plot_flow_per_stock_chart(self, ax, df: pd.DataFrame):
-        """1銘柄あたり売買代金の線グラフを描画"""
-        # 主要セクターのみを表示（上位10セクター）
-        if len(df.columns) > 10:
-            # 最新日の1銘柄あたり売買代金でソート
-            latest_values = df.iloc[-1].sort_values(ascending=False)
-            top_sectors = latest_values.head(10).index.tolist()
-            df_plot = df[top_sectors]
-        else:
-            df_plot = df
+    def _plot_flow_per_stock_chart(self, ax, df: pd.DataFrame) -> Dict[str, object]:
+        """1銘柄あたり売買代金の線グラフを描画（戻り値: _add_sector_linesの描画結果）"""
+        # 主要セクターのみを表示（最新日の1銘柄あたり売買代金の上位10セクター）
+        _, df_plot = self._get_top_sectors(df)
         
-        # 線グラフを描画
-        for sector in df_plot.columns:
-            ax.plot(df_plot.index, df_plot[sector], label=sector, linewidth=2, marker='o', markersize=3)
+        # 線グラフを描画（全セクターを1つのLineCollectionで描画）
+        lines = _add_sector_lines(ax, df_plot, linewidth=2, markersize=3)
         
         ax.set_xlabel("日付", fontsize=10)
         ax.set_ylabel("1銘柄あたり売買代金（億円）", fontsize=10)
         ax.set_title("セクター別1銘柄あたり売買代金推移", fontsize=12, fontweight="bold")
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
+        ax.legend(handles=lines['handles'], bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3)
         
         # 日付フォーマット（毎月1日）
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(bymonthday=1))
+        ax.xaxis.set_major_formatter(_MONTH_FORMATTER)
+        ax.xaxis.set_major_locator(_MONTH_LOCATOR)
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
-        fig = ax.get_figure()
-        if fig:
-            fig.tight_layout()
+        return lines
     
     def _on_fetch_financial_metrics(self):
         """財務指標取得ボタンがクリックされたときの処理"""
@@ -973,16 +1662,15 @@ class MarketConditionsTab:
         if not result:
             return
         
+        self.fetch_metrics_button.config(state="disabled")
+        
         def fetch_in_thread():
             try:
                 self._analyzing = True
                 self.status_var.set("状態: 財務指標を取得中...")
                 
-                from src.data_collector.financial_metrics_manager import FinancialMetricsManager
-                from src.screening.jpx400_manager import JPX400Manager
-                
-                financial_metrics_manager = FinancialMetricsManager(self.db_path)
-                jpx400_manager = JPX400Manager()
+                financial_metrics_manager = self._get_financial_metrics_manager()
+                jpx400_manager = self._get_jpx400_manager()
                 
                 # JPX400銘柄リストを取得
                 symbols = jpx400_manager.load_symbols()
@@ -1044,6 +1732,7 @@ class MarketConditionsTab:
                 self.parent.after(0, lambda: self.status_var.set("状態: エラーが発生しました"))
             finally:
                 self._analyzing = False
+                self.parent.after(0, lambda: self.fetch_metrics_button.config(state="normal"))
         
         thread = threading.Thread(target=fetch_in_thread, daemon=True)
         thread.start()
@@ -1051,8 +1740,7 @@ class MarketConditionsTab:
     def _update_last_fetch_time_display(self):
         """最新実施日時の表示を更新"""
         try:
-            from src.data_collector.financial_metrics_manager import FinancialMetricsManager
-            financial_metrics_manager = FinancialMetricsManager(self.db_path)
+            financial_metrics_manager = self._get_financial_metrics_manager()
             last_fetch_time = financial_metrics_manager.get_last_fetch_time()
             
             if last_fetch_time:
@@ -1075,11 +1763,8 @@ class MarketConditionsTab:
                 self.status_var.set("状態: 財務指標を取得中（自動）...")
                 print(f"[自動実行] 財務指標取得を開始します（{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}）")
                 
-                from src.data_collector.financial_metrics_manager import FinancialMetricsManager
-                from src.screening.jpx400_manager import JPX400Manager
-                
-                financial_metrics_manager = FinancialMetricsManager(self.db_path)
-                jpx400_manager = JPX400Manager()
+                financial_metrics_manager = self._get_financial_metrics_manager()
+                jpx400_manager = self._get_jpx400_manager()
                 
                 # JPX400銘柄リストを取得
                 symbols = jpx400_manager.load_symbols()
@@ -1118,19 +1803,10 @@ class MarketConditionsTab:
         """セクター別銘柄数を再読み込み"""
         def load_in_thread():
             try:
-                from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
-                
-                analyzer = SectorFlowAnalyzer(self.db_path)
-                sector_count_df = analyzer.get_sector_stock_counts()
-                sector_industry_count_df = analyzer.get_sector_industry_stock_counts()
-                
-                # セクター別銘柄数をアコーディオン表示
-                if not sector_count_df.empty and not sector_industry_count_df.empty:
-                    self.parent.after(0, lambda: self._display_sector_counts_with_industries(
-                        sector_count_df, sector_industry_count_df
-                    ))
-                elif not sector_count_df.empty:
-                    self.parent.after(0, lambda: self._display_sector_counts(sector_count_df))
+                analyzer = self._get_analyzer()
+                # 財務指標更新後の再読み込みのため、キャッシュを破棄してから取得
+                self._sector_counts_cache = None
+                self._load_and_display_sector_counts(analyzer)
             except Exception as e:
                 print(f"[ERROR] セクター別銘柄数再読み込みエラー: {e}")
                 import traceback
@@ -1191,77 +1867,73 @@ class MarketConditionsTab:
         if children:
             return
         
-        # セクター・業種別データを取得
         try:
-            from src.sentiment.sector_flow_analyzer import SectorFlowAnalyzer
-            analyzer = SectorFlowAnalyzer(self.db_path)
-            sector_industry_count_df = analyzer.get_sector_industry_stock_counts()
-            sector_industry_metrics_df = analyzer.get_sector_industry_financial_metrics()
-            
-            # セクター・業種別財務指標を辞書に変換
-            sector_industry_metrics_dict = {}
-            if not sector_industry_metrics_df.empty:
-                for _, row in sector_industry_metrics_df.iterrows():
-                    key = (row['sector'], row['industry'])
-                    sector_industry_metrics_dict[key] = {
-                        'avg_per': row.get('avg_per'),
-                        'avg_pbr': row.get('avg_pbr'),
-                        'avg_dividend_yield': row.get('avg_dividend_yield'),
-                        'avg_roa': row.get('avg_roa'),
-                        'avg_roe': row.get('avg_roe'),
-                        'avg_net_cash_ratio': row.get('avg_net_cash_ratio')
-                    }
-                # デバッグ情報
-                print(f"[DEBUG] _expand_sector: セクター・業種別財務指標辞書: {len(sector_industry_metrics_dict)}件")
-                # サンプルデータを表示
-                if sector_industry_metrics_dict:
-                    sample_key = list(sector_industry_metrics_dict.keys())[0]
-                    sample_data = sector_industry_metrics_dict[sample_key]
-                    print(f"[DEBUG] _expand_sector: サンプルデータ ({sample_key}): {sample_data}")
-            else:
-                print("[DEBUG] _expand_sector: セクター・業種別財務指標データが空です")
-            
-            # 財務指標をフォーマットする関数
-            def format_metric(value, is_percent=False, decimals=2):
-                if value is None or pd.isna(value):
-                    return "-"
-                if is_percent:
-                    return f"{value:.{decimals}f}%"
-                else:
-                    return f"{value:.{decimals}f}"
-            
-            # 該当セクターの業種を取得
-            sector_industries = sector_industry_count_df[
-                sector_industry_count_df['sector'] == sector
-            ].sort_values('count', ascending=False)
+            # 業種行はセクター別銘柄数の表示（初回・分析実行・再読み込み）時に作成済みのため、
+            # 展開時はDBにアクセスせず辞書から取り出すだけ
+            industry_rows = self._sector_industry_rows.get(sector, [])
             
             # 業種行を追加
-            for _, row in sector_industries.iterrows():
-                industry = row['industry']
-                industry_count = int(row['count'])
-                industry_metrics = sector_industry_metrics_dict.get((sector, industry), {})
-                
-                self.sector_count_tree.insert(
-                    sector_item_id, "end",
-                    text="",  # ツリーアイコン用
-                    values=(
-                        "",
-                        industry,
-                        f"{industry_count:,}",
-                            format_metric(industry_metrics.get('avg_per'), decimals=1),
-                            format_metric(industry_metrics.get('avg_pbr'), decimals=2),
-                            format_metric(industry_metrics.get('avg_dividend_yield'), is_percent=True, decimals=2),
-                            format_metric(industry_metrics.get('avg_roa'), is_percent=True, decimals=2),
-                            format_metric(industry_metrics.get('avg_roe'), is_percent=True, decimals=2),
-                            format_metric(industry_metrics.get('avg_net_cash_ratio'), decimals=4)
-                    ),
-                    tags=("industry",)
-                )
+            self._suspend_count_tree_scroll()
+            try:
+                for values in industry_rows:
+                    self.sector_count_tree.insert(
+                        sector_item_id, "end",
+                        text="",  # ツリーアイコン用
+                        values=values,
+                        tags=("industry",)
+                    )
+            finally:
+                self._resume_count_tree_scroll()
         except Exception as e:
             print(f"[ERROR] セクター展開エラー: {e}")
             import traceback
             traceback.print_exc()
     
+    def _build_sector_industry_rows(
+        self,
+        sector_industry_count_df: pd.DataFrame,
+        sector_industry_metrics_df: pd.DataFrame
+    ) -> Dict[str, List[tuple]]:
+        """
+        業種行のTreeview用valuesをセクターごとに作成
+        
+        Returns:
+            Dict[str, List[tuple]]: セクター名 -> 業種行のvalues（銘柄数の降順）
+        """
+        # セクター・業種別財務指標を辞書に変換（値は表示用にフォーマット済みの文字列）
+        sector_industry_metrics_dict = {}
+        if not sector_industry_metrics_df.empty:
+            formatted_metrics_df = _format_avg_metrics(
+                sector_industry_metrics_df.reindex(columns=[*_AVG_METRIC_COLUMNS])
+            )
+            formatted_metrics_df.index = pd.MultiIndex.from_frame(
+                sector_industry_metrics_df[['sector', 'industry']]
+            )
+            # (セクター, 業種) -> {列名: 表示文字列}
+            sector_industry_metrics_dict = formatted_metrics_df.to_dict(orient='index')
+            print(f"[DEBUG] セクター・業種別財務指標辞書: {len(sector_industry_metrics_dict)}件")
+        else:
+            print("[DEBUG] セクター・業種別財務指標データが空です")
+        
+        # セクターごとに業種行を作成（銘柄数の降順）
+        sector_industry_rows: Dict[str, List[tuple]] = {}
+        sector_industries = sector_industry_count_df.sort_values(
+            ['sector', 'count'], ascending=[True, False], kind='stable'
+        )
+        for sector, group in sector_industries.groupby('sector', sort=False):
+            # 必要な列だけをタプルで取り出し、行ごとのSeries生成を避ける
+            sector_industry_rows[sector] = [
+                (
+                    "",
+                    industry,
+                    f"{int(industry_count):,}",
+                    *(sector_industry_metrics_dict.get((sector, industry), {}).get(col, "-")
+                      for col in _AVG_METRIC_COLUMNS)
+                )
+                for industry, industry_count in group[['industry', 'count']].itertuples(index=False, name=None)
+            ]
+        return sector_industry_rows
+    
     def _collapse_sector(self, sector_item_id: str):
         """セクター行を折りたたみ（業種を非表示）"""
         # 子アイテム（業種行）を削除
@@ -1330,11 +2002,17 @@ class MarketConditionsTab:
             try:
                 self.status_var.set(f"状態: {selected_sector} - {selected_industry}の銘柄一覧を読み込み中...")
                 
-                from src.data_collector.ohlcv_data_manager import OHLCVDataManager
-                from src.screening.jpx400_manager import JPX400Manager
+                # 同じセクター・業種を開き直した場合は、DBが更新されていなければ前回の結果を表示
+                cache_key = (selected_sector, selected_industry)
+                payload = self._get_cached_symbol_list(cache_key)
+                if payload is not None:
+                    self.parent.after(0, lambda: self._show_sector_symbols_window(*payload))
+                    self.status_var.set("状態: 待機中")
+                    return
+                mtime = self._get_db_mtime()
                 
-                ohlcv_manager = OHLCVDataManager(self.db_path)
-                jpx400_manager = JPX400Manager()
+                ohlcv_manager = self._get_ohlcv_manager()
+                jpx400_manager = self._get_jpx400_manager()
                 
                 # JPX400銘柄リストを取得
                 symbols = jpx400_manager.load_symbols()
@@ -1346,14 +2024,11 @@ class MarketConditionsTab:
                     ))
                     return
                 
-                # セクター情報と業種情報を一括取得
-                sectors_dict = ohlcv_manager.get_symbol_sectors(symbols)
-                industries_dict = ohlcv_manager.get_symbol_industries(symbols)
-                
-                # 選択したセクター・業種の銘柄を抽出
+                # 選択したセクターの銘柄をSQLで絞り込み、その銘柄の業種だけを取得して業種で抽出
+                sector_symbols = ohlcv_manager.get_symbols_by_sector(selected_sector, symbols)
+                industries_dict = ohlcv_manager.get_symbol_industries(sector_symbols)
                 sector_industry_symbols = [
-                    s for s in symbols 
-                    if sectors_dict.get(s) == selected_sector and industries_dict.get(s) == selected_industry
+                    s for s in sector_symbols if industries_dict.get(s) == selected_industry
                 ]
                 
                 if not sector_industry_symbols:
@@ -1364,73 +2039,50 @@ class MarketConditionsTab:
                     ))
                     return
                 
-                # 銘柄名を取得
-                symbol_names = ohlcv_manager.get_symbol_names(sector_industry_symbols)
+                financial_metrics_manager = self._get_financial_metrics_manager()
+                net_cash_ratio_manager = self._get_net_cash_ratio_manager()
                 
-                # データ統計を取得
-                symbol_stats = {}
-                for symbol in sector_industry_symbols:
-                    stats = ohlcv_manager.get_data_stats(symbol, timeframe="1d", source="yahoo")
-                    if stats:
-                        # 統計情報を初期化
-                        symbol_stats[symbol] = {
-                            'data_count': stats.get('total_count', 0),
-                            'first_date': stats.get('start_date'),
-                            'last_date': stats.get('end_date'),
-                            'last_updated_at': stats.get('last_updated_at'),
-                            'latest_price': None,
-                            'latest_volume': None,
-                            'sigma_value': None
-                        }
-                
-                # 最新出来高と現在株価、σ値を取得
+                # 銘柄名・データ統計・直近20日分のOHLCV・財務指標・NC比率は互いに独立しているため、
+                # それぞれ別スレッド（クエリごとに別接続）で同時に取得する
                 print(f"[セクター・業種銘柄一覧] 最新出来高と現在株価、σ値を取得中...")
-                for symbol in sector_industry_symbols:
-                    try:
-                        df_latest = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                            symbol=symbol,
-                            timeframe='1d',
-                            source='yahoo',
-                            include_temporary=True
-                        )
-                        if not df_latest.empty and symbol in symbol_stats:
-                            latest_row = df_latest.iloc[-1]
-                            symbol_stats[symbol]['latest_price'] = float(latest_row['close'])
-                            symbol_stats[symbol]['latest_volume'] = int(latest_row['volume']) if pd.notna(latest_row['volume']) else None
-                            
-                            # σ値計算（過去20日の出来高から）
-                            if len(df_latest) >= 5 and symbol_stats[symbol]['latest_volume'] is not None:
-                                volumes = df_latest['volume'].tail(20)
-                                if len(volumes) >= 5:
-                                    mean_volume = volumes.mean()
-                                    std_volume = volumes.std()
-                                    if std_volume > 0:
-                                        sigma_value = (symbol_stats[symbol]['latest_volume'] - mean_volume) / std_volume
-                                        symbol_stats[symbol]['sigma_value'] = float(sigma_value)
-                    except Exception as e:
-                        print(f"[セクター・業種銘柄一覧] {symbol}の最新データ取得エラー: {e}")
-                
-                # 財務指標を取得
-                from src.data_collector.financial_metrics_manager import FinancialMetricsManager
-                financial_metrics_manager = FinancialMetricsManager(self.db_path)
-                financial_metrics_dict = financial_metrics_manager.get_financial_metrics_batch(sector_industry_symbols)
+                executor = _get_query_executor()
+                names_future = executor.submit(ohlcv_manager.get_symbol_names, sector_industry_symbols)
+                stats_future = executor.submit(
+                    ohlcv_manager.get_data_stats_batch,
+                    sector_industry_symbols, timeframe="1d", source="yahoo"
+                )
+                latest_ohlcv_future = executor.submit(
+                    ohlcv_manager.get_latest_ohlcv_batch,
+                    sector_industry_symbols, timeframe='1d', source='yahoo', window=20
+                )
+                financial_metrics_future = executor.submit(
+                    financial_metrics_manager.get_financial_metrics_batch, sector_industry_symbols
+                )
+                net_cash_ratio_future = executor.submit(
+                    net_cash_ratio_manager.get_net_cash_ratio_batch, sector_industry_symbols
+                )
+                symbol_names = names_future.result()
+                stats_dict = stats_future.result()
+                latest_ohlcv_dict = latest_ohlcv_future.result()
+                financial_metrics_dict = financial_metrics_future.result()
+                net_cash_ratio_dict = net_cash_ratio_future.result()
                 
-                # NC比率を取得
-                from src.data_collector.net_cash_ratio_manager import NetCashRatioManager
-                net_cash_ratio_manager = NetCashRatioManager(self.db_path)
-                net_cash_ratio_dict = net_cash_ratio_manager.get_net_cash_ratio_batch(sector_industry_symbols)
+                # データ統計と最新出来高・現在株価・σ値・RSI（直近20日分から全銘柄まとめて計算）
+                symbol_stats = _build_symbol_stats_frame(stats_dict, sector_industry_symbols, latest_ohlcv_dict)
                 
                 # ウィンドウを表示
-                self.parent.after(0, lambda: self._show_sector_symbols_window(
+                payload = (
                     f"{selected_sector} - {selected_industry}", 
                     sector_industry_symbols, 
                     symbol_names, 
-                    sectors_dict, 
+                    selected_sector, 
                     industries_dict, 
                     symbol_stats,
                     financial_metrics_dict,
                     net_cash_ratio_dict
-                ))
+                )
+                self._store_symbol_list(cache_key, mtime, payload)
+                self.parent.after(0, lambda: self._show_sector_symbols_window(*payload))
                 
                 self.status_var.set("状態: 待機中")
                 
@@ -1455,11 +2107,17 @@ class MarketConditionsTab:
             try:
                 self.status_var.set(f"状態: {selected_sector}の銘柄一覧を読み込み中...")
                 
-                from src.data_collector.ohlcv_data_manager import OHLCVDataManager
-                from src.screening.jpx400_manager import JPX400Manager
+                # 同じセクターを開き直した場合は、DBが更新されていなければ前回の結果を表示
+                cache_key = (selected_sector, None)
+                payload = self._get_cached_symbol_list(cache_key)
+                if payload is not None:
+                    self.parent.after(0, lambda: self._show_sector_symbols_window(*payload))
+                    self.status_var.set("状態: 待機中")
+                    return
+                mtime = self._get_db_mtime()
                 
-                ohlcv_manager = OHLCVDataManager(self.db_path)
-                jpx400_manager = JPX400Manager()
+                ohlcv_manager = self._get_ohlcv_manager()
+                jpx400_manager = self._get_jpx400_manager()
                 
                 # JPX400銘柄リストを取得
                 symbols = jpx400_manager.load_symbols()
@@ -1471,11 +2129,8 @@ class MarketConditionsTab:
                     ))
                     return
                 
-                # セクター情報を一括取得
-                sectors_dict = ohlcv_manager.get_symbol_sectors(symbols)
-                
-                # 選択したセクターの銘柄を抽出
-                sector_symbols = [s for s, sector in sectors_dict.items() if sector == selected_sector]
+                # 選択したセクターの銘柄を抽出（絞り込みはSQL側で実行）
+                sector_symbols = ohlcv_manager.get_symbols_by_sector(selected_sector, symbols)
                 
                 if not sector_symbols:
                     self.parent.after(0, lambda: messagebox.showinfo(
@@ -1485,69 +2140,45 @@ class MarketConditionsTab:
                     ))
                     return
                 
-                # 銘柄名を取得
-                symbol_names = ohlcv_manager.get_symbol_names(sector_symbols)
+                financial_metrics_manager = self._get_financial_metrics_manager()
+                net_cash_ratio_manager = self._get_net_cash_ratio_manager()
                 
-                # 業種情報を取得
-                industries_dict = ohlcv_manager.get_symbol_industries(sector_symbols)
-                
-                # データ統計を取得
-                symbol_stats = {}
-                for symbol in sector_symbols:
-                    stats = ohlcv_manager.get_data_stats(symbol, timeframe="1d", source="yahoo")
-                    if stats:
-                        # 統計情報を初期化
-                        symbol_stats[symbol] = {
-                            'data_count': stats.get('total_count', 0),
-                            'first_date': stats.get('start_date'),
-                            'last_date': stats.get('end_date'),
-                            'last_updated_at': stats.get('last_updated_at'),
-                            'latest_price': None,
-                            'latest_volume': None,
-                            'sigma_value': None
-                        }
-                
-                # 最新出来高と現在株価、σ値を取得
+                # 銘柄名・業種・データ統計・直近20日分のOHLCV・財務指標・NC比率は互いに独立しているため、
+                # それぞれ別スレッド（クエリごとに別接続）で同時に一括取得する
                 print(f"[セクター銘柄一覧] 最新出来高と現在株価、σ値を取得中...")
-                for symbol in sector_symbols:
-                    try:
-                        df_latest = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                            symbol=symbol,
-                            timeframe='1d',
-                            source='yahoo',
-                            include_temporary=True
-                        )
-                        if not df_latest.empty and symbol in symbol_stats:
-                            latest_row = df_latest.iloc[-1]
-                            symbol_stats[symbol]['latest_price'] = float(latest_row['close'])
-                            symbol_stats[symbol]['latest_volume'] = int(latest_row['volume']) if pd.notna(latest_row['volume']) else None
-                            
-                            # σ値計算（過去20日の出来高から）
-                            if len(df_latest) >= 5 and symbol_stats[symbol]['latest_volume'] is not None:
-                                volumes = df_latest['volume'].tail(20)
-                                if len(volumes) >= 5:
-                                    mean_volume = volumes.mean()
-                                    std_volume = volumes.std()
-                                    if std_volume > 0:
-                                        sigma_value = (symbol_stats[symbol]['latest_volume'] - mean_volume) / std_volume
-                                        symbol_stats[symbol]['sigma_value'] = float(sigma_value)
-                    except Exception as e:
-                        print(f"[セクター銘柄一覧] {symbol}の最新データ取得エラー: {e}")
-                
-                # 財務指標を取得
-                from src.data_collector.financial_metrics_manager import FinancialMetricsManager
-                financial_metrics_manager = FinancialMetricsManager(self.db_path)
-                financial_metrics_dict = financial_metrics_manager.get_financial_metrics_batch(sector_symbols)
+                executor = _get_query_executor()
+                names_future = executor.submit(ohlcv_manager.get_symbol_names, sector_symbols)
+                industries_future = executor.submit(ohlcv_manager.get_symbol_industries, sector_symbols)
+                stats_future = executor.submit(
+                    ohlcv_manager.get_data_stats_batch,
+                    sector_symbols, timeframe="1d", source="yahoo"
+                )
+                latest_ohlcv_future = executor.submit(
+                    ohlcv_manager.get_latest_ohlcv_batch,
+                    sector_symbols, timeframe='1d', source='yahoo', window=20
+                )
+                financial_metrics_future = executor.submit(
+                    financial_metrics_manager.get_financial_metrics_batch, sector_symbols
+                )
+                net_cash_ratio_future = executor.submit(
+                    net_cash_ratio_manager.get_net_cash_ratio_batch, sector_symbols
+                )
+                symbol_names = names_future.result()
+                industries_dict = industries_future.result()
+                stats_dict = stats_future.result()
+                latest_ohlcv_dict = latest_ohlcv_future.result()
+                financial_metrics_dict = financial_metrics_future.result()
+                net_cash_ratio_dict = net_cash_ratio_future.result()
                 
-                # NC比率を取得
-                from src.data_collector.net_cash_ratio_manager import NetCashRatioManager
-                net_cash_ratio_manager = NetCashRatioManager(self.db_path)
-                net_cash_ratio_dict = net_cash_ratio_manager.get_net_cash_ratio_batch(sector_symbols)
+                # データ統計と最新出来高・現在株価・σ値・RSI（直近20日分から全銘柄まとめて計算）
+                symbol_stats = _build_symbol_stats_frame(stats_dict, sector_symbols, latest_ohlcv_dict)
                 
                 # ウィンドウを表示
-                self.parent.after(0, lambda: self._show_sector_symbols_window(
-                    selected_sector, sector_symbols, symbol_names, sectors_dict, industries_dict, symbol_stats, financial_metrics_dict, net_cash_ratio_dict
-                ))
+                payload = (
+                    selected_sector, sector_symbols, symbol_names, selected_sector, industries_dict, symbol_stats, financial_metrics_dict, net_cash_ratio_dict
+                )
+                self._store_symbol_list(cache_key, mtime, payload)
+                self.parent.after(0, lambda: self._show_sector_symbols_window(*payload))
                 
                 self.status_var.set("状態: 待機中")
                 
@@ -1571,27 +2202,14 @@ class MarketConditionsTab:
         sector: str,
         symbols: List[str],
         symbol_names: Dict[str, str],
-        sectors_dict: Dict[str, str],
+        sector_name: str,
         industries_dict: Dict[str, str],
-        symbol_stats: Dict[str, dict],
+        symbol_stats: pd.DataFrame,
         financial_metrics_dict: Optional[Dict[str, Dict[str, Optional[float]]]] = None,
         net_cash_ratio_dict: Optional[Dict[str, Optional[float]]] = None
     ):
         """セクター別銘柄一覧を別ウィンドウで表示"""
         
-        # RSI計算関数
-        def calc_rsi(series, period: int = 14):
-            """RSIを計算"""
-            if len(series) < period + 1:
-                return None
-            delta = series.diff()
-            gain = delta.clip(lower=0)
-            loss = -delta.clip(upper=0)
-            avg_gain = gain.rolling(period).mean()
-            avg_loss = loss.rolling(period).mean()
-            rs = avg_gain / avg_loss.replace(0, pd.NA)
-            rsi = 100 - (100 / (1 + rs))
-            return float(rsi.iloc[-1]) if pd.notna(rsi.iloc[-1]) else None
         window = tk.Toplevel(self.parent)
         window.title(f"{sector} - 銘柄一覧")
         window.geometry("1200x700")
@@ -1620,7 +2238,7 @@ class MarketConditionsTab:
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal")
         h_scrollbar.pack(side="bottom", fill="x")
         
-        columns = ("銘柄コード", "銘柄名", "セクター", "業種", "PER", "PBR", "利回り", "ROA", "ROE", "NC比率", "RSI", "データ件数", "最初の日付", "最後の日付", "現在株価", "最新出来高", "σ値")
+        columns = _SECTOR_SYMBOL_COLUMNS
         tree = ttk.Treeview(
             tree_frame,
             columns=columns,
@@ -1653,148 +2271,168 @@ class MarketConditionsTab:
         tree.column("最新出来高", width=120, anchor="e")
         tree.column("σ値", width=120, anchor="e")
         
+        # 見出しの基本テキスト（ソート矢印なし）
+        base_headings = {col: col for col in columns}
+        base_headings["σ値"] = "出来高σ(20日)"
+        
         for col in columns:
-            tree.heading(col, text=col)
+            tree.heading(col, text=base_headings[col])
+        
+        # ソート機能（ソート方向はPython側で保持し、見出しテキストを読み戻さない）
+        sort_state = {col: False for col in columns}
+        
+        # 数値列のソート用の値（アイテムID -> 数値）。表示文字列を再パースしないために挿入時に保持する
+        numeric_sort_values: Dict[str, Dict[str, Optional[float]]] = {
+            col: {} for col in (
+                "PER", "PBR", "利回り", "ROA", "ROE", "NC比率", "RSI",
+                "データ件数", "現在株価", "最新出来高", "σ値"
+            )
+        }
+        # 文字列列のソート用の値（アイテムID -> 表示文字列）。ソートのたびにTreeviewから読み出さない
+        text_sort_values: Dict[str, Dict[str, str]] = {}
         
-        # ソート機能
-        sort_state = {}
+        # 現在のソート列と方向（分割挿入の途中でソートされた場合に、最後の挿入後に並べ直すため）
+        current_sort = {'column': None, 'reverse': False}
         
         def sort_treeview(column):
-            reverse = sort_state.get(column, False)
+            reverse = sort_state[column]
             sort_state[column] = not reverse
-            
-            items = [(tree.set(item, column), item) for item in tree.get_children('')]
-            
-            if column in ["現在株価", "σ値", "データ件数", "最新出来高", "PER", "PBR", "利回り", "ROA", "ROE", "NC比率", "RSI"]:
-                def sort_key(x):
-                    try:
-                        val = x[0].replace('σ', '').replace('+', '').replace(',', '').replace('N/A', '0').strip()
-                        return float(val)
-                    except (ValueError, TypeError):
-                        return float('inf') if reverse else float('-inf')
-                items.sort(key=sort_key, reverse=reverse)
+            current_sort['column'] = column
+            current_sort['reverse'] = reverse
+            apply_sort(column, reverse)
+        
+        def apply_sort(column, reverse):
+            if column in numeric_sort_values:
+                # 値がない行は昇順・降順どちらでも末尾に配置
+                missing = float('-inf') if reverse else float('inf')
+                values_by_item = numeric_sort_values[column]
+                items = []
+                for item in tree.get_children(''):
+                    value = values_by_item.get(item)
+                    items.append((missing if value is None else value, item))
+                items.sort(key=lambda x: x[0], reverse=reverse)
             else:
+                values_by_item = text_sort_values[column]
+                items = [(values_by_item[item], item) for item in tree.get_children('')]
                 items.sort(key=lambda x: x[0], reverse=reverse)
             
+            # 既に正しい位置にある行は移動しない（移動に合わせて現在の並びも追従させる）
+            current = list(tree.get_children(''))
             for index, (val, item) in enumerate(items):
-                tree.move(item, '', index)
+                if current[index] != item:
+                    current.remove(item)
+                    current.insert(index, item)
+                    tree.move(item, '', index)
             
+            indicator = " ▲" if reverse else " ▼"
             for col in columns:
                 if col == column:
-                    indicator = " ▲" if reverse else " ▼"
-                    tree.heading(col, text=tree.heading(col)['text'].rstrip(" ▲▼") + indicator)
+                    tree.heading(col, text=base_headings[col] + indicator)
                 else:
-                    tree.heading(col, text=tree.heading(col)['text'].rstrip(" ▲▼"))
+                    tree.heading(col, text=base_headings[col])
         
-        tree.heading("銘柄コード", text="銘柄コード", command=lambda: sort_treeview("銘柄コード"))
-        tree.heading("セクター", text="セクター", command=lambda: sort_treeview("セクター"))
-        tree.heading("現在株価", text="現在株価", command=lambda: sort_treeview("現在株価"))
-        tree.heading("σ値", text="出来高σ(20日)", command=lambda: sort_treeview("σ値"))
+        # 全列の見出しクリックでソート（数値列・文字列列ともに挿入時に保持した値で並べ替える）
+        for col in columns:
+            tree.heading(col, command=partial(sort_treeview, col))
         
         # データを挿入
+        # 銘柄ごとの値をDataFrameにまとめ、列単位で一括フォーマットしてからTreeviewへ挿入する
         sorted_symbols = sorted(symbols)
-        for symbol in sorted_symbols:
-            name = symbol_names.get(symbol, "（未取得）")
-            sector = sectors_dict.get(symbol, "（未取得）")
-            industry = industries_dict.get(symbol, "（未取得）")
-            stats = symbol_stats.get(symbol, {})
-            
-            data_count = stats.get('data_count', 0)
-            # first_dateとstart_dateの両方をチェック（symbol_statsにはfirst_dateとして保存されている）
-            first_date = stats.get('first_date') or stats.get('start_date', '')
-            
-            # 最後の日付の処理（DB銘柄一覧と同じ形式）
-            # last_dateとend_dateの両方をチェック（symbol_statsにはlast_dateとして保存されている）
-            if stats.get('last_updated_at'):
-                try:
-                    dt = pd.to_datetime(stats['last_updated_at'])
-                    last_date = dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    date_str = str(stats['last_updated_at'])
-                    if 'T' in date_str:
-                        date_str = date_str.replace('T', ' ')
-                    last_date = date_str[:16] if len(date_str) >= 16 else date_str
-            elif stats.get('last_date') or stats.get('end_date'):
-                last_date_value = stats.get('last_date') or stats.get('end_date')
-                try:
-                    dt = pd.to_datetime(last_date_value)
-                    last_date = dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    date_str = str(last_date_value)
-                    if 'T' in date_str:
-                        date_str = date_str.replace('T', ' ')
-                    last_date = date_str[:16] if len(date_str) >= 16 else date_str
-            else:
-                last_date = "N/A"
-            
-            # 最初の日付のフォーマット
-            if first_date:
-                try:
-                    first_date = pd.to_datetime(first_date).strftime('%Y-%m-%d')
-                except:
-                    first_date = str(first_date)[:10] if len(str(first_date)) >= 10 else str(first_date)
-            else:
-                first_date = "N/A"
-            
-            # 現在株価、最新出来高、σ値
-            latest_price = f"{stats['latest_price']:.2f}" if stats.get('latest_price') is not None else "N/A"
-            latest_volume = f"{stats['latest_volume']:,}" if stats.get('latest_volume') is not None else "N/A"
-            sigma_str = f"{stats['sigma_value']:+.2f}σ" if stats.get('sigma_value') is not None else "N/A"
-            
-            # 財務指標を取得
-            metrics = financial_metrics_dict.get(symbol, {}) if financial_metrics_dict else {}
-            per = f"{metrics.get('per', 0):.1f}" if metrics.get('per') is not None else "-"
-            pbr = f"{metrics.get('pbr', 0):.2f}" if metrics.get('pbr') is not None else "-"
-            dividend_yield = f"{metrics.get('dividend_yield', 0):.2f}%" if metrics.get('dividend_yield') is not None else "-"
-            roa = f"{metrics.get('roa', 0):.2f}%" if metrics.get('roa') is not None else "-"
-            roe = f"{metrics.get('roe', 0):.2f}%" if metrics.get('roe') is not None else "-"
-            
-            # NC比率を取得
-            net_cash_ratio = net_cash_ratio_dict.get(symbol) if net_cash_ratio_dict else None
-            nc_ratio_str = f"{net_cash_ratio:.4f}" if net_cash_ratio is not None else "-"
-            
-            # RSIを計算
-            rsi_value = None
-            rsi_str = "N/A"
+        stats_df = symbol_stats.reindex(sorted_symbols)
+        metrics_df = pd.DataFrame.from_dict(financial_metrics_dict or {}, orient='index').reindex(
+            index=sorted_symbols, columns=_SYMBOL_METRICS_COLUMNS
+        )
+        nc_ratios = pd.Series(net_cash_ratio_dict or {}, dtype=float).reindex(sorted_symbols)
+        
+        # RSI（読み込み時に直近20日分の終値から計算済み）
+        rsi_series = stats_df['rsi']
+        
+        first_dates = _blank_to_na(stats_df['first_date'])
+        # 最後の日付（DB銘柄一覧と同じ形式）: last_updated_at → last_date の順に採用
+        last_dates = _blank_to_na(stats_df['last_updated_at']).fillna(_blank_to_na(stats_df['last_date']))
+        data_counts = stats_df['data_count'].fillna(0).astype(int)
+        
+        display_df = pd.DataFrame({
+            'name': stats_df.index.map(symbol_names).fillna("（未取得）"),
+            'sector': sector_name,
+            'industry': stats_df.index.map(industries_dict).fillna("（未取得）"),
+            'per': _format_number_column(metrics_df['per'], '%.1f', "-"),
+            'pbr': _format_number_column(metrics_df['pbr'], '%.2f', "-"),
+            'dividend_yield': _format_number_column(metrics_df['dividend_yield'], '%.2f%%', "-"),
+            'roa': _format_number_column(metrics_df['roa'], '%.2f%%', "-"),
+            'roe': _format_number_column(metrics_df['roe'], '%.2f%%', "-"),
+            'nc_ratio': _format_number_column(nc_ratios, '%.4f', "-"),
+            'rsi': _format_number_column(rsi_series, '%.2f', "N/A"),
+            'data_count': data_counts.map('{:,}'.format),
+            'first_date': _format_datetime_column(first_dates, '%Y-%m-%d', 10),
+            'last_date': _format_datetime_column(last_dates, '%Y-%m-%d %H:%M', 16),
+            'latest_price': _format_number_column(stats_df['latest_price'], '%.2f', "N/A"),
+            'latest_volume': _format_thousands_column(stats_df['latest_volume'], "N/A"),
+            'sigma': _format_number_column(stats_df['sigma_value'], '%+.2fσ', "N/A"),
+        }, index=stats_df.index)
+        
+        # 50行ずつ挿入し、残りはイベントループに制御を戻してから挿入する（先頭の行から表示・操作できる）
+        # 挿入中はスクロールバーへの通知を止め、TclのinsertコマンドをTreeview.insertの引数変換を通さず直接呼び出す
+        # （iidは行番号から割り当て、Tk側での一意なID生成を省く）
+        rows = list(display_df.itertuples(index=True, name=None))
+        item_ids = [f"r{i}" for i in range(len(rows))]
+        tk_call = tree.tk.call
+        widget = tree._w
+        chunk_size = 50
+        progress_label = None
+        if len(rows) > chunk_size:
+            progress_label = ttk.Label(header_frame, text="")
+            progress_label.pack(side="right")
+        
+        def insert_chunk(start: int):
             try:
-                from src.data_collector.ohlcv_data_manager import OHLCVDataManager
-                ohlcv_manager = OHLCVDataManager(self.db_path)
-                df_rsi = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                    symbol=symbol,
-                    timeframe='1d',
-                    source='yahoo',
-                    include_temporary=True
-                )
-                if not df_rsi.empty and len(df_rsi) >= 15:  # 14日分のデータ + 1日
-                    close_series = df_rsi['close']
-                    rsi_value = calc_rsi(close_series, period=14)
-                    if rsi_value is not None:
-                        rsi_str = f"{rsi_value:.2f}"
-            except Exception as e:
-                # エラーが発生した場合はN/Aのまま
-                pass
-            
-            tree.insert("", "end", values=(
-                symbol,
-                name,
-                sector,
-                industry,
-                per,
-                pbr,
-                dividend_yield,
-                roa,
-                roe,
-                nc_ratio_str,
-                rsi_str,  # RSI
-                f"{data_count:,}" if data_count > 0 else "0",
-                first_date,
-                last_date,
-                latest_price,
-                latest_volume,
-                sigma_str
-            ))
-        
-        # ダブルクリックでチャート表示
+                if not window.winfo_exists():
+                    return
+                tree.configure(yscrollcommand="", xscrollcommand="")
+                end = min(start + chunk_size, len(rows))
+                for i in range(start, end):
+                    tk_call(widget, "insert", "", "end", "-id", item_ids[i], "-values", rows[i])
+                tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+            except tk.TclError:
+                # 挿入中にウィンドウが閉じられた場合
+                return
+            if end < len(rows):
+                progress_label.config(text=f"{end}/{len(rows)}件表示")
+                window.after(0, insert_chunk, end)
+                return
+            if progress_label is not None:
+                progress_label.destroy()
+            # 挿入中に見出しがクリックされていた場合、後から追加した行も含めて同じ条件で並べ直す
+            if current_sort['column'] is not None:
+                apply_sort(current_sort['column'], current_sort['reverse'])
+        
+        insert_chunk(0)
+        
+        # 数値列のソート用の値を保持（欠損はNone）
+        numeric_columns = {
+            "PER": metrics_df['per'],
+            "PBR": metrics_df['pbr'],
+            "利回り": metrics_df['dividend_yield'],
+            "ROA": metrics_df['roa'],
+            "ROE": metrics_df['roe'],
+            "NC比率": nc_ratios,
+            "RSI": rsi_series,
+            "データ件数": data_counts,
+            "現在株価": stats_df['latest_price'],
+            "最新出来高": stats_df['latest_volume'],
+            "σ値": stats_df['sigma_value'],
+        }
+        for col, values in numeric_columns.items():
+            values = pd.to_numeric(values, errors='coerce').astype(object)
+            numeric_sort_values[col] = dict(zip(item_ids, values.where(values.notna(), None).tolist()))
+        # 文字列列は挿入した表示値をそのままソート用に保持（1列目は銘柄コード＝インデックス）
+        for col, values in zip(columns, [display_df.index] + [display_df[c] for c in display_df.columns]):
+            if col not in numeric_sort_values:
+                text_sort_values[col] = dict(zip(item_ids, [str(v) for v in values]))
+        
+        # ダブルクリックでチャート表示（マネージャーはタブで共有しているものを使い、クリックごとに作成しない）
+        ohlcv_manager = self._get_ohlcv_manager()
+        
         def on_double_click(event):
             selection = tree.selection()
             if selection:
@@ -1804,11 +2442,7 @@ class MarketConditionsTab:
                 
                 # チャート表示
                 try:
-                    from src.gui.chart_window import ChartWindow
-                    from src.data_collector.ohlcv_data_manager import OHLCVDataManager
-                    
-                    ohlcv_manager = OHLCVDataManager(self.db_path)
-                    ChartWindow(window, symbol, symbol_name, ohlcv_manager)
+                    _get_chart_window_class()(window, symbol, symbol_name, ohlcv_manager)
                 except Exception as e:
                     import traceback
                     error_detail = traceback.format_exc()
@@ -1819,7 +2453,8 @@ class MarketConditionsTab:
         tree.bind("<Double-1>", on_double_click)
         
         # 右クリックメニュー（株探・バフェット・コードへのリンク）
-        context_menu = tk.Menu(window, tearoff=0)
+        # 初回の右クリック時に作成する
+        context_menu = None
         
         def open_kabutan(event):
             """株探で開く"""
@@ -1841,13 +2476,16 @@ class MarketConditionsTab:
         
         def show_context_menu(event):
             """右クリックメニューを表示"""
+            nonlocal context_menu
             item = tree.identify_row(event.y)
             if item:
                 tree.selection_set(item)
+                if context_menu is None:
+                    context_menu = tk.Menu(window, tearoff=0)
+                    context_menu.add_command(label="株探で開く", command=partial(open_kabutan, None))
+                    context_menu.add_command(label="バフェット・コードで開く", command=partial(open_buffett_code, None))
                 context_menu.post(event.x_root, event.y_root)
         
-        context_menu.add_command(label="株探で開く", command=lambda: open_kabutan(None))
-        context_menu.add_command(label="バフェット・コードで開く", command=lambda: open_buffett_code(None))
         tree.bind("<Button-3>", show_context_menu)  # Windows/Linux
         tree.bind("<Button-2>", show_context_menu)  # Mac
         
@@ -9,12 +9,174 @@ This software is licensed under the MIT License.
 See LICENSE file for details.
 """
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 from typing import List, Dict, Optional, Callable
 import webbrowser
 
+import numpy as np
+
+from src.data_collector.ohlcv_data_manager import OHLCVDataManager
+from src.utils.indicators import latest_volume_sigmas, latest_rsis
+
+# ゴールデンクロス列の表示（_golden_cross_codesのコード順）
+_GOLDEN_CROSS_LABELS = ("-", "クロス中", "直近GC")
+_NO_CROSS: Dict = {}
+
+# Treeviewに行をまとめて挿入するTclの無名関数（各行の1列目＝銘柄コードをタグにする）
+_TCL_INSERT_ROWS = '{w rows} {foreach row $rows {$w insert {} end -values $row -tags [list [lindex $row 0]]}}'
+
+# 乖離率を表示する移動平均線
+_MA_KEYS = ('ma5', 'ma25', 'ma75', 'ma200')
+
+# 結果一覧の数値列（1銘柄1レコード、値がない場合はNaN）
+# price/volume: スクリーニング実施時の価格・出来高, current_price/current_volume: 最新の価格・出来高
+_RESULT_COLUMNS_DTYPE = np.dtype([
+    ('price', 'f8'), ('volume', 'f8'), ('current_price', 'f8'), ('current_volume', 'f8'),
+    ('volume_sigma', 'f8'),
+    ('per', 'f8'), ('pbr', 'f8'), ('dividend_yield', 'f8'), ('roa', 'f8'), ('roe', 'f8'),
+    ('net_cash_ratio', 'f8'), ('rsi', 'f8'),
+    ('ma5_dev', 'f8'), ('ma25_dev', 'f8'), ('ma75_dev', 'f8'), ('ma200_dev', 'f8'),
+])
+
+# DB問い合わせ用の共有スレッドプール（スレッドは最初の問い合わせ時に作成される）
+# スクリーニングの実行スレッドと結果表示の両方から使うため、実行ごとにプールを作らない
+_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="screening_query")
+
+
+def _split_symbol_metadata(metadata: Dict[str, dict]) -> tuple:
+    """get_symbol_metadata_batchの結果を銘柄名・セクター・業種の辞書に分ける（値がない銘柄は含めない）"""
+    return tuple(
+        {symbol: info[key] for symbol, info in metadata.items() if info[key]}
+        for key in ('name', 'sector', 'industry')
+    )
+
+
+def _volume_sigmas(
+    symbols: List[str],
+    volume_windows: List[np.ndarray],
+    latest_volumes: Optional[List[Optional[float]]] = None,
+    min_count: int = 5
+) -> Dict[str, Optional[float]]:
+    """
+    銘柄ごとの直近出来高から、最新出来高の出来高σ値を全銘柄まとめて計算
+    
+    計算はsrc.utils.indicators.latest_volume_sigmasで行い、結果を銘柄コードごとの辞書にします。
+    
+    Args:
+        symbols: 銘柄コードのリスト
+        volume_windows: symbolsと同じ順の直近出来高（古い順、データがない銘柄は空配列）
+        latest_volumes: symbolsと同じ順の最新出来高（Noneの場合は直近出来高の最後の値）
+        min_count: 計算に必要な最小件数
+    
+    Returns:
+        Dict[str, Optional[float]]: 銘柄コードをキー、σ値を値とする辞書
+            件数が足りない、標準偏差が0、最新出来高がない銘柄はNone
+    """
+    sigmas = latest_volume_sigmas(volume_windows, latest_volumes, min_count)
+    return dict(zip(symbols, np.where(np.isnan(sigmas), None, sigmas).tolist()))
+
+
+def _ma_deviations(results: List[Dict], prices: List[float]) -> np.ndarray:
+    """
+    移動平均線（5/25/75/200日）からの乖離率（%）を全銘柄まとめて計算
+    
+    乖離率 = ((株価 - 移動平均線) / 移動平均線) * 100
+    
+    Returns:
+        np.ndarray: (銘柄数, 4) の配列（移動平均線がない、または0以下の場合はNaN）
+    """
+    P = np.array(prices, dtype=np.float64)
+    M = np.array([
+        [np.nan if r.get(key) is None else r[key] for key in _MA_KEYS]
+        for r in results
+    ], dtype=np.float64).reshape(len(results), len(_MA_KEYS))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(M > 0, (P[:, None] - M) / M * 100, np.nan)
+
+
+def _result_columns(
+    results: List[Dict],
+    symbol_metadata: Dict[str, dict],
+    net_cash_ratio_dict: Optional[Dict[str, float]],
+    volume_sigmas: Dict[str, Optional[float]],
+    rsi_values: np.ndarray,
+    ma_deviations: np.ndarray,
+    latest_ohlcv_dict: Optional[Dict] = None
+) -> np.ndarray:
+    """
+    結果一覧の表示に使う数値を、銘柄ごとの辞書から列単位の構造化配列（_RESULT_COLUMNS_DTYPE）にまとめる
+    
+    Args:
+        results: スクリーニング結果リスト
+        symbol_metadata: get_symbol_metadata_batchの結果（財務指標を含む）
+        net_cash_ratio_dict: 銘柄コードをキー、ネットキャッシュ比率を値とする辞書
+        volume_sigmas: 結果にσ値がない場合に使う、銘柄コードをキーとするσ値の辞書
+        rsi_values: resultsと同じ順のRSI
+        ma_deviations: resultsと同じ順の移動平均線乖離率（銘柄数, 4）
+        latest_ohlcv_dict: 最新の価格・出来高を取る直近データ（Noneの場合はスクリーニング実施時の値）
+    
+    Returns:
+        np.ndarray: resultsと同じ順の構造化配列
+    """
+    nan = np.nan
+    net_cash_ratio_dict = net_cash_ratio_dict or {}
+    latest_ohlcv_dict = latest_ohlcv_dict or {}
+    
+    records = []
+    for result, rsi, devs in zip(results, rsi_values.tolist(), ma_deviations.tolist()):
+        symbol = result['symbol']
+        price = result['current_price']
+        volume = result.get('latest_volume')
+        volume = nan if volume is None else volume
+        df_latest = latest_ohlcv_dict.get(symbol)
+        if df_latest is not None:
+            current_price = df_latest['close'].iat[-1]
+            current_volume = df_latest['volume'].iat[-1]
+        else:
+            current_price = price
+            current_volume = volume
+        sigma = result.get('volume_sigma')
+        if sigma is None:
+            sigma = volume_sigmas.get(symbol)
+        metrics = symbol_metadata.get(symbol, {})
+        net_cash_ratio = net_cash_ratio_dict.get(symbol)
+        records.append((
+            price, volume, current_price, current_volume,
+            nan if sigma is None else sigma,
+            *(nan if metrics.get(key) is None else metrics[key]
+              for key in ('per', 'pbr', 'dividend_yield', 'roa', 'roe')),
+            nan if net_cash_ratio is None else net_cash_ratio,
+            rsi,
+            *devs,
+        ))
+    return np.array(records, dtype=_RESULT_COLUMNS_DTYPE)
+
+
+def _golden_cross_codes(results: List[Dict], key: str) -> bytearray:
+    """
+    ゴールデンクロスの判定結果を銘柄ごとのコード（_GOLDEN_CROSS_LABELSの添字）にまとめる
+    
+    0: クロスなし（判定していない場合を含む）, 1: クロス中, 2: 直近でクロス
+    """
+    codes = bytearray(len(results))
+    for i, result in enumerate(results):
+        cross = result.get(key) or _NO_CROSS
+        codes[i] = 2 if cross.get('just_crossed') else 1 if cross.get('has_crossed') else 0
+    return codes
+
+
+def _format_column(values: np.ndarray, fmt: str, missing: str) -> List[str]:
+    """数値の列をまとめて文字列に変換（fmtは%形式、NaNはmissingにする）"""
+    return np.where(np.isnan(values), missing, np.char.mod(fmt, values)).tolist()
+
+
+def _format_volume_column(values: np.ndarray) -> List[str]:
+    """出来高の列を3桁区切りの文字列に変換（%形式では区切れないため、NaNは"N/A"）"""
+    return ["N/A" if np.isnan(v) else f"{int(v):,}" for v in values.tolist()]
+
 
 class ScreeningUI:
     """スクリーニングUIを管理するクラス"""
@@ -40,6 +202,27 @@ class ScreeningUI:
         self.on_button_state_change = on_button_state_change
         self.on_chart_display = on_chart_display
         self._screening_running = False
+        # DBアクセスに使うマネージャー（初回使用時に作成して共有）
+        # 各マネージャーは呼び出しごとにDB接続を開くため、ワーカースレッドから共有して使える
+        self._ohlcv_manager: Optional[OHLCVDataManager] = None
+        self._net_cash_ratio_manager = None
+        self._managers_lock = threading.Lock()
+    
+    def _get_ohlcv_manager(self) -> OHLCVDataManager:
+        """OHLCVDataManagerを取得（初回のみ作成）"""
+        with self._managers_lock:
+            if self._ohlcv_manager is None:
+                self._ohlcv_manager = OHLCVDataManager(self.db_path)
+            return self._ohlcv_manager
+    
+    def _get_net_cash_ratio_manager(self):
+        """NetCashRatioManagerを取得（初回のみ作成）"""
+        with self._managers_lock:
+            if self._net_cash_ratio_manager is None:
+                # yfinanceを読み込むため、起動時ではなく初回使用時にimport
+                from src.data_collector.net_cash_ratio_manager import NetCashRatioManager
+                self._net_cash_ratio_manager = NetCashRatioManager(self.db_path)
+            return self._net_cash_ratio_manager
     
     def is_running(self) -> bool:
         """スクリーニング実行中かどうかを返す"""
@@ -104,25 +287,26 @@ class ScreeningUI:
                 self._screening_running = True
                 if self.on_button_state_change:
                     self.on_button_state_change(False)  # ボタンを無効化
-                self.status_var.set(f"状態: スクリーニング実行中... ({len(symbols)}銘柄)")
+                parent_window.after(0, lambda: self.status_var.set(f"状態: スクリーニング実行中... ({len(symbols)}銘柄)"))
                 
-                # JPX400スクリーニングを実行
+                # JPX400スクリーニングを実行（yfinanceを読み込むため、起動時ではなく実行時にimport）
                 from src.screening.jpx400_screener import JPX400Screener
                 screener = JPX400Screener(self.db_path)
                 
-                # 銘柄名、セクター、業種情報を事前に取得（効率化のため）
-                from src.data_collector.ohlcv_data_manager import OHLCVDataManager
-                ohlcv_manager = OHLCVDataManager(self.db_path)
-                symbol_names = ohlcv_manager.get_symbol_names(symbols)
-                symbol_sectors = ohlcv_manager.get_symbol_sectors(symbols)
-                symbol_industries = ohlcv_manager.get_symbol_industries(symbols)
+                # 銘柄名、セクター、業種情報はスクリーニングと並行して取得（SQLiteの待ち時間を重ねる）
+                ohlcv_manager = self._get_ohlcv_manager()
+                
+                metadata_future = _QUERY_EXECUTOR.submit(ohlcv_manager.get_symbol_metadata_batch, symbols)
                 
                 # 進捗コールバック関数
                 def progress_callback(symbol, current, total, result):
                     # 進捗表示の頻度を減らす（50銘柄ごと）
                     if current % 50 == 0 or current == 1 or current == total:
                         print(f"[スクリーニング] 進捗: {current}/{total}")
-                    self.status_var.set(f"状態: スクリーニング実行中... ({current}/{total})")
+                    # ステータス表示は10銘柄ごとに、メインスレッドで更新（Tkはワーカースレッドから操作しない）
+                    if current % 10 == 0 or current == 1 or current == total:
+                        status_text = f"状態: スクリーニング実行中... ({current}/{total})"
+                        parent_window.after(0, lambda: self.status_var.set(status_text))
                 
                 # screen_all()を使用して並列処理の恩恵を受ける
                 results = screener.screen_all(
@@ -141,6 +325,14 @@ class ScreeningUI:
                     use_macd_kd_filter=use_macd_kd_filter,
                     macd_kd_window=macd_kd_window
                 )
+                symbol_names, symbol_sectors, symbol_industries = _split_symbol_metadata(metadata_future.result())
+                
+                # 出来高σ値（スクリーニング時に読み込んだ直近20日分の出来高から全銘柄まとめて計算）
+                volume_sigmas = _volume_sigmas(
+                    [result['symbol'] for result in results],
+                    [np.asarray(result.get('recent_volumes', ()), dtype=np.float64) for result in results],
+                    [result.get('latest_volume') for result in results]
+                )
                 
                 # 銘柄名、セクター、業種、出来高σ値を追加
                 for result in results:
@@ -149,48 +341,34 @@ class ScreeningUI:
                     result['sector'] = symbol_sectors.get(symbol, '')
                     result['industry'] = symbol_industries.get(symbol, '')
                     # 出来高σ値を計算して追加（履歴保存用）
-                    try:
-                        import pandas as pd
-                        df_latest = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                            symbol=symbol,
-                            timeframe='1d',
-                            source='yahoo',
-                            include_temporary=True
-                        )
-                        if not df_latest.empty and len(df_latest) >= 5 and result.get('latest_volume') is not None:
-                            volumes = df_latest['volume'].tail(20)  # 過去20日
-                            if len(volumes) >= 5:
-                                mean_volume = volumes.mean()
-                                std_volume = volumes.std()
-                                if std_volume > 0:
-                                    sigma_value = (result['latest_volume'] - mean_volume) / std_volume
-                                    result['volume_sigma'] = float(sigma_value)
-                    except:
-                        pass
+                    if volume_sigmas[symbol] is not None:
+                        result['volume_sigma'] = volume_sigmas[symbol]
                 
                 print(f"[スクリーニング] 完了: {len(results)}銘柄が条件を満たしました")
                 
-                # スクリーニング履歴を保存
-                try:
-                    from src.screening.screening_history import ScreeningHistory
-                    history_manager = ScreeningHistory(self.db_path)
-                    conditions = {
-                        'check_condition1': check_condition1,
-                        'check_condition2': check_condition2,
-                        'check_condition3': check_condition3,
-                        'check_condition4': check_condition4,
-                        'check_condition5': check_condition5,
-                        'check_condition6': check_condition6,
-                        'check_golden_cross_5_25': check_golden_cross_5_25,
-                        'check_golden_cross_25_75': check_golden_cross_25_75,
-                        'check_golden_cross_5_200': check_golden_cross_5_200,
-                        'golden_cross_mode': golden_cross_mode,
-                        'use_macd_kd_filter': use_macd_kd_filter,
-                        'macd_kd_window': macd_kd_window
-                    }
-                    history_manager.save_history(results, conditions)
-                except Exception as e:
-                    print(f"[WARN] スクリーニング履歴の保存に失敗: {e}")
+                # スクリーニング履歴を保存（結果の表示を待たせないよう別スレッドで実行）
+                conditions = {
+                    'check_condition1': check_condition1,
+                    'check_condition2': check_condition2,
+                    'check_condition3': check_condition3,
+                    'check_condition4': check_condition4,
+                    'check_condition5': check_condition5,
+                    'check_condition6': check_condition6,
+                    'check_golden_cross_5_25': check_golden_cross_5_25,
+                    'check_golden_cross_25_75': check_golden_cross_25_75,
+                    'check_golden_cross_5_200': check_golden_cross_5_200,
+                    'golden_cross_mode': golden_cross_mode,
+                    'use_macd_kd_filter': use_macd_kd_filter,
+                    'macd_kd_window': macd_kd_window
+                }
+                
+                def save_history():
+                    try:
+                        from src.screening.screening_history import ScreeningHistory
+                        history_manager = ScreeningHistory(self.db_path)
+                        history_manager.save_history(results, conditions)
+                    except Exception as e:
+                        print(f"[WARN] スクリーニング履歴の保存に失敗: {e}")
                 
                 # 結果を新しいウィンドウで表示（メインスレッドで実行）
                 if results:
@@ -203,6 +381,10 @@ class ScreeningUI:
                 else:
                     print("[スクリーニング] 条件を満たす銘柄はありませんでした")
                     parent_window.after(0, lambda: messagebox.showinfo("スクリーニング結果", "条件を満たす銘柄はありませんでした。", parent=parent_window))
+                
+                # 結果の表示を予約してから保存を開始する
+                # デーモンスレッドにしないことで、アプリ終了時も保存が終わるまで待つ
+                threading.Thread(target=save_history).start()
             
             except Exception as e:
                 import traceback
@@ -219,7 +401,8 @@ class ScreeningUI:
                 self._screening_running = False
                 if self.on_button_state_change:
                     self.on_button_state_change(True)  # ボタンを有効化
-                self.status_var.set("状態: 待機中")
+                # 進捗表示の更新より後に実行されるよう、同じくメインスレッドで更新
+                parent_window.after(0, lambda: self.status_var.set("状態: 待機中"))
         
         # 別スレッドで実行
         thread = threading.Thread(target=screen_in_thread, daemon=True)
@@ -266,7 +449,7 @@ class ScreeningUI:
                 dt = datetime.fromisoformat(executed_at)
                 executed_at_str = dt.strftime("%Y/%m/%d %H:%M")
                 result_window.title(f"スクリーニング結果（履歴：{executed_at_str}）")
-            except:
+            except (ValueError, TypeError):
                 result_window.title("スクリーニング結果（履歴）")
         elif is_history:
             result_window.title("スクリーニング結果（履歴）")
@@ -356,8 +539,7 @@ class ScreeningUI:
         self._setup_treeview_columns(tree, columns, is_history)
         
         # 銘柄名とセクター情報を取得（履歴表示の場合は既存の値を使用）
-        from src.data_collector.ohlcv_data_manager import OHLCVDataManager
-        ohlcv_manager = OHLCVDataManager(self.db_path)
+        ohlcv_manager = self._get_ohlcv_manager()
         
         self._populate_treeview_data(tree, results, ohlcv_manager, is_history)
 
@@ -382,13 +564,27 @@ class ScreeningUI:
             summary_label.pack(side="left", padx=(12, 0))
         
         # ダブルクリックでチャート表示
-        def on_double_click(event):
-            item = tree.selection()[0] if tree.selection() else None
+        # 選択中の銘柄（選択が変わったときに1回だけTreeviewから読み込み、各操作ではTclに問い合わせない）
+        selected = {'symbol': None, 'name': None}
+        
+        def update_selected(item):
             if item:
-                symbol = tree.item(item)['tags'][0]
-                name = tree.item(item)['values'][1]
-                if self.on_chart_display:
-                    self.on_chart_display(result_window, symbol, name)
+                item_info = tree.item(item)
+                selected['symbol'] = item_info['tags'][0]
+                selected['name'] = item_info['values'][1]
+            else:
+                selected['symbol'] = None
+                selected['name'] = None
+        
+        def on_select(event):
+            selection = tree.selection()
+            update_selected(selection[0] if selection else None)
+        
+        tree.bind("<<TreeviewSelect>>", on_select)
+        
+        def on_double_click(event):
+            if selected['symbol'] and self.on_chart_display:
+                self.on_chart_display(result_window, selected['symbol'], selected['name'])
         
         tree.bind("<Double-1>", on_double_click)
         
@@ -397,18 +593,14 @@ class ScreeningUI:
         
         def open_kabutan(event):
             """株探で開く"""
-            item = tree.selection()[0] if tree.selection() else None
-            if item:
-                symbol = tree.item(item)['tags'][0]
-                url = f"https://kabutan.jp/stock/?code={symbol}"
+            if selected['symbol']:
+                url = f"https://kabutan.jp/stock/?code={selected['symbol']}"
                 webbrowser.open(url)
         
         def open_buffett_code(event):
             """バフェット・コードで開く"""
-            item = tree.selection()[0] if tree.selection() else None
-            if item:
-                symbol = tree.item(item)['tags'][0]
-                url = f"https://www.buffett-code.com/company/{symbol}/"
+            if selected['symbol']:
+                url = f"https://www.buffett-code.com/company/{selected['symbol']}/"
                 webbrowser.open(url)
         
         def show_context_menu(event):
@@ -416,6 +608,8 @@ class ScreeningUI:
             item = tree.identify_row(event.y)
             if item:
                 tree.selection_set(item)
+                # <<TreeviewSelect>>はイベントキュー経由で届くため、メニュー表示前に選択銘柄を更新しておく
+                update_selected(item)
                 context_menu.post(event.x_root, event.y_root)
         
         context_menu.add_command(label="株探で開く", command=lambda: open_kabutan(None))
@@ -518,258 +712,161 @@ class ScreeningUI:
     def _populate_treeview_data(self, tree, results, ohlcv_manager, is_history):
         """Treeviewにデータを追加"""
         symbol_list = [r['symbol'] for r in results]
-        
-        # 財務指標を取得
-        from src.data_collector.financial_metrics_manager import FinancialMetricsManager
-        financial_metrics_manager = FinancialMetricsManager(self.db_path)
-        financial_metrics_dict = financial_metrics_manager.get_financial_metrics_batch(symbol_list)
-        
-        # ネットキャッシュ比率を取得
-        from src.data_collector.net_cash_ratio_manager import NetCashRatioManager
-        net_cash_ratio_manager = NetCashRatioManager(self.db_path)
-        net_cash_ratio_dict = net_cash_ratio_manager.get_net_cash_ratio_batch(symbol_list)
-        
-        # RSI計算関数
-        def calc_rsi(series, period: int = 14):
-            """RSIを計算"""
-            import pandas as pd
-            if len(series) < period + 1:
-                return None
-            delta = series.diff()
-            gain = delta.clip(lower=0)
-            loss = -delta.clip(upper=0)
-            avg_gain = gain.rolling(period).mean()
-            avg_loss = loss.rolling(period).mean()
-            rs = avg_gain / avg_loss.replace(0, pd.NA)
-            rsi = 100 - (100 / (1 + rs))
-            return float(rsi.iloc[-1]) if pd.notna(rsi.iloc[-1]) else None
+        net_cash_ratio_manager = self._get_net_cash_ratio_manager()
+        
+        # 独立したDBの読み込みを並行して実行（SQLiteの待ち時間を重ねる）
+        # - 銘柄名・セクター・業種と財務指標（1回のクエリ）
+        # - ネットキャッシュ比率
+        # - 履歴表示の場合は、現在価格・最新出来高・出来高σ値・RSIの計算用に直近20日分のOHLCV
+        metadata_future = _QUERY_EXECUTOR.submit(ohlcv_manager.get_symbol_metadata_batch, symbol_list)
+        net_cash_ratio_future = _QUERY_EXECUTOR.submit(net_cash_ratio_manager.get_net_cash_ratio_batch, symbol_list)
+        latest_ohlcv_future = _QUERY_EXECUTOR.submit(
+            ohlcv_manager.get_latest_ohlcv_batch, symbol_list, timeframe='1d', source='yahoo', window=20
+        ) if is_history else None
+        symbol_metadata = metadata_future.result()
+        net_cash_ratio_dict = net_cash_ratio_future.result()
+        latest_ohlcv_dict = latest_ohlcv_future.result() if latest_ohlcv_future else None
+        db_names, db_sectors, db_industries = _split_symbol_metadata(symbol_metadata)
         
         if is_history:
-            # 履歴表示の場合は、resultに既に含まれている値を使用
+            # 履歴表示の場合は、resultに既に含まれている値を使用（空文字・Noneは未取得として表示）
             # 業種情報がない場合はデータベースから取得（フォールバック）
-            symbol_names = {r['symbol']: r.get('symbol_name', '（未取得）') for r in results}
-            symbol_sectors = {r['symbol']: r.get('sector', '（未取得）') for r in results}
-            symbol_industries = {r['symbol']: r.get('industry', '（未取得）') for r in results}
+            symbol_names = {r['symbol']: r.get('symbol_name') or '（未取得）' for r in results}
+            symbol_sectors = {r['symbol']: r.get('sector') or '（未取得）' for r in results}
+            symbol_industries = {r['symbol']: r.get('industry') or '（未取得）' for r in results}
             
-            # 業種情報がない銘柄がある場合は、データベースから取得
-            symbols_missing_industry = [s for s in symbol_list if not symbol_industries.get(s) or symbol_industries.get(s) == '（未取得）']
-            if symbols_missing_industry:
-                db_industries = ohlcv_manager.get_symbol_industries(symbols_missing_industry)
-                for symbol, industry in db_industries.items():
-                    if industry:
-                        symbol_industries[symbol] = industry
+            # 業種情報がない銘柄がある場合は、データベースの値を使用
+            for symbol in symbol_list:
+                if (not symbol_industries.get(symbol) or symbol_industries.get(symbol) == '（未取得）') and symbol in db_industries:
+                    symbol_industries[symbol] = db_industries[symbol]
         else:
-            # 通常のスクリーニング結果の場合は、最新のデータベースから取得
-            symbol_names = ohlcv_manager.get_symbol_names(symbol_list)
-            symbol_sectors = ohlcv_manager.get_symbol_sectors(symbol_list)
-            symbol_industries = ohlcv_manager.get_symbol_industries(symbol_list)
+            # 通常のスクリーニング結果の場合は、最新のデータベースの値を使用
+            symbol_names = db_names
+            symbol_sectors = db_sectors
+            symbol_industries = db_industries
         
-        # データを挿入
-        for result in results:
+        if is_history:
+            # σ値の基準は直近データの最後の出来高
+            volume_sigmas = _volume_sigmas(symbol_list, [
+                latest_ohlcv_dict[symbol]['volume'].to_numpy(dtype=np.float64)
+                if symbol in latest_ohlcv_dict else np.empty(0)
+                for symbol in symbol_list
+            ])
+            close_windows = [
+                latest_ohlcv_dict[symbol]['close'].to_numpy(dtype=np.float64)
+                if symbol in latest_ohlcv_dict else np.empty(0)
+                for symbol in symbol_list
+            ]
+        else:
+            # 通常のスクリーニング結果は、screen_in_threadで計算済みのσ値（result['volume_sigma']）と
+            # スクリーニング時に読み込んだ直近の終値を使う
+            volume_sigmas = {}
+            close_windows = [np.asarray(r.get('recent_closes', ()), dtype=np.float64) for r in results]
+        
+        # RSI（14日）を全銘柄まとめて計算
+        rsi_values = latest_rsis(close_windows)
+        
+        # 移動平均線乖離率を全銘柄まとめて計算
+        # 履歴表示時もスクリーニング実施時の価格（current_price）と移動平均線で計算する
+        ma_deviations = _ma_deviations(results, [r['current_price'] for r in results])
+        
+        # 表示する数値を列単位の配列にまとめ、行ループでは辞書を引かずにレコードから取り出す
+        columns = _result_columns(
+            results, symbol_metadata, net_cash_ratio_dict, volume_sigmas,
+            rsi_values, ma_deviations, latest_ohlcv_dict
+        )
+        
+        # 書式が固定の列は、行ループの前に列単位でまとめて文字列にする
+        per_strs = _format_column(columns['per'], '%.1f', '-')
+        pbr_strs = _format_column(columns['pbr'], '%.2f', '-')
+        dividend_yield_strs = _format_column(columns['dividend_yield'], '%.2f%%', '-')
+        roa_strs = _format_column(columns['roa'], '%.2f%%', '-')
+        roe_strs = _format_column(columns['roe'], '%.2f%%', '-')
+        net_cash_ratio_strs = _format_column(columns['net_cash_ratio'], '%.4f', '-')
+        rsi_strs = _format_column(columns['rsi'], '%.2f', 'N/A')
+        sigma_strs = _format_column(columns['volume_sigma'], '%+.2fσ', 'N/A')
+        ma5_strs, ma25_strs, ma75_strs, ma200_strs = (
+            _format_column(columns[f'{key}_dev'], '%+.2f', 'N/A') for key in _MA_KEYS
+        )
+        price_strs = _format_column(columns['price'], '%.2f', 'N/A')
+        current_price_strs = _format_column(columns['current_price'], '%.2f', 'N/A')
+        volume_strs = _format_volume_column(columns['volume'])
+        current_volume_strs = _format_volume_column(columns['current_volume'])
+        gc5_25_codes = _golden_cross_codes(results, 'golden_cross_5_25')
+        gc25_75_codes = _golden_cross_codes(results, 'golden_cross_25_75')
+        gc5_200_codes = _golden_cross_codes(results, 'golden_cross_5_200')
+        
+        # 行の値を先にすべて作成し（Tkの呼び出しなし）、その後まとめてTreeviewへ挿入する
+        rows = []
+        
+        for i, result in enumerate(results):
             symbol = result['symbol']
             # 銘柄名、セクター、業種を取得
             name = symbol_names.get(symbol, "（未取得）")
             sector = symbol_sectors.get(symbol, "（未取得）")
             industry = symbol_industries.get(symbol, "（未取得）")
             
-            # 財務指標を取得
-            metrics = financial_metrics_dict.get(symbol, {}) if financial_metrics_dict else {}
-            per = f"{metrics.get('per', 0):.1f}" if metrics.get('per') is not None else "-"
-            pbr = f"{metrics.get('pbr', 0):.2f}" if metrics.get('pbr') is not None else "-"
-            dividend_yield = f"{metrics.get('dividend_yield', 0):.2f}%" if metrics.get('dividend_yield') is not None else "-"
-            roa = f"{metrics.get('roa', 0):.2f}%" if metrics.get('roa') is not None else "-"
-            roe = f"{metrics.get('roe', 0):.2f}%" if metrics.get('roe') is not None else "-"
-            
-            # ネットキャッシュ比率を取得
-            net_cash_ratio = net_cash_ratio_dict.get(symbol) if net_cash_ratio_dict else None
-            net_cash_ratio_str = f"{net_cash_ratio:.4f}" if net_cash_ratio is not None else "-"
-            
-            # RSIを計算
-            rsi_value = None
-            rsi_str = "N/A"
-            try:
-                import pandas as pd
-                df_rsi = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                    symbol=symbol,
-                    timeframe='1d',
-                    source='yahoo',
-                    include_temporary=True
-                )
-                if not df_rsi.empty and len(df_rsi) >= 15:  # 14日分のデータ + 1日
-                    close_series = df_rsi['close']
-                    rsi_value = calc_rsi(close_series, period=14)
-                    if rsi_value is not None:
-                        rsi_str = f"{rsi_value:.2f}"
-            except Exception as e:
-                # エラーが発生した場合はN/Aのまま
-                pass
-            
-            # 価格と出来高の取得
-            if is_history:
-                # 履歴表示の場合は、スクリーニング実施時の値と最新の値を両方取得
-                sc_price = result['current_price']  # スクリーニング実施時の価格
-                sc_volume = result.get('latest_volume')  # スクリーニング実施時の出来高
-                sc_volume_str = f"{sc_volume:,}" if sc_volume is not None else "N/A"
-                perf1 = result.get("perf_day1_label", "N/A")
-                perf2 = result.get("perf_day2_label", "N/A")
-                perf3 = result.get("perf_day3_label", "N/A")
-                
-                # 最新の価格と出来高を取得
-                try:
-                    df_latest = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                        symbol=symbol,
-                        timeframe='1d',
-                        source='yahoo',
-                        include_temporary=True
-                    )
-                    if not df_latest.empty:
-                        latest_row = df_latest.iloc[-1]
-                        current_price = float(latest_row['close'])
-                        current_volume = int(latest_row['volume'])
-                    else:
-                        current_price = sc_price
-                        current_volume = sc_volume
-                except:
-                    current_price = sc_price
-                    current_volume = sc_volume
-                
-                current_volume_str = f"{current_volume:,}" if current_volume is not None else "N/A"
-                price = current_price  # 乖離率計算用
-                latest_volume = current_volume  # σ値計算用
-            else:
-                # 通常のスクリーニング結果の場合は、現在の値のみ
-                price = result['current_price']
-                latest_volume = result.get('latest_volume')
-                sc_price = None
-                sc_volume = None
-                sc_volume_str = None
-                current_price = price
-                current_volume = latest_volume
-                current_volume_str = f"{latest_volume:,}" if latest_volume is not None else "N/A"
-            
             is_temporary = result['is_temporary_close']
             status = "⚠️仮終値" if is_temporary == 1 else "✅正式"
             
-            # σ値を計算（履歴表示の場合は既存の値を使用、通常の場合は計算）
-            if is_history and result.get('volume_sigma') is not None:
-                # 履歴表示の場合は保存されているσ値を使用
-                sigma_str = f"{result['volume_sigma']:+.2f}σ"
-            else:
-                # 通常のスクリーニング結果の場合は計算
-                sigma_str = "N/A"
-                if latest_volume is not None:
-                    try:
-                        import pandas as pd
-                        df_latest = ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                            symbol=symbol,
-                            timeframe='1d',
-                            source='yahoo',
-                            include_temporary=True
-                        )
-                        if not df_latest.empty and len(df_latest) >= 5:
-                            volumes = df_latest['volume'].tail(20)  # 過去20日
-                            if len(volumes) >= 5:
-                                mean_volume = volumes.mean()
-                                std_volume = volumes.std()
-                                if std_volume > 0:
-                                    sigma_value = (latest_volume - mean_volume) / std_volume
-                                    sigma_str = f"{sigma_value:+.2f}σ"
-                    except Exception as e:
-                        # エラーが発生した場合はN/Aのまま
-                        pass
-            
-            # 乖離率を計算
-            # 履歴表示時はスクリーニング実施時の価格と移動平均線、通常時は現在価格と移動平均線
-            # 乖離率 = ((株価 - 移動平均線) / 移動平均線) * 100
-            if is_history:
-                # 履歴表示時はスクリーニング実施時の価格と移動平均線を使用
-                calc_price = sc_price
-            else:
-                # 通常時は現在価格を使用
-                calc_price = price
-            
-            def calc_deviation(ma_value):
-                if ma_value and ma_value > 0:
-                    return ((calc_price - ma_value) / ma_value) * 100
-                return None
-            
-            ma5_dev = calc_deviation(result.get('ma5'))
-            ma25_dev = calc_deviation(result.get('ma25'))
-            ma75_dev = calc_deviation(result.get('ma75'))
-            ma200_dev = calc_deviation(result.get('ma200'))
-            
-            ma5_str = f"{ma5_dev:+.2f}" if ma5_dev is not None else "N/A"
-            ma25_str = f"{ma25_dev:+.2f}" if ma25_dev is not None else "N/A"
-            ma75_str = f"{ma75_dev:+.2f}" if ma75_dev is not None else "N/A"
-            ma200_str = f"{ma200_dev:+.2f}" if ma200_dev is not None else "N/A"
-
-            gc5_25 = result.get("golden_cross_5_25", {})
-            gc25_75 = result.get("golden_cross_25_75", {})
-            gc5_200 = result.get("golden_cross_5_200", {})
-            gc5_25_str = "直近GC" if gc5_25.get("just_crossed") else "クロス中" if gc5_25.get("has_crossed") else "-"
-            gc25_75_str = "直近GC" if gc25_75.get("just_crossed") else "クロス中" if gc25_75.get("has_crossed") else "-"
-            gc5_200_str = "直近GC" if gc5_200.get("just_crossed") else "クロス中" if gc5_200.get("has_crossed") else "-"
-            
             # 履歴表示の場合は追加の列を含める
             if is_history:
-                tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        symbol,
-                        name,
-                        sector,
-                        industry,
-                        f"{sc_price:.2f}",  # SC時価格
-                        sc_volume_str,  # SC時出来高
-                        perf1,
-                        perf2,
-                        perf3,
-                        f"{current_price:.2f}",  # 現在価格
-                        current_volume_str,  # 最新出来高
-                        sigma_str,  # 出来高σ(20日)
-                        per,
-                        pbr,
-                        dividend_yield,
-                        roa,
-                        roe,
-                        net_cash_ratio_str,  # ネットキャッシュ比率
-                        rsi_str,  # RSI
-                        ma5_str,
-                        ma25_str,
-                        ma75_str,
-                        ma200_str
-                    ),
-                    tags=(symbol,)
-                )
+                rows.append((
+                    symbol,
+                    name,
+                    sector,
+                    industry,
+                    price_strs[i],  # SC時価格
+                    volume_strs[i],  # SC時出来高
+                    result.get("perf_day1_label", "N/A"),
+                    result.get("perf_day2_label", "N/A"),
+                    result.get("perf_day3_label", "N/A"),
+                    current_price_strs[i],  # 現在価格
+                    current_volume_strs[i],  # 最新出来高
+                    sigma_strs[i],  # 出来高σ(20日)
+                    per_strs[i],
+                    pbr_strs[i],
+                    dividend_yield_strs[i],
+                    roa_strs[i],
+                    roe_strs[i],
+                    net_cash_ratio_strs[i],  # ネットキャッシュ比率
+                    rsi_strs[i],  # RSI
+                    ma5_strs[i],
+                    ma25_strs[i],
+                    ma75_strs[i],
+                    ma200_strs[i]
+                ))
             else:
-                tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        symbol,
-                        name,
-                        sector,
-                        industry,
-                        f"{price:.2f}",
-                        current_volume_str,
-                        sigma_str,  # 出来高σ(20日)
-                        per,
-                        pbr,
-                        dividend_yield,
-                        roa,
-                        roe,
-                        net_cash_ratio_str,  # ネットキャッシュ比率
-                        rsi_str,  # RSI
-                        status,
-                        gc5_25_str,
-                        gc25_75_str,
-                        gc5_200_str,
-                        ma5_str,
-                        ma25_str,
-                        ma75_str,
-                        ma200_str
-                    ),
-                    tags=(symbol,)
-                )
+                rows.append((
+                    symbol,
+                    name,
+                    sector,
+                    industry,
+                    price_strs[i],
+                    current_volume_strs[i],
+                    sigma_strs[i],  # 出来高σ(20日)
+                    per_strs[i],
+                    pbr_strs[i],
+                    dividend_yield_strs[i],
+                    roa_strs[i],
+                    roe_strs[i],
+                    net_cash_ratio_strs[i],  # ネットキャッシュ比率
+                    rsi_strs[i],  # RSI
+                    status,
+                    _GOLDEN_CROSS_LABELS[gc5_25_codes[i]],
+                    _GOLDEN_CROSS_LABELS[gc25_75_codes[i]],
+                    _GOLDEN_CROSS_LABELS[gc5_200_codes[i]],
+                    ma5_strs[i],
+                    ma25_strs[i],
+                    ma75_strs[i],
+                    ma200_strs[i]
+                ))
+        
+        # 挿入中はスクロールバーへの通知を止め、全行をTcl側のループで1回の呼び出しで挿入する
+        # （行ごとにPythonからTclを呼ばない。値はTclのリストとして渡すため、エスケープは不要）
+        yscrollcommand = tree.cget("yscrollcommand")
+        xscrollcommand = tree.cget("xscrollcommand")
+        tree.configure(yscrollcommand="", xscrollcommand="")
+        tree.tk.call("apply", _TCL_INSERT_ROWS, tree._w, rows)
+        tree.configure(yscrollcommand=yscrollcommand, xscrollcommand=xscrollcommand)
 
@@ -18,7 +18,9 @@ import pandas as pd
 from datetime import datetime, date
 from typing import List, Dict, Optional
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 import os
 
 from src.data_collector.ohlcv_data_manager import OHLCVDataManager
@@ -72,7 +74,8 @@ class JPX400Screener:
                 },
                 "performance": {
                     "use_parallel": True,
-                    "max_workers": None
+                    "max_workers": None,
+                    "executor": "thread"
                 }
             }
         }
@@ -648,7 +651,8 @@ class JPX400Screener:
         check_golden_cross_5_200: bool = False,
         golden_cross_mode: str = 'just_crossed',  # 'just_crossed': 直近でクロス, 'has_crossed': クロス中
         use_macd_kd_filter: Optional[bool] = None,
-        macd_kd_window: Optional[int] = None
+        macd_kd_window: Optional[int] = None,
+        df_daily: Optional[pd.DataFrame] = None
     ) -> Optional[Dict]:
         """
         1銘柄をスクリーニング
@@ -670,18 +674,20 @@ class JPX400Screener:
                 - 'has_crossed': 現在クロスしている銘柄（既にクロス済みも含む）
             use_macd_kd_filter: MACD/KD近接フィルタを有効にするか（Noneなら設定ファイルの値）
             macd_kd_window: 近接判定の営業日幅（Noneなら設定ファイルの値）
+            df_daily: 取得済みの日足データ（Noneの場合はDBから取得）
             
         Returns:
             dict: スクリーニング結果（条件を満たす場合）、またはNone
         """
         try:
-            # DBから日足データを取得（仮終値フラグを含む）
-            df_daily = self.ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                symbol=symbol,
-                timeframe='1d',
-                source='yahoo',
-                include_temporary=True
-            )
+            if df_daily is None:
+                # DBから日足データを取得（仮終値フラグを含む）
+                df_daily = self.ohlcv_manager.get_ohlcv_data_with_temporary_flag(
+                    symbol=symbol,
+                    timeframe='1d',
+                    source='yahoo',
+                    include_temporary=True
+                )
             
             if df_daily.empty or len(df_daily) < 200:
                 # データが不足している場合、補完を試みる
@@ -705,47 +711,6 @@ class JPX400Screener:
             # 移動平均線を計算
             df_daily = self.calculate_moving_averages(df_daily)
 
-            # 設定値取得
-            screening_cfg = self.config.get("screening", {})
-            indicator_cfg = screening_cfg.get("indicators", {})
-            macd_cfg = indicator_cfg.get("macd", {})
-            stoch_cfg = indicator_cfg.get("stochastic", {})
-            proximity_cfg = screening_cfg.get("proximity", {})
-
-            # MACD/KDフィルタが有効な場合のみ計算（最適化）
-            macd_kd_filter_enabled = proximity_cfg.get("enable_macd_kd", True) if use_macd_kd_filter is None else use_macd_kd_filter
-            macd_kd_window_days = proximity_cfg.get("window_days", 3) if macd_kd_window is None else macd_kd_window
-
-            macd_signals = []
-            kd_signals = []
-            macd_kd_proximity_result = None
-            
-            if macd_kd_filter_enabled:
-                # MACD / Stochasticを計算（欠損はそのままにし、サイン判定時にスキップ）
-                df_daily = self._calculate_macd(df_daily, macd_cfg)
-                df_daily = self._calculate_stochastic(df_daily, stoch_cfg)
-
-                macd_signals = self._detect_macd_bullish_signals(df_daily)
-                kd_signals = self._detect_kd_bullish_signals(df_daily, stoch_cfg.get("oversold_threshold", 20))
-
-                latest_idx = len(df_daily) - 1
-                latest_macd = df_daily["macd"].iloc[-1]
-                latest_macd_signal = df_daily["macd_signal"].iloc[-1]
-                latest_k = df_daily["stoch_k"].iloc[-1]
-                latest_d = df_daily["stoch_d"].iloc[-1]
-                is_macd_bullish_now = pd.notna(latest_macd) and pd.notna(latest_macd_signal) and latest_macd > latest_macd_signal
-                is_kd_bullish_now = pd.notna(latest_k) and pd.notna(latest_d) and latest_k > latest_d
-                macd_kd_proximity_result = self._check_macd_kd_proximity(
-                    macd_signals,
-                    kd_signals,
-                    macd_kd_window_days,
-                    latest_idx,
-                    is_macd_bullish_now,
-                    is_kd_bullish_now
-                )
-                if not macd_kd_proximity_result["has_proximity"]:
-                    return None
-            
             # 条件をチェック（選択的に）
             condition1_result = True
             condition2_result = True
@@ -775,6 +740,12 @@ class JPX400Screener:
             if check_condition6:
                 condition6_result = self.check_condition6_ma200_upward(df_daily)
             
+            # 移動平均線の条件を満たさない銘柄は、ゴールデンクロス・MACD/KDの判定を行わずに除外
+            if not (condition1_result and condition2_result and
+                    condition3_result and condition4_result and
+                    condition5_result and condition6_result):
+                return None
+            
             # ゴールデンクロスをチェック
             if check_golden_cross_5_25:
                 golden_cross_5_25_result = self.check_golden_cross_5_25(df_daily)
@@ -803,68 +774,108 @@ class JPX400Screener:
                     if not golden_cross_5_200_result['has_crossed']:
                         return None
             
-            # 選択された条件をすべて満たす場合
-            if (condition1_result and condition2_result and 
-                condition3_result and condition4_result and 
-                condition5_result and condition6_result):
-                latest = df_daily.iloc[-1]
-                prev = df_daily.iloc[-2]
-                
-                result = {
-                    'symbol': symbol,
-                    'current_price': float(latest['close']),
-                    'latest_volume': int(latest['volume']) if 'volume' in latest and pd.notna(latest['volume']) else None,
-                    'is_temporary_close': int(latest.get('is_temporary_close', 0)),
-                    'ma5': float(latest['ma5']),
-                    'ma25': float(latest['ma25']),
-                    'ma75': float(latest['ma75']),
-                    'ma200': float(latest['ma200']),
-                    'condition1': condition1_result if check_condition1 else None,
-                    'condition2': condition2_result if check_condition2 else None,
-                    'latest_candle': {
-                        'open': float(latest['open']),
-                        'high': float(latest['high']),
-                        'low': float(latest['low']),
-                        'close': float(latest['close']),
-                        'is_positive': latest['close'] > latest['open']
-                    },
-                    'prev_candle': {
-                        'open': float(prev['open']),
-                        'high': float(prev['high']),
-                        'low': float(prev['low']),
-                        'close': float(prev['close']),
-                        'is_positive': prev['close'] > prev['open']
-                    },
-                    'macd': {
-                        'value': float(latest['macd']) if pd.notna(latest.get('macd')) else None,
-                        'signal': float(latest['macd_signal']) if pd.notna(latest.get('macd_signal')) else None,
-                        'hist': float(latest['macd_hist']) if pd.notna(latest.get('macd_hist')) else None,
-                        'last_bullish_cross_date': macd_signals[-1]['date'] if macd_signals else None
-                    },
-                    'stochastic': {
-                        'stoch_k': float(latest['stoch_k']) if pd.notna(latest.get('stoch_k')) else None,
-                        'stoch_d': float(latest['stoch_d']) if pd.notna(latest.get('stoch_d')) else None,
-                        'last_bullish_cross_date': kd_signals[-1]['date'] if kd_signals else None
-                    }
+            # 設定値取得
+            screening_cfg = self.config.get("screening", {})
+            indicator_cfg = screening_cfg.get("indicators", {})
+            macd_cfg = indicator_cfg.get("macd", {})
+            stoch_cfg = indicator_cfg.get("stochastic", {})
+            proximity_cfg = screening_cfg.get("proximity", {})
+
+            # MACD/KDフィルタが有効な場合のみ計算（最適化）
+            # 指標の計算とサイン検出は重いため、移動平均線とゴールデンクロスの条件を満たした銘柄のみ行う
+            macd_kd_filter_enabled = proximity_cfg.get("enable_macd_kd", True) if use_macd_kd_filter is None else use_macd_kd_filter
+            macd_kd_window_days = proximity_cfg.get("window_days", 3) if macd_kd_window is None else macd_kd_window
+
+            macd_signals = []
+            kd_signals = []
+            macd_kd_proximity_result = None
+            
+            if macd_kd_filter_enabled:
+                # MACD / Stochasticを計算（欠損はそのままにし、サイン判定時にスキップ）
+                df_daily = self._calculate_macd(df_daily, macd_cfg)
+                df_daily = self._calculate_stochastic(df_daily, stoch_cfg)
+
+                macd_signals = self._detect_macd_bullish_signals(df_daily)
+                kd_signals = self._detect_kd_bullish_signals(df_daily, stoch_cfg.get("oversold_threshold", 20))
+
+                latest_idx = len(df_daily) - 1
+                latest_macd = df_daily["macd"].iloc[-1]
+                latest_macd_signal = df_daily["macd_signal"].iloc[-1]
+                latest_k = df_daily["stoch_k"].iloc[-1]
+                latest_d = df_daily["stoch_d"].iloc[-1]
+                is_macd_bullish_now = pd.notna(latest_macd) and pd.notna(latest_macd_signal) and latest_macd > latest_macd_signal
+                is_kd_bullish_now = pd.notna(latest_k) and pd.notna(latest_d) and latest_k > latest_d
+                macd_kd_proximity_result = self._check_macd_kd_proximity(
+                    macd_signals,
+                    kd_signals,
+                    macd_kd_window_days,
+                    latest_idx,
+                    is_macd_bullish_now,
+                    is_kd_bullish_now
+                )
+                if not macd_kd_proximity_result["has_proximity"]:
+                    return None
+            
+            # 選択された条件をすべて満たした銘柄の結果を作成
+            latest = df_daily.iloc[-1]
+            prev = df_daily.iloc[-2]
+            
+            result = {
+                'symbol': symbol,
+                'current_price': float(latest['close']),
+                'latest_volume': int(latest['volume']) if 'volume' in latest and pd.notna(latest['volume']) else None,
+                # 出来高σ値・RSIの計算用に直近20日分の出来高・終値を保持（呼び出し側で日足データを読み直さない）
+                'recent_volumes': df_daily['volume'].to_numpy(dtype=float)[-20:].tolist(),
+                'recent_closes': df_daily['close'].to_numpy(dtype=float)[-20:].tolist(),
+                'is_temporary_close': int(latest.get('is_temporary_close', 0)),
+                'ma5': float(latest['ma5']),
+                'ma25': float(latest['ma25']),
+                'ma75': float(latest['ma75']),
+                'ma200': float(latest['ma200']),
+                'condition1': condition1_result if check_condition1 else None,
+                'condition2': condition2_result if check_condition2 else None,
+                'latest_candle': {
+                    'open': float(latest['open']),
+                    'high': float(latest['high']),
+                    'low': float(latest['low']),
+                    'close': float(latest['close']),
+                    'is_positive': latest['close'] > latest['open']
+                },
+                'prev_candle': {
+                    'open': float(prev['open']),
+                    'high': float(prev['high']),
+                    'low': float(prev['low']),
+                    'close': float(prev['close']),
+                    'is_positive': prev['close'] > prev['open']
+                },
+                'macd': {
+                    'value': float(latest['macd']) if pd.notna(latest.get('macd')) else None,
+                    'signal': float(latest['macd_signal']) if pd.notna(latest.get('macd_signal')) else None,
+                    'hist': float(latest['macd_hist']) if pd.notna(latest.get('macd_hist')) else None,
+                    'last_bullish_cross_date': macd_signals[-1]['date'] if macd_signals else None
+                },
+                'stochastic': {
+                    'stoch_k': float(latest['stoch_k']) if pd.notna(latest.get('stoch_k')) else None,
+                    'stoch_d': float(latest['stoch_d']) if pd.notna(latest.get('stoch_d')) else None,
+                    'last_bullish_cross_date': kd_signals[-1]['date'] if kd_signals else None
                 }
-                
-                # ゴールデンクロス情報を追加
-                if check_golden_cross_5_25 and golden_cross_5_25_result:
-                    result['golden_cross_5_25'] = golden_cross_5_25_result
-                
-                if check_golden_cross_25_75 and golden_cross_25_75_result:
-                    result['golden_cross_25_75'] = golden_cross_25_75_result
-                
-                if check_golden_cross_5_200 and golden_cross_5_200_result:
-                    result['golden_cross_5_200'] = golden_cross_5_200_result
+            }
+            
+            # ゴールデンクロス情報を追加
+            if check_golden_cross_5_25 and golden_cross_5_25_result:
+                result['golden_cross_5_25'] = golden_cross_5_25_result
+            
+            if check_golden_cross_25_75 and golden_cross_25_75_result:
+                result['golden_cross_25_75'] = golden_cross_25_75_result
+            
+            if check_golden_cross_5_200 and golden_cross_5_200_result:
+                result['golden_cross_5_200'] = golden_cross_5_200_result
 
-                # MACD/KD近接情報を追加
-                if macd_kd_proximity_result is not None:
-                    result['macd_kd_proximity'] = macd_kd_proximity_result
-                
-                return result
+            # MACD/KD近接情報を追加
+            if macd_kd_proximity_result is not None:
+                result['macd_kd_proximity'] = macd_kd_proximity_result
             
-            return None
+            return result
         
         except Exception as e:
             print(f"[{symbol}] スクリーニングエラー: {e}")
@@ -887,7 +898,8 @@ class JPX400Screener:
         use_macd_kd_filter: Optional[bool] = None,
         macd_kd_window: Optional[int] = None,
         use_parallel: Optional[bool] = None,
-        max_workers: Optional[int] = None
+        max_workers: Optional[int] = None,
+        use_processes: Optional[bool] = None
     ) -> List[Dict]:
         """
         JPX400銘柄を全てスクリーニング
@@ -911,6 +923,7 @@ class JPX400Screener:
             macd_kd_window: 近接判定の営業日幅（Noneなら設定ファイルの値）
             use_parallel: 並列処理を使用するか（Noneなら設定ファイルの値）
             max_workers: 並列処理の最大スレッド数（NoneならCPUコア数）
+            use_processes: スレッドではなくプロセスで並列処理するか（Noneなら設定ファイルの値）
             
         Returns:
             List[Dict]: 条件を満たす銘柄のリスト
@@ -927,6 +940,7 @@ class JPX400Screener:
         performance_cfg = screening_cfg.get("performance", {})
         use_parallel_setting = performance_cfg.get("use_parallel", True) if use_parallel is None else use_parallel
         max_workers_setting = performance_cfg.get("max_workers") if max_workers is None else max_workers
+        use_processes_setting = performance_cfg.get("executor", "thread") == "process" if use_processes is None else use_processes
         
         if max_workers_setting is None:
             max_workers_setting = min(os.cpu_count() or 4, len(symbols))
@@ -936,7 +950,8 @@ class JPX400Screener:
         print(f"{'='*80}")
         print(f"対象銘柄数: {len(symbols)}")
         print(f"当日データ補完: {'有効' if complement_today else '無効'}")
-        print(f"並列処理: {'有効' if use_parallel_setting else '無効'}" + (f" ({max_workers_setting}スレッド)" if use_parallel_setting else ""))
+        worker_unit = "プロセス" if use_processes_setting else "スレッド"
+        print(f"並列処理: {'有効' if use_parallel_setting else '無効'}" + (f" ({max_workers_setting}{worker_unit})" if use_parallel_setting else ""))
         print(f"{'='*80}\n")
         
         # 並列処理を使用する場合
@@ -957,7 +972,8 @@ class JPX400Screener:
                 golden_cross_mode=golden_cross_mode,
                 use_macd_kd_filter=use_macd_kd_filter,
                 macd_kd_window=macd_kd_window,
-                max_workers=max_workers_setting
+                max_workers=max_workers_setting,
+                use_processes=use_processes_setting
             )
         
         # 逐次処理（既存の実装）
@@ -992,10 +1008,11 @@ class JPX400Screener:
                 df_daily = self.data_collector.complement_today_data(symbol, df_daily)
                 yahoo_access_count += 1
             
-            # スクリーニング実行
+            # スクリーニング実行（取得・補完済みの日足データを渡す）
             result = self.screen_symbol(
                 symbol, 
                 complement_today=False,  # 既に補完済みなのでFalse
+                df_daily=df_daily,
                 check_condition1=check_condition1,
                 check_condition2=check_condition2,
                 check_condition3=check_condition3,
@@ -1030,6 +1047,93 @@ class JPX400Screener:
         
         return results
     
+    def _load_daily_data(self, symbol: str, complement_today: bool) -> tuple:
+        """
+        1銘柄の日足データをDBから取得し、必要に応じて当日データを補完（SQLite・Yahoo FinanceへのI/Oのみ）
+        
+        Returns:
+            tuple: (日足データ, Yahoo Financeから補完したか)
+        """
+        df_daily = self.ohlcv_manager.get_ohlcv_data_with_temporary_flag(
+            symbol=symbol,
+            timeframe='1d',
+            source='yahoo',
+            include_temporary=True
+        )
+        
+        # 当日データの確認
+        need_complement = False
+        if df_daily.empty or len(df_daily) < 200:
+            need_complement = True
+        else:
+            today = date.today()
+            latest_date = df_daily.index[-1].date()
+            if latest_date < today:
+                need_complement = True
+            elif latest_date == today:
+                latest_row = df_daily.iloc[-1]
+                if latest_row.get('is_temporary_close', 0) == 1:
+                    need_complement = True
+        
+        if need_complement and complement_today:
+            # Yahoo Financeから補完
+            return self.data_collector.complement_today_data(symbol, df_daily), True
+        return df_daily, False
+    
+    def _screen_one(self, symbol: str, complement_today: bool, screen_kwargs: Dict) -> tuple:
+        """
+        1銘柄を当日データの補完込みでスクリーニング（プロセス並列用）
+        
+        Returns:
+            tuple: (銘柄コード, スクリーニング結果, エラーメッセージ, Yahoo Financeから補完したか)
+        """
+        try:
+            df_daily, complemented = self._load_daily_data(symbol, complement_today)
+            # スクリーニング実行（既に補完済みなのでcomplement_today=False）
+            result = self.screen_symbol(symbol, complement_today=False, df_daily=df_daily, **screen_kwargs)
+            return (symbol, result, None, complemented)
+        except Exception as e:
+            return (symbol, None, str(e), False)
+    
+    def _screen_prefetched(
+        self,
+        io_pool: ThreadPoolExecutor,
+        symbols: List[str],
+        complement_today: bool,
+        screen_kwargs: Dict,
+        prefetch: int
+    ):
+        """
+        日足データの取得・補完をスレッドプールで先読みしながら、スクリーニングの計算は呼び出し元のスレッドで実行
+        
+        SQLiteの読み込みとYahoo Financeへのアクセスは待ち時間の間GILを解放するためスレッドで重ねられるが、
+        pandasの計算は複数スレッドで実行してもGILの取り合いになるだけなので1スレッドにまとめる。
+        先読みはprefetch銘柄までに抑える（取得済みの日足データを溜め込まない）。
+        
+        Yields:
+            tuple: (銘柄コード, スクリーニング結果, エラーメッセージ, Yahoo Financeから補完したか)
+        """
+        symbol_iter = iter(symbols)
+        pending = deque()
+        
+        def submit_next():
+            symbol = next(symbol_iter, None)
+            if symbol is not None:
+                pending.append((symbol, io_pool.submit(self._load_daily_data, symbol, complement_today)))
+        
+        for _ in range(prefetch):
+            submit_next()
+        
+        while pending:
+            symbol, future = pending.popleft()
+            submit_next()
+            try:
+                df_daily, complemented = future.result()
+                result = self.screen_symbol(symbol, complement_today=False, df_daily=df_daily, **screen_kwargs)
+                yield (symbol, result, None, complemented)
+            except Exception as e:
+                yield (symbol, None, str(e), False)
+    
     def _screen_all_parallel(
         self,
         symbols: List[str],
@@ -1047,7 +1151,8 @@ class JPX400Screener:
         golden_cross_mode: str = 'just_crossed',
         use_macd_kd_filter: Optional[bool] = None,
         macd_kd_window: Optional[int] = None,
-        max_workers: int = 4
+        max_workers: int = 4,
+        use_processes: bool = False
     ) -> List[Dict]:
         """
         並列処理でJPX400銘柄をスクリーニング
@@ -1061,7 +1166,9 @@ class JPX400Screener:
             golden_cross_mode: ゴールデンクロス判定モード
             use_macd_kd_filter: MACD/KD近接フィルタを有効にするか
             macd_kd_window: 近接判定の営業日幅
-            max_workers: 最大スレッド数
+            max_workers: データ取得の最大スレッド数（プロセス並列の場合は最大プロセス数）
+            use_processes: スレッドではなくプロセスで並列処理するか
+                移動平均線やMACD/KDの計算はGILに律速されるため、プロセスに分けるとCPUコア数分並列化できる
             
         Returns:
             List[Dict]: 条件を満たす銘柄のリスト
@@ -1070,73 +1177,47 @@ class JPX400Screener:
         yahoo_access_count = 0
         completed_count = 0
         total = len(symbols)
-        
-        def process_symbol(symbol: str) -> tuple:
-            """1銘柄を処理する関数（並列実行用）"""
-            nonlocal yahoo_access_count
-            
-            try:
-                # DBからデータを取得
-                df_daily = self.ohlcv_manager.get_ohlcv_data_with_temporary_flag(
-                    symbol=symbol,
-                    timeframe='1d',
-                    source='yahoo',
-                    include_temporary=True
-                )
-                
-                # 当日データの確認
-                need_complement = False
-                if df_daily.empty or len(df_daily) < 200:
-                    need_complement = True
-                else:
-                    today = date.today()
-                    latest_date = df_daily.index[-1].date()
-                    if latest_date < today:
-                        need_complement = True
-                    elif latest_date == today:
-                        latest_row = df_daily.iloc[-1]
-                        if latest_row.get('is_temporary_close', 0) == 1:
-                            need_complement = True
-                
-                if need_complement and complement_today:
-                    # Yahoo Financeから補完
-                    df_daily = self.data_collector.complement_today_data(symbol, df_daily)
-                    yahoo_access_count += 1
-                
-                # スクリーニング実行
-                result = self.screen_symbol(
-                    symbol, 
-                    complement_today=False,  # 既に補完済みなのでFalse
-                    check_condition1=check_condition1,
-                    check_condition2=check_condition2,
-                    check_condition3=check_condition3,
-                    check_condition4=check_condition4,
-                    check_condition5=check_condition5,
-                    check_condition6=check_condition6,
-                    check_golden_cross_5_25=check_golden_cross_5_25,
-                    check_golden_cross_25_75=check_golden_cross_25_75,
-                    check_golden_cross_5_200=check_golden_cross_5_200,
-                    golden_cross_mode=golden_cross_mode,
-                    use_macd_kd_filter=use_macd_kd_filter,
-                    macd_kd_window=macd_kd_window
-                )
-                
-                return (symbol, result, None)
-            except Exception as e:
-                return (symbol, None, str(e))
+        screen_kwargs = {
+            'check_condition1': check_condition1,
+            'check_condition2': check_condition2,
+            'check_condition3': check_condition3,
+            'check_condition4': check_condition4,
+            'check_condition5': check_condition5,
+            'check_condition6': check_condition6,
+            'check_golden_cross_5_25': check_golden_cross_5_25,
+            'check_golden_cross_25_75': check_golden_cross_25_75,
+            'check_golden_cross_5_200': check_golden_cross_5_200,
+            'golden_cross_mode': golden_cross_mode,
+            'use_macd_kd_filter': use_macd_kd_filter,
+            'macd_kd_window': macd_kd_window
+        }
         
         # 並列処理実行
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 各銘柄のスクリーニングを並列実行
-            future_to_symbol = {
-                executor.submit(process_symbol, symbol): symbol
-                for symbol in symbols
-            }
-            
-            # 完了したタスクから順に処理
-            for future in as_completed(future_to_symbol):
-                symbol, result, error = future.result()
+        if use_processes:
+            # ワーカープロセスごとにスクリーナー（DB接続を含む）を作成し、銘柄は16件ずつまとめて渡す
+            # 設定はこのインスタンスのものを引き継ぐ。GUIのスレッドから呼ばれるため、
+            # スレッドやSQLite接続を抱えたプロセスをforkしないようspawnで起動する
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_screener,
+                initargs=(self.db_path, self.config)
+            )
+            outcomes = executor.map(
+                _screen_symbol_in_process,
+                [(symbol, complement_today, screen_kwargs) for symbol in symbols],
+                chunksize=16
+            )
+        else:
+            # データ取得はスレッドプールで先読みし、スクリーニングの計算はこのスレッドで実行
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            outcomes = self._screen_prefetched(executor, symbols, complement_today, screen_kwargs, max_workers * 2)
+        
+        with executor:
+            for symbol, result, error, complemented in outcomes:
                 completed_count += 1
+                if complemented:
+                    yahoo_access_count += 1
                 
                 if error:
                     print(f"[{completed_count}/{total}] {symbol}: ✗ エラー - {error}")
@@ -1221,6 +1302,23 @@ class JPX400Screener:
             print()
 
 
+# プロセス並列時に各ワーカープロセスで使い回すスクリーナー
+_process_screener: Optional[JPX400Screener] = None
+
+
+def _init_process_screener(db_path: str, config: Dict):
+    """ワーカープロセスの初期化（SQLite接続はプロセス間で共有できないため、プロセスごとに作成し、設定は親プロセスのものを使う）"""
+    global _process_screener
+    _process_screener = JPX400Screener(db_path)
+    _process_screener.config = config
+
+
+def _screen_symbol_in_process(args: tuple) -> tuple:
+    """1銘柄をスクリーニング（プロセス並列用。pickleできるようモジュールレベルに定義）"""
+    symbol, complement_today, screen_kwargs = args
+    return _process_screener._screen_one(symbol, complement_today, screen_kwargs)
+
+
 if __name__ == '__main__':
     # テスト実行
     screener = JPX400Screener()
@@ -213,7 +213,8 @@ class SectorFlowAnalyzer:
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        days: Optional[int] = None
+        days: Optional[int] = None,
+        flow_df: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         セクターごとの売買代金シェア（全体に占める割合）を計算
@@ -222,11 +223,13 @@ class SectorFlowAnalyzer:
             start_date: 開始日
             end_date: 終了日
             days: 過去何日分を取得するか
+            flow_df: 計算済みの売買代金データ（指定時は売買代金を再計算しない）
         
         Returns:
             pd.DataFrame: 日付をインデックス、セクターを列とするシェアデータ（%）
         """
-        flow_df = self.calculate_sector_flow(start_date, end_date, days)
+        if flow_df is None:
+            flow_df = self.calculate_sector_flow(start_date, end_date, days)
         
         if flow_df.empty:
             return pd.DataFrame()
@@ -372,7 +375,9 @@ class SectorFlowAnalyzer:
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        days: Optional[int] = None
+        days: Optional[int] = None,
+        flow_df: Optional[pd.DataFrame] = None,
+        sector_counts_df: Optional[pd.DataFrame] = None
     ) -> pd.DataFrame:
         """
         セクターごとの1銘柄あたりの売買代金を計算
@@ -381,6 +386,8 @@ class SectorFlowAnalyzer:
             start_date: 開始日（Noneの場合はdaysから計算）
             end_date: 終了日（Noneの場合は今日）
             days: 過去何日分を取得するか（start_dateがNoneの場合に使用）
+            flow_df: 計算済みの売買代金データ（指定時は売買代金を再計算しない）
+            sector_counts_df: 取得済みのセクター別銘柄数（get_sector_stock_countsの結果、指定時はDBにアクセスしない）
         
         Returns:
             pd.DataFrame: 日付をインデックス、セクターを列とする1銘柄あたり売買代金データ
@@ -388,13 +395,15 @@ class SectorFlowAnalyzer:
                 値: 1銘柄あたりの売買代金（億円単位）
         """
         # セクターごとの売買代金を取得
-        flow_df = self.calculate_sector_flow(start_date, end_date, days)
+        if flow_df is None:
+            flow_df = self.calculate_sector_flow(start_date, end_date, days)
         
         if flow_df.empty:
             return pd.DataFrame()
         
         # セクターごとの銘柄数を取得
-        sector_counts_df = self.get_sector_stock_counts()
+        if sector_counts_df is None:
+            sector_counts_df = self.get_sector_stock_counts()
         
         if sector_counts_df.empty:
             print("[SectorFlowAnalyzer] セクター別銘柄数が取得できませんでした")
@@ -590,6 +599,85 @@ class SectorFlowAnalyzer:
         
         return result_df
     
+    def get_sector_and_industry_financial_metrics(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        セクターごと・セクター・業種ごとの平均財務指標をまとめて取得
+        
+        銘柄リスト、セクター・業種情報、財務指標、NC比率の取得を1回で済ませ、
+        get_sector_financial_metrics()とget_sector_industry_financial_metrics()と同じ列で返します
+        （該当する値がない指標はNaN）。
+        
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: (セクター別平均財務指標, セクター・業種別平均財務指標)
+        """
+        # JPX400銘柄リストを取得
+        symbols = self.jpx400_manager.load_symbols()
+        if not symbols:
+            print("[SectorFlowAnalyzer] JPX400銘柄リストが空です")
+            return pd.DataFrame(), pd.DataFrame()
+        
+        # セクター情報と業種情報を一括取得
+        sectors_dict = self.ohlcv_manager.get_symbol_sectors(symbols)
+        industries_dict = self.ohlcv_manager.get_symbol_industries(symbols)
+        
+        # 財務指標を一括取得
+        financial_metrics_dict = self.financial_metrics_manager.get_financial_metrics_batch(symbols)
+        
+        # NC比率を一括取得
+        net_cash_ratio_dict = self.net_cash_ratio_manager.get_net_cash_ratio_batch(symbols)
+        
+        # 銘柄ごとの指標を1つのDataFrameにまとめる
+        records = []
+        for symbol in symbols:
+            sector = sectors_dict.get(symbol)
+            if not sector:
+                continue
+            
+            metrics = financial_metrics_dict.get(symbol, {})
+            if not metrics:
+                continue
+            
+            records.append({
+                'sector': sector,
+                'industry': industries_dict.get(symbol) or None,
+                'per': metrics.get('per'),
+                'pbr': metrics.get('pbr'),
+                'dividend_yield': metrics.get('dividend_yield'),
+                'roa': metrics.get('roa'),
+                'roe': metrics.get('roe'),
+                'net_cash_ratio': net_cash_ratio_dict.get(symbol)
+            })
+        
+        if not records:
+            print("[SectorFlowAnalyzer] 財務指標データが見つかりませんでした")
+            return pd.DataFrame(), pd.DataFrame()
+        
+        metric_columns = ['per', 'pbr', 'dividend_yield', 'roa', 'roe', 'net_cash_ratio']
+        avg_columns = {col: f'avg_{col}' for col in metric_columns}
+        
+        symbol_df = pd.DataFrame(records)
+        symbol_df[metric_columns] = symbol_df[metric_columns].astype(float)
+        
+        # 平均値を計算（NULL値は除外）
+        sector_df = (
+            symbol_df.groupby('sector', sort=False)[metric_columns]
+            .mean()
+            .rename(columns=avg_columns)
+            .reset_index()
+        )
+        sector_industry_df = (
+            symbol_df.dropna(subset=['industry'])
+            .groupby(['sector', 'industry'], sort=False)[metric_columns]
+            .mean()
+            .rename(columns=avg_columns)
+            .reset_index()
+        )
+        
+        print(f"[SectorFlowAnalyzer] セクター別平均財務指標: {len(sector_df)}セクター")
+        print(f"[SectorFlowAnalyzer] セクター・業種別平均財務指標: {len(sector_industry_df)}件")
+        
+        return sector_df, sector_industry_df
+    
     def get_industry_symbols(self, sector: str, industry: str) -> List[str]:
         """
         指定されたセクター・業種に属する銘柄コードのリストを取得
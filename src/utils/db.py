@@ -0,0 +1,27 @@
+"""
+SQLiteのクエリ用ユーティリティ
+"""
+from typing import Iterable, Iterator, List
+
+# IN句に一度に渡す銘柄数
+SYMBOL_CHUNK_SIZE = 500
+
+
+def iter_symbol_chunks(symbols: Iterable[str], size: int = SYMBOL_CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    銘柄コードを重複を除いて並べ替え、size件ずつのリストに分けて返す
+    
+    SQLiteのバインド変数の上限（古いビルドでは999）を超えないよう、IN句の銘柄を分割して問い合わせるために使います。
+    並べ替えておくと、主キー（symbol）のインデックスを順に辿れます。
+    銘柄ごとに集計・抽出するクエリであれば、分割しても結果は変わりません。
+    
+    Args:
+        symbols: 銘柄コード
+        size: 1回のクエリに渡す銘柄数
+    
+    Yields:
+        List[str]: 銘柄コードのリスト（最大size件）
+    """
+    unique_symbols = sorted(set(symbols))
+    for start in range(0, len(unique_symbols), size):
+        yield unique_symbols[start:start + size]
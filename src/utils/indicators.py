@@ -0,0 +1,71 @@
+"""
+テクニカル指標の一括計算ユーティリティ
+
+銘柄ごとの直近データ（古い順の配列）から、最新日の出来高σ値・RSIを全銘柄まとめて計算します。
+スクリーニング結果とセクター別銘柄一覧で同じ計算式を使うため、ここにまとめています。
+"""
+from typing import List, Optional
+
+import numpy as np
+
+
+def latest_volume_sigmas(
+    volume_windows: List[np.ndarray],
+    latest_volumes: Optional[List[Optional[float]]] = None,
+    min_count: int = 5
+) -> np.ndarray:
+    """
+    銘柄ごとの直近出来高（古い順）から、最新出来高のσ値を一括計算
+    
+    出来高を (銘柄数, 日数) の右詰め・NaN埋め配列にまとめ、平均と標準偏差（不偏）を行単位で計算します。
+    
+    Args:
+        volume_windows: 銘柄ごとの直近出来高（古い順、データがない銘柄は空配列）
+        latest_volumes: volume_windowsと同じ順の最新出来高（Noneの場合は直近出来高の最後の値）
+        min_count: 計算に必要な最小件数
+    
+    Returns:
+        np.ndarray: volume_windowsと同じ順のσ値
+            件数がmin_count未満、標準偏差が0、最新出来高がない銘柄はNaN
+    """
+    width = max((len(volumes) for volumes in volume_windows), default=0)
+    if width == 0:
+        return np.full(len(volume_windows), np.nan)
+    
+    V = np.full((len(volume_windows), width), np.nan)
+    for i, volumes in enumerate(volume_windows):
+        if len(volumes):
+            V[i, width - len(volumes):] = volumes
+    
+    if latest_volumes is None:
+        latest = V[:, -1]
+    else:
+        latest = np.array([np.nan if v is None else v for v in latest_volumes], dtype=np.float64)
+    
+    counts = np.count_nonzero(~np.isnan(V), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(V, axis=1) / counts
+        std = np.sqrt(np.nansum((V - mean[:, None]) ** 2, axis=1) / (counts - 1))
+        sigma = (latest - mean) / std
+    return np.where((counts >= min_count) & (std > 0), sigma, np.nan)
+
+
+def latest_rsis(close_windows: List[np.ndarray], period: int = 14) -> np.ndarray:
+    """
+    銘柄ごとの直近終値（古い順）から、最新日のRSI（期間内の値幅の単純平均による）を一括計算
+    
+    直近period+1日分の終値を (銘柄数, period+1) の配列にまとめ、前日比の上昇幅・下落幅の平均から計算します。
+    件数がperiod+1未満、または下落幅の平均が0の銘柄はNaNを返します。
+    """
+    rsis = np.full(len(close_windows), np.nan)
+    positions = [i for i, closes in enumerate(close_windows) if len(closes) >= period + 1]
+    if not positions:
+        return rsis
+    
+    C = np.stack([close_windows[i][-(period + 1):] for i in positions])
+    delta = np.diff(C, axis=1)
+    avg_gain = np.clip(delta, 0, None).mean(axis=1)
+    avg_loss = np.clip(-delta, 0, None).mean(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rsis[positions] = np.where(avg_loss > 0, 100 - 100 / (1 + avg_gain / avg_loss), np.nan)
+    return rsis